@@ -0,0 +1,180 @@
+"""
+크기 제한 LRU 캐시 (선택적 TTL, 적중/미스 카운터)
+- 프로세스 로컬 캐시를 기본으로 사용
+- REDIS_URL이 설정되면 Redis 계층을 함께 사용해 여러 레플리카가 캐시를 공유
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+from loguru import logger
+
+from .config import settings
+
+_MISSING = object()
+_HSPACE_RE = re.compile(r"[^\S\n]+")
+_NEWLINES_RE = re.compile(r"\n+")
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키 계산용 텍스트 정규화 (유니코드 NFC, 줄 안의 공백 정리)
+
+    줄바꿈은 문장 경계로 쓰여 긴 글의 분할 결과가 달라지므로 키에 남김
+    """
+    text = unicodedata.normalize("NFC", text or "").replace("\r\n", "\n").replace("\r", "\n")
+    lines = (_HSPACE_RE.sub(" ", line).strip() for line in text.split("\n"))
+    return _NEWLINES_RE.sub("\n", "\n".join(lines)).strip()
+
+
+def text_fingerprint(text: str) -> str:
+    """정규화된 텍스트의 SHA-256 해시"""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+class RedisTier:
+    """여러 레플리카가 공유하는 Redis 캐시 계층 (값은 JSON으로 저장)"""
+
+    def __init__(self, url: str, prefix: str, ttl: Optional[float] = None):
+        import redis
+
+        self.client = redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+        self.prefix = prefix
+        self.ttl = int(ttl) if ttl else None
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def get(self, key: str) -> Any:
+        try:
+            raw = self.client.get(self._key(key))
+        except Exception as e:
+            logger.warning(f"Redis 캐시 조회 실패: {e}")
+            return _MISSING
+        if raw is None:
+            return _MISSING
+        return json.loads(raw)
+
+    def set(self, key: str, value: Any):
+        try:
+            self.client.set(self._key(key), json.dumps(value, ensure_ascii=False), ex=self.ttl)
+        except Exception as e:
+            logger.warning(f"Redis 캐시 저장 실패: {e}")
+
+    def delete(self, key: str):
+        try:
+            self.client.delete(self._key(key))
+        except Exception as e:
+            logger.warning(f"Redis 캐시 삭제 실패: {e}")
+
+
+def make_redis_tier(prefix: str, ttl: Optional[float] = None) -> Optional[RedisTier]:
+    """REDIS_URL이 설정되어 있으면 Redis 계층 생성"""
+    if not settings.REDIS_URL:
+        return None
+    try:
+        return RedisTier(settings.REDIS_URL, prefix, ttl)
+    except ImportError:
+        logger.warning("redis 패키지가 없어 로컬 캐시만 사용합니다.")
+        return None
+
+
+class TTLCache:
+    """LRU 퇴출과 선택적 TTL을 지원하는 스레드 안전 캐시
+
+    local_tier=False면 Redis 계층이 있을 때 프로세스 로컬 계층을 쓰지 않음
+    (다른 레플리카의 delete가 바로 반영되어야 하는 값용)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        redis_tier: Optional[RedisTier] = None,
+        timer: Callable[[], float] = time.monotonic,
+        local_tier: bool = True,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl if ttl and ttl > 0 else None
+        self.redis_tier = redis_tier
+        self.local_tier = local_tier or redis_tier is None
+        self._timer = timer
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.redis_hits = 0
+        self.evictions = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key) if self.local_tier else None
+            if item is not None:
+                value, expires_at = item
+                if expires_at is None or expires_at > self._timer():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+
+        if self.redis_tier is not None:
+            value = self.redis_tier.get(key)
+            if value is not _MISSING:
+                self._set_local(key, value)
+                with self._lock:
+                    self.hits += 1
+                    self.redis_hits += 1
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return default
+
+    def set(self, key: str, value: Any):
+        self._set_local(key, value)
+        if self.redis_tier is not None:
+            self.redis_tier.set(key, value)
+
+    def _set_local(self, key: str, value: Any):
+        if not self.local_tier:
+            return
+        expires_at = self._timer() + self.ttl if self.ttl else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+        if self.redis_tier is not None:
+            self.redis_tier.delete(key)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "redis_hits": self.redis_hits,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "redis_enabled": self.redis_tier is not None,
+            "local_tier": self.local_tier,
+        }
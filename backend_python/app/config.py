@@ -7,4 +7,77 @@ class Settings:
     ACCESS_TOKEN_EXPIRE_MINUTES: int = config("ACCESS_TOKEN_EXPIRE_MINUTES", default=30, cast=int)
     DEBUG: bool = config("DEBUG", default=True, cast=bool)
 
+    # Logging: sinks write from a background thread; success request logs can be sampled (0.0-1.0)
+    LOG_ENQUEUE: bool = config("LOG_ENQUEUE", default=True, cast=bool)
+    LOG_SUCCESS_SAMPLE_RATE: float = config("LOG_SUCCESS_SAMPLE_RATE", default=1.0, cast=float)
+
+    # Password hashing executor; BCRYPT_ROUNDS applies to new hashes only
+    BCRYPT_ROUNDS: int = config("BCRYPT_ROUNDS", default=12, cast=int)
+    PASSWORD_HASH_WORKERS: int = config("PASSWORD_HASH_WORKERS", default=2, cast=int)
+    PASSWORD_HASH_MAX_PENDING: int = config("PASSWORD_HASH_MAX_PENDING", default=32, cast=int)
+    PASSWORD_VERIFY_MAX_PER_USER: int = config("PASSWORD_VERIFY_MAX_PER_USER", default=2, cast=int)
+
+    # Connection pool (pool size/overflow apply to server databases, not SQLite)
+    DB_POOL_SIZE: int = config("DB_POOL_SIZE", default=5, cast=int)
+    DB_MAX_OVERFLOW: int = config("DB_MAX_OVERFLOW", default=10, cast=int)
+    DB_POOL_TIMEOUT: float = config("DB_POOL_TIMEOUT", default=30, cast=float)
+    DB_POOL_RECYCLE: int = config("DB_POOL_RECYCLE", default=1800, cast=int)
+    DB_POOL_PRE_PING: bool = config("DB_POOL_PRE_PING", default=True, cast=bool)
+
+    # Async engine (asyncpg/aiosqlite); empty ASYNC_DATABASE_URL derives it from DATABASE_URL
+    ASYNC_DATABASE_URL: str = config("ASYNC_DATABASE_URL", default="")
+
+    # Version recorded with stored emotion results and used in result cache keys
+    MODEL_VERSION: str = config("MODEL_VERSION", default="v1.0")
+
+    # run_server.py: SERVER_WORKERS > 1 runs gunicorn; preload loads the model once before forking
+    SERVER_WORKERS: int = config("SERVER_WORKERS", default=1, cast=int)
+    SERVER_PRELOAD_MODEL: bool = config("SERVER_PRELOAD_MODEL", default=True, cast=bool)
+
+    # Model warmup: "eager" (before serving), "background" (after serving starts) or "lazy" (first analysis)
+    MODEL_WARMUP: str = config("MODEL_WARMUP", default="background")
+
+    # Inference backend: "pytorch" (fp32) or "onnx" (int8 quantized ONNX Runtime)
+    INFERENCE_BACKEND: str = config("INFERENCE_BACKEND", default="pytorch")
+    ONNX_MODEL_PATH: str = config("ONNX_MODEL_PATH", default="")
+    ONNX_NUM_THREADS: int = config("ONNX_NUM_THREADS", default=0, cast=int)
+
+    # Dedicated inference executor; requests beyond INFERENCE_MAX_PENDING get 503
+    INFERENCE_WORKERS: int = config("INFERENCE_WORKERS", default=1, cast=int)
+    INFERENCE_MAX_PENDING: int = config("INFERENCE_MAX_PENDING", default=64, cast=int)
+
+    # Long entries: "chunked" analyzes sentence-aligned windows of up to CHUNK_MAX_TOKENS
+    # and aggregates them, "truncate" keeps only the first 512 tokens
+    # Every window is analyzed; CHUNK_WINDOW_BATCH_SIZE bounds how many go through one forward pass
+    LONG_TEXT_MODE: str = config("LONG_TEXT_MODE", default="chunked")
+    CHUNK_MAX_TOKENS: int = config("CHUNK_MAX_TOKENS", default=254, cast=int)
+    CHUNK_WINDOW_BATCH_SIZE: int = config("CHUNK_WINDOW_BATCH_SIZE", default=16, cast=int)
+
+    # Inference micro-batching
+    INFERENCE_BATCHING: bool = config("INFERENCE_BATCHING", default=True, cast=bool)
+    INFERENCE_BATCH_MAX_SIZE: int = config("INFERENCE_BATCH_MAX_SIZE", default=16, cast=int)
+    INFERENCE_BATCH_MAX_WAIT_MS: float = config("INFERENCE_BATCH_MAX_WAIT_MS", default=5.0, cast=float)
+
+    # POST /api/emotions/analyze/batch limits
+    BATCH_ANALYSIS_MAX_ITEMS: int = config("BATCH_ANALYSIS_MAX_ITEMS", default=64, cast=int)
+    BATCH_ANALYSIS_MAX_TEXT_LENGTH: int = config("BATCH_ANALYSIS_MAX_TEXT_LENGTH", default=10000, cast=int)
+
+    # Analysis result cache (REDIS_URL enables a shared tier across replicas)
+    RESULT_CACHE_ENABLED: bool = config("RESULT_CACHE_ENABLED", default=True, cast=bool)
+    RESULT_CACHE_MAXSIZE: int = config("RESULT_CACHE_MAXSIZE", default=2048, cast=int)
+    RESULT_CACHE_TTL_SECONDS: float = config("RESULT_CACHE_TTL_SECONDS", default=3600, cast=float)
+    REDIS_URL: str = config("REDIS_URL", default="")
+
+    # Authenticated user cache (short TTL; with REDIS_URL it lives only in Redis so invalidations reach every replica)
+    PRINCIPAL_CACHE_ENABLED: bool = config("PRINCIPAL_CACHE_ENABLED", default=True, cast=bool)
+    PRINCIPAL_CACHE_MAXSIZE: int = config("PRINCIPAL_CACHE_MAXSIZE", default=1024, cast=int)
+    PRINCIPAL_CACHE_TTL_SECONDS: float = config("PRINCIPAL_CACHE_TTL_SECONDS", default=30, cast=float)
+
+    # Background entry analysis queue ("memory" in-process, "redis" shared via REDIS_URL)
+    ANALYSIS_QUEUE_ENABLED: bool = config("ANALYSIS_QUEUE_ENABLED", default=True, cast=bool)
+    ANALYSIS_QUEUE_BACKEND: str = config("ANALYSIS_QUEUE_BACKEND", default="memory")
+    ANALYSIS_QUEUE_BATCH_SIZE: int = config("ANALYSIS_QUEUE_BATCH_SIZE", default=16, cast=int)
+    ANALYSIS_QUEUE_POLL_TIMEOUT: float = config("ANALYSIS_QUEUE_POLL_TIMEOUT", default=1.0, cast=float)
+    ANALYSIS_QUEUE_VISIBILITY_TIMEOUT: float = config("ANALYSIS_QUEUE_VISIBILITY_TIMEOUT", default=300, cast=float)
+
 settings = Settings()
\ No newline at end of file
@@ -1,21 +1,124 @@
-from sqlalchemy import create_engine
+from typing import Any, Dict, Optional
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 from .config import settings
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {}
-)
+def engine_options(url: str) -> Dict[str, Any]:
+    """Pool settings from Settings; SQLite keeps SQLAlchemy's default pool sizing"""
+    options: Dict[str, Any] = {
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    if make_url(url).get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+    else:
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+        )
+    return options
+
+def async_database_url(url: str) -> str:
+    """Same database through its async driver (asyncpg / aiosqlite)"""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend == "postgresql":
+        url = url.set(drivername="postgresql+asyncpg")
+    elif backend == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+    return url.render_as_string(hide_password=False)
+
+engine = create_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL))
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine is created on first use so the async drivers stay optional
+_async_engine = None
+_async_sessionmaker = None
+
+def get_async_engine():
+    global _async_engine, _async_sessionmaker
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        url = settings.ASYNC_DATABASE_URL or async_database_url(settings.DATABASE_URL)
+        options = engine_options(url)
+        options.pop("connect_args", None)
+        _async_engine = create_async_engine(url, **options)
+        # Loaded attributes stay usable after commit without an implicit (blocking) refresh
+        _async_sessionmaker = async_sessionmaker(_async_engine, autoflush=False, expire_on_commit=False)
+    return _async_engine
+
+def active_async_engine():
+    """The async engine if it has been created, else None (does not create it)"""
+    return _async_engine
+
+async def dispose_async_engine():
+    global _async_engine, _async_sessionmaker
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _async_sessionmaker = None
+
+def pool_status(engine, max_overflow: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """Connection pool utilization for diagnostics
+
+    max_overflow defaults to what engine_options() configures for the engine's URL;
+    without it (SQLite's default pool sizing) utilization is not reported
+    """
+    if engine is None:
+        return None
+    pool = engine.pool
+    status: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        if max_overflow is None:
+            max_overflow = engine_options(engine.url.render_as_string(hide_password=False)).get("max_overflow")
+        checked_out = pool.checkedout()
+        capacity = pool.size() + max(max_overflow, 0) if max_overflow is not None else None
+        status.update(
+            size=pool.size(),
+            max_overflow=max_overflow,
+            timeout=pool.timeout(),
+            checked_in=pool.checkedin(),
+            checked_out=checked_out,
+            overflow=pool.overflow(),
+            utilization=round(checked_out / capacity, 3) if capacity else None,
+        )
+    return status
+
 Base = declarative_base()
 
+def sync_schema(bind):
+    """Create missing tables, then add columns and indexes that existing tables lack.
+
+    create_all() only creates whole tables, so columns and indexes added to a
+    model after its table exists are applied here (nullable columns only).
+    """
+    Base.metadata.create_all(bind=bind)
+    inspector = inspect(bind)
+    with bind.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing and column.nullable:
+                    column_type = column.type.compile(dialect=bind.dialect)
+                    conn.exec_driver_sql(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}')
+            for index in table.indexes:
+                index.create(bind=conn, checkfirst=True)
+
 # Dependency to get DB session
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def get_async_db():
+    get_async_engine()
+    async with _async_sessionmaker() as session:
+        yield session
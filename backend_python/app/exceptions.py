@@ -137,4 +137,20 @@ class ValidationError(CustomHTTPException):
             status_code=400,
             detail=message,
             error_code="VALIDATION_ERROR"
-        )
\ No newline at end of file
+        )
+
+class ServiceUnavailableError(CustomHTTPException):
+    def __init__(self, message: str = "Service temporarily unavailable"):
+        super().__init__(
+            status_code=503,
+            detail=message,
+            error_code="SERVICE_UNAVAILABLE"
+        )
+
+class TooManyRequestsError(CustomHTTPException):
+    def __init__(self, message: str = "Too many requests"):
+        super().__init__(
+            status_code=429,
+            detail=message,
+            error_code="TOO_MANY_REQUESTS"
+        )
@@ -2,15 +2,18 @@ from fastapi import FastAPI, HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from loguru import logger
 import sys
 import os
 
-from .database import SessionLocal, engine
-from .models import Base
+from .database import SessionLocal, active_async_engine, engine, pool_status, sync_schema
+from .rollups import backfill_rollups
+from .search import backfill_index
 from .routers import auth, users, entries, emotions
+from .routers.auth import get_current_user
 from .config import settings
 from .middleware import LoggingMiddleware
 from .exceptions import (
@@ -20,16 +23,14 @@ from .exceptions import (
     general_exception_handler
 )
 
-# Create tables
-Base.metadata.create_all(bind=engine)
-
 # Configure logger
+# enqueue=True: 요청 처리 중에는 큐에 넣기만 하고 기록은 별도 스레드에서 수행
 logger.remove()
-logger.add(sys.stderr, level="INFO")
+logger.add(sys.stderr, level="INFO", enqueue=settings.LOG_ENQUEUE)
 
 # logs 디렉토리가 없으면 생성
 os.makedirs("logs", exist_ok=True)
-logger.add("logs/app.log", rotation="500 MB", level="DEBUG", retention="30 days")
+logger.add("logs/app.log", rotation="500 MB", level="DEBUG", retention="30 days", enqueue=settings.LOG_ENQUEUE)
 
 app = FastAPI(
     title="Emotion Diary API",
@@ -40,7 +41,7 @@ app = FastAPI(
 )
 
 # Custom middleware
-app.add_middleware(LoggingMiddleware)
+app.add_middleware(LoggingMiddleware, success_sample_rate=settings.LOG_SUCCESS_SAMPLE_RATE)
 
 # CORS middleware
 app.add_middleware(
@@ -49,6 +50,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # keyset pagination cursor on list endpoints
 )
 
 # Include routers
@@ -60,6 +62,39 @@ app.include_router(emotions.router, prefix="/api/emotions", tags=["emotions"])
 # Database dependency는 database.py에서 import
 from .database import get_db
 
+@app.on_event("startup")
+def prepare_database():
+    # Create tables (and columns/indexes added since the tables were created)
+    sync_schema(engine)
+    backfill_rollups(engine)
+    backfill_index(engine)
+
+@app.on_event("startup")
+async def start_analysis_queue():
+    if settings.ANALYSIS_QUEUE_ENABLED:
+        from .services.analysis_queue import get_analysis_queue
+        await get_analysis_queue().start()
+
+@app.on_event("startup")
+async def start_model_warmup():
+    from .services.kobert_emotion_service import start_warmup
+    await start_warmup(settings.MODEL_WARMUP)
+
+@app.on_event("shutdown")
+async def stop_analysis_queue():
+    if settings.ANALYSIS_QUEUE_ENABLED:
+        from .services.analysis_queue import get_analysis_queue
+        await get_analysis_queue().stop()
+
+@app.on_event("shutdown")
+async def close_async_engine():
+    from .database import dispose_async_engine
+    await dispose_async_engine()
+
+@app.on_event("shutdown")
+async def flush_logs():
+    await logger.complete()
+
 @app.get("/")
 async def root():
     return {"message": "Emotion Diary API is running!"}
@@ -72,6 +107,38 @@ async def health_check():
         "environment": settings.DEBUG
     }
 
+@app.get("/api/health/ready")
+async def readiness_check():
+    """Readiness: 200 once the model warmup has finished, 503 while warming up"""
+    from .services.kobert_emotion_service import readiness
+    state = readiness()
+    return JSONResponse(status_code=200 if state["ready"] else 503, content=state)
+
+def require_diagnostics_access(current_user=Depends(get_current_user)):
+    """진단 엔드포인트는 내부 상태를 노출하므로 DEBUG 환경에서 인증된 사용자에게만 제공"""
+    if not settings.DEBUG:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return current_user
+
+@app.get("/api/diagnostics/db", dependencies=[Depends(require_diagnostics_access)])
+async def database_diagnostics():
+    """DB 연결 풀 사용량 (동기/비동기 엔진)"""
+    return {
+        "sync": pool_status(engine),
+        "async": pool_status(active_async_engine())
+    }
+
+@app.get("/api/diagnostics/auth", dependencies=[Depends(require_diagnostics_access)])
+async def auth_diagnostics():
+    """비밀번호 실행기 대기열과 사용자 캐시 상태"""
+    from .principals import get_principal_cache
+    from .services.password_hasher import get_password_hasher
+    cache = get_principal_cache()
+    return {
+        "password_hasher": get_password_hasher().stats(),
+        "principal_cache": cache.stats() if cache is not None else None
+    }
+
 @app.get("/api/model/status")
 async def model_status():
     """모델 상태 확인"""
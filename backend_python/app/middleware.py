@@ -1,53 +1,58 @@
-from fastapi import Request, Response
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from loguru import logger
+import random
 import time
 import uuid
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        # 요청 ID 생성
-        request_id = str(uuid.uuid4())[:8]
-        
-        # 요청 로깅
-        start_time = time.time()
-        client_ip = request.client.host
-        method = request.method
-        url = str(request.url)
-        
-        logger.info(f"[{request_id}] {method} {url} - Client: {client_ip}")
-        
-        # 요청 처리
+class LoggingMiddleware:
+    """요청 ID 부여와 처리 시간 로깅 (순수 ASGI 미들웨어)
+
+    BaseHTTPMiddleware와 달리 응답 본문을 감싸지 않아 스트리밍 응답이 그대로 전달됨
+    요청 ID는 request.state.request_id와 X-Request-ID 응답 헤더로 노출
+    성공 응답(4xx/5xx 제외) 로그는 success_sample_rate 비율만 기록
+    """
+
+    def __init__(self, app: ASGIApp, success_sample_rate: float = 1.0):
+        self.app = app
+        self.success_sample_rate = success_sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # 요청 ID 생성 (예외 핸들러가 request.state에서 읽음)
+        request_id = uuid.uuid4().hex[:8]
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        start_time = time.perf_counter()
+        status_code = 500
+        response_started = False
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code, response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+                # 응답 헤더에 요청 ID 추가
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
+
         try:
-            response = await call_next(request)
-            
-            # 응답 로깅
-            process_time = time.time() - start_time
-            status_code = response.status_code
-            
-            logger.info(
-                f"[{request_id}] {method} {url} - "
-                f"Status: {status_code} - "
-                f"Time: {process_time:.4f}s"
-            )
-            
-            # 응답 헤더에 요청 ID 추가
-            response.headers["X-Request-ID"] = request_id
-            
-            return response
-            
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
             # 예외 로깅
-            process_time = time.time() - start_time
             logger.error(
-                f"[{request_id}] {method} {url} - "
-                f"Error: {str(e)} - "
-                f"Time: {process_time:.4f}s"
+                "[{}] {} {} - Error: {} - Time: {:.4f}s",
+                request_id, scope["method"], scope["path"], e, time.perf_counter() - start_time
             )
-            
+            if response_started:
+                raise
+
             # 에러 응답 반환
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=500,
                 content={
                     "error": {
@@ -57,4 +62,15 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                     }
                 },
                 headers={"X-Request-ID": request_id}
-            )
\ No newline at end of file
+            )
+            await response(scope, receive, send)
+            return
+
+        # 응답 로깅 (인자는 로그가 실제로 기록될 때만 포맷됨)
+        if status_code >= 400 or self.success_sample_rate >= 1.0 or random.random() < self.success_sample_rate:
+            client = scope.get("client")
+            logger.info(
+                "[{}] {} {} - Client: {} - Status: {} - Time: {:.4f}s",
+                request_id, scope["method"], scope["path"], client[0] if client else "-",
+                status_code, time.perf_counter() - start_time
+            )
@@ -1,8 +1,14 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Float
-from sqlalchemy.orm import relationship
+from datetime import datetime, timezone
+from sqlalchemy import Column, Integer, String, Date, DateTime, Text, ForeignKey, Float, Index, event, inspect, text
+from sqlalchemy.dialects import postgresql, sqlite  # postgresql registers the to_tsvector() construct
+from sqlalchemy.orm import Session, relationship
 from sqlalchemy.sql import func
 from .database import Base
 
+# SQLite's CURRENT_TIMESTAMP has second precision; binding cursor values the
+# same way keeps keyset comparisons on created_at exact
+CreatedAt = DateTime(timezone=True).with_variant(sqlite.DATETIME(truncate_microseconds=True), "sqlite")
+
 class User(Base):
     __tablename__ = "users"
 
@@ -33,6 +39,11 @@ class Entry(Base):
     user = relationship("User", back_populates="entries")
     emotions = relationship("Emotion", back_populates="entry", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # 사용자별 일기 목록의 키셋 페이지네이션 (date, id)
+        Index("ix_entries_user_date_id", "user_id", "date", "id"),
+    )
+
 class Emotion(Base):
     __tablename__ = "emotions"
 
@@ -42,7 +53,108 @@ class Emotion(Base):
     confidence_score = Column(Float, nullable=False)  # 0.0 to 1.0
     analyzed_text = Column(Text)  # 분석된 텍스트 부분
     model_version = Column(String, default="v1.0")
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    content_hash = Column(String(64))  # 분석 당시 일기 내용의 지문 (재분석 여부 판단)
+    created_at = Column(CreatedAt, server_default=func.now())
 
     # Relationships
-    entry = relationship("Entry", back_populates="emotions")
\ No newline at end of file
+    entry = relationship("Entry", back_populates="emotions")
+
+    __table_args__ = (
+        Index("ix_emotions_entry_content_hash", "entry_id", "content_hash", "model_version"),
+        # 감정 목록의 키셋 페이지네이션 (created_at, id)
+        Index("ix_emotions_entry_created_at", "entry_id", "created_at"),
+    )
+
+class EmotionRollup(Base):
+    """사용자별 구간(일/주/월) 감정 집계 (app/rollups.py에서 유지)"""
+    __tablename__ = "emotion_rollups"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    granularity = Column(String(8), primary_key=True)  # day, week, month
+    bucket_start = Column(Date, primary_key=True)
+    emotion_type = Column(String, primary_key=True)
+    emotion_count = Column(Integer, nullable=False, default=0)
+    confidence_sum = Column(Float, nullable=False, default=0.0)
+
+@event.listens_for(Emotion, "before_insert")
+def _stamp_emotion_created_at(mapper, connection, target):
+    # Set client-side so the newest emotion of an entry is known right after the flush
+    if target.created_at is None:
+        target.created_at = datetime.now(timezone.utc)
+
+# Keep emotion_rollups in step with emotions inside the same transaction: the
+# entries touched by a flush have their counted (latest) emotion compared
+# before and after it
+def _rollup_entry_ids(session) -> set:
+    entry_ids = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Emotion):
+            entry_id = obj.entry_id if obj.entry_id is not None else getattr(obj.entry, "id", None)
+        elif isinstance(obj, Entry):
+            entry_id = obj.id
+        else:
+            continue
+        if entry_id is not None:
+            entry_ids.add(entry_id)
+    return entry_ids
+
+@event.listens_for(Session, "before_flush")
+def _capture_counted_emotions(session, flush_context, instances):
+    from .rollups import counted_emotions
+    entry_ids = _rollup_entry_ids(session)
+    session.info["rollup_before"] = counted_emotions(session.connection(), entry_ids) if entry_ids else {}
+
+@event.listens_for(Session, "after_flush")
+def _update_rollups(session, flush_context):
+    from .rollups import apply_changes
+    before = session.info.pop("rollup_before", {})
+    entry_ids = _rollup_entry_ids(session) | set(before)
+    if entry_ids:
+        apply_changes(session.connection(), before, entry_ids)
+
+class EntrySearchDocument(Base):
+    """일기 전문 검색용 바이그램 문서 (app/search.py에서 유지)"""
+    __tablename__ = "entry_search_documents"
+
+    # SQLite FTS5 외부 콘텐츠 테이블의 rowid로 사용
+    entry_id = Column(Integer, ForeignKey("entries.id"), primary_key=True, autoincrement=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    document = Column(Text, nullable=False)
+
+    __table_args__ = (
+        Index(
+            "ix_entry_search_documents_tsv",
+            func.to_tsvector(text("'simple'::regconfig"), text("document")),
+            postgresql_using="gin"
+        ).ddl_if(dialect="postgresql"),
+    )
+
+@event.listens_for(EntrySearchDocument.__table__, "after_create")
+def _create_sqlite_search_index(target, connection, **kw):
+    if connection.dialect.name == "sqlite":
+        from .search import create_sqlite_index
+        create_sqlite_index(connection)
+
+@event.listens_for(EntrySearchDocument.__table__, "after_drop")
+def _drop_sqlite_search_index(target, connection, **kw):
+    if connection.dialect.name == "sqlite":
+        from .search import drop_sqlite_index
+        drop_sqlite_index(connection)
+
+# Keep entry_search_documents in step with entries inside the same transaction
+@event.listens_for(Entry, "after_insert")
+def _index_new_entry(mapper, connection, target):
+    from .search import index_entry
+    index_entry(connection, target.id, target.user_id, target.title, target.content)
+
+@event.listens_for(Entry, "after_update")
+def _reindex_updated_entry(mapper, connection, target):
+    state = inspect(target)
+    if any(state.attrs[name].history.has_changes() for name in ("title", "content", "user_id")):
+        from .search import index_entry
+        index_entry(connection, target.id, target.user_id, target.title, target.content)
+
+@event.listens_for(Entry, "before_delete")
+def _unindex_deleted_entry(mapper, connection, target):
+    from .search import unindex_entry
+    unindex_entry(connection, target.id)
@@ -0,0 +1,72 @@
+"""
+키셋(커서) 페이지네이션
+- OFFSET 대신 마지막 행의 정렬 키 이후부터 조회해 깊은 페이지도 인덱스 범위 검색 한 번으로 처리
+- 커서는 정렬 키 값을 담은 불투명한 base64 문자열
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence, Tuple
+from sqlalchemy import literal, tuple_
+from sqlalchemy.orm import Query
+
+from .exceptions import ValidationError
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """정렬 키 값을 커서 문자열로 인코딩"""
+    payload = [value.isoformat() if isinstance(value, (date, datetime)) else value for value in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence[Any]) -> List[Any]:
+    """커서를 정렬 컬럼 타입에 맞는 값으로 디코딩"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(columns):
+            raise ValueError("cursor shape mismatch")
+
+        values = []
+        for column, value in zip(columns, payload):
+            python_type = column.type.python_type
+            if python_type is datetime:
+                values.append(datetime.fromisoformat(value))
+            elif python_type is int:
+                values.append(int(value))
+            else:
+                values.append(python_type(value))
+        return values
+    except (ValueError, TypeError, UnicodeDecodeError):
+        raise ValidationError("Invalid pagination cursor")
+
+
+def keyset_page(query: Query, columns: Sequence[Any], limit: int, cursor: Optional[str] = None,
+                descending: bool = True, skip: int = 0) -> Tuple[list, Optional[str]]:
+    """정렬 키 기준으로 한 페이지 조회, (행 목록, 다음 페이지 커서) 반환
+
+    columns는 마지막 컬럼이 유일한 값(보통 id)이어야 페이지 경계가 안정적임
+    skip은 이전 클라이언트 호환용 OFFSET (커서가 없을 때만 적용)
+    """
+    key = tuple_(*columns)
+    if cursor:
+        values = decode_cursor(cursor, columns)
+        # 컬럼 타입으로 바인딩해야 DB에 저장된 값과 같은 형식으로 비교됨
+        bound = tuple_(*(literal(value, column.type) for column, value in zip(columns, values)))
+        query = query.filter(key < bound if descending else key > bound)
+
+    ordering = [column.desc() if descending else column.asc() for column in columns]
+    query = query.order_by(*ordering)
+    if skip and not cursor:
+        query = query.offset(skip)
+    rows = query.limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([getattr(rows[-1], column.key) for column in columns])
+    return rows, next_cursor
@@ -0,0 +1,88 @@
+"""
+인증된 사용자(principal) 캐시
+- get_current_user가 요청마다 사용자를 SELECT하지 않도록 토큰 subject(username)별로
+  사용자 컬럼 스냅샷을 짧은 TTL로 보관
+- 캐시 적중 시 스냅샷으로 만든 객체를 쿼리 없이 세션에 붙여 기존 ORM 객체처럼 사용
+  (관계 속성과 스냅샷에 없는 컬럼은 접근할 때 지연 로딩)
+- 비밀번호 해시는 캐시에 저장하지 않음
+- 사용자 수정/삭제 시 invalidate_principal로 즉시 무효화
+  REDIS_URL이 있으면 로컬 계층 없이 Redis에만 보관하므로 무효화가 모든 레플리카에 바로 반영됨
+  (없으면 프로세스 로컬 캐시만 사용: 단일 레플리카용)
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+from loguru import logger
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from .cache import TTLCache, make_redis_tier
+from .config import settings
+from .models import User
+
+_EXCLUDED_COLUMNS = {"hashed_password"}
+
+_principal_cache = None
+
+
+def get_principal_cache() -> Optional[TTLCache]:
+    """사용자 캐시 싱글톤 인스턴스 반환 (비활성화 시 None)"""
+    global _principal_cache
+    if _principal_cache is None and settings.PRINCIPAL_CACHE_ENABLED:
+        ttl = settings.PRINCIPAL_CACHE_TTL_SECONDS
+        _principal_cache = TTLCache(
+            maxsize=settings.PRINCIPAL_CACHE_MAXSIZE,
+            ttl=ttl,
+            redis_tier=make_redis_tier("principal", ttl),
+            # 다른 레플리카에서 무효화한 사용자를 로컬 사본으로 계속 인증하지 않도록
+            local_tier=False
+        )
+        logger.info(f"사용자 캐시 초기화 완료 (maxsize={settings.PRINCIPAL_CACHE_MAXSIZE}, ttl={ttl})")
+    return _principal_cache
+
+
+def _snapshot(user: User) -> Dict[str, Any]:
+    """캐시에 저장할 컬럼 값 (JSON 직렬화 가능한 형태)"""
+    snapshot = {}
+    for column in User.__table__.columns:
+        if column.key in _EXCLUDED_COLUMNS:
+            continue
+        value = getattr(user, column.key)
+        snapshot[column.key] = value.isoformat() if isinstance(value, datetime) else value
+    return snapshot
+
+
+def _restore(db: Session, snapshot: Dict[str, Any]) -> User:
+    """스냅샷으로 User 객체를 만들어 SELECT 없이 세션에 연결"""
+    values = {}
+    for column in User.__table__.columns:
+        if column.key not in snapshot:
+            continue
+        value = snapshot[column.key]
+        if value is not None and column.type.python_type is datetime:
+            value = datetime.fromisoformat(value)
+        values[column.key] = value
+
+    user = User(**values)
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+
+def load_principal(db: Session, username: str) -> Optional[User]:
+    """username으로 사용자 조회 (캐시 우선, 없는 사용자는 캐시하지 않음)"""
+    cache = get_principal_cache()
+    if cache is not None:
+        snapshot = cache.get(username)
+        if snapshot is not None:
+            return _restore(db, snapshot)
+
+    user = db.query(User).filter(User.username == username).first()
+    if user is not None and cache is not None:
+        cache.set(username, _snapshot(user))
+    return user
+
+
+def invalidate_principal(username: str):
+    """사용자 정보 변경/삭제 후 캐시 무효화 (커밋 이후 호출)"""
+    cache = get_principal_cache()
+    if cache is not None:
+        cache.delete(username)
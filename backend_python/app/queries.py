@@ -0,0 +1,60 @@
+"""
+일기/사용자 조회 쿼리
+- 응답 직렬화 중 관계 속성이 지연 로딩되어 쿼리가 N번 실행되지 않도록
+  필요한 관계를 selectinload로 명시적으로 함께 조회
+"""
+
+from typing import List, Optional, Tuple
+from sqlalchemy.orm import Query, Session, selectinload
+
+from .models import Emotion, Entry, User
+from .pagination import keyset_page
+
+
+def get_user_entry(db: Session, entry_id: int, user_id: int, with_emotions: bool = False) -> Optional[Entry]:
+    """사용자 본인의 일기 조회 (with_emotions면 감정 분석 결과도 함께)"""
+    query = db.query(Entry).filter(Entry.id == entry_id, Entry.user_id == user_id)
+    if with_emotions:
+        # 이미 세션에 있는 객체도 최신 감정 목록으로 갱신
+        query = query.options(selectinload(Entry.emotions)).populate_existing()
+    return query.first()
+
+
+def list_user_entries(db: Session, user_id: int, limit: int = 100, cursor: Optional[str] = None,
+                      skip: int = 0, with_emotions: bool = False) -> Tuple[List[Entry], Optional[str]]:
+    """사용자 일기 목록 최신순 (date, id), (일기 목록, 다음 페이지 커서) 반환
+
+    with_emotions면 페이지 전체의 감정을 쿼리 한 번으로 조회
+    """
+    query = db.query(Entry).filter(Entry.user_id == user_id)
+    if with_emotions:
+        query = query.options(selectinload(Entry.emotions))
+    return keyset_page(query, [Entry.date, Entry.id], limit, cursor, skip=skip)
+
+
+def get_user_with_entries(db: Session, user_id: int) -> Optional[User]:
+    """사용자와 일기 목록 조회"""
+    return (
+        db.query(User)
+        .options(selectinload(User.entries))
+        .filter(User.id == user_id)
+        .first()
+    )
+
+
+def owned_emotions(db: Session, user_id: int) -> Query:
+    """사용자 일기에 속한 감정 분석 결과 쿼리
+
+    emotions.entry_id -> entries.id 조인 한 번과 entries.user_id 필터로 소유권 확인
+    (relationship.has()의 상관 EXISTS 서브쿼리를 만들지 않음)
+    """
+    return (
+        db.query(Emotion)
+        .join(Entry, Emotion.entry_id == Entry.id)
+        .filter(Entry.user_id == user_id)
+    )
+
+
+def get_owned_emotion(db: Session, emotion_id: int, user_id: int) -> Optional[Emotion]:
+    """사용자 본인의 감정 분석 결과 조회"""
+    return owned_emotions(db, user_id).filter(Emotion.id == emotion_id).first()
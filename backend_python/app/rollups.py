@@ -0,0 +1,213 @@
+"""
+사용자별 감정 통계 롤업 (emotion_rollups)
+- (사용자, 집계 단위, 구간 시작일, 감정) 마다 건수와 신뢰도 합계를 유지
+- 일기마다 최신 감정 분석 결과 하나만 집계 (재분석하면 이전 결과를 빼고 새 결과를 더함)
+- 구간은 일기 날짜(Entry.date)의 UTC 날짜 기준
+- flush마다 바뀐 일기의 집계 대상 감정을 flush 전후로 비교해 같은 트랜잭션에서 증감
+  (models.py의 세션 이벤트: 감정 추가/삭제, 일기 날짜 수정, 일기 삭제)
+- ORM을 거치지 않는 대량 insert/delete 후에는 rebuild_rollups로 다시 계산
+- 통계 조회는 전체 감정 행 대신 구간 수만큼의 롤업 행만 읽음
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set
+from sqlalchemy import delete, distinct, func, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+GRANULARITIES = ("day", "week", "month")
+
+
+def bucket_start(value: Any, granularity: str) -> date:
+    """시각/날짜가 속한 구간의 시작일 (주는 월요일 시작)"""
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        value = value.date()
+
+    if granularity == "day":
+        return value
+    if granularity == "week":
+        return value - timedelta(days=value.weekday())
+    if granularity == "month":
+        return value.replace(day=1)
+    raise ValueError(f"Unknown granularity: {granularity}")
+
+
+def _rollup_table():
+    from .models import EmotionRollup
+
+    return EmotionRollup.__table__
+
+
+def _increment(connection: Connection, key: Dict[str, Any], confidence: float):
+    table = _rollup_table()
+    values = dict(key, emotion_count=1, confidence_sum=confidence)
+
+    dialect = connection.dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        insert = sqlite_insert if dialect == "sqlite" else postgresql_insert
+        stmt = insert(table).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(key),
+            set_={
+                "emotion_count": table.c.emotion_count + stmt.excluded.emotion_count,
+                "confidence_sum": table.c.confidence_sum + stmt.excluded.confidence_sum,
+            }
+        )
+        connection.execute(stmt)
+        return
+
+    # UPSERT를 지원하지 않는 DB
+    result = connection.execute(
+        update(table)
+        .where(*(table.c[name] == value for name, value in key.items()))
+        .values(
+            emotion_count=table.c.emotion_count + 1,
+            confidence_sum=table.c.confidence_sum + confidence
+        )
+    )
+    if result.rowcount == 0:
+        connection.execute(table.insert().values(**values))
+
+
+def _decrement(connection: Connection, key: Dict[str, Any], confidence: float):
+    table = _rollup_table()
+    where = [table.c[name] == value for name, value in key.items()]
+    connection.execute(
+        update(table)
+        .where(*where)
+        .values(
+            emotion_count=table.c.emotion_count - 1,
+            confidence_sum=table.c.confidence_sum - confidence
+        )
+    )
+    connection.execute(delete(table).where(*where, table.c.emotion_count <= 0))
+
+
+class Counted(NamedTuple):
+    """일기 하나가 롤업에 더하는 값 (최신 감정과 일기 날짜)"""
+    user_id: int
+    entry_date: datetime
+    emotion_type: str
+    confidence: float
+
+
+def _apply(connection: Connection, counted: Counted, delta: int):
+    for granularity in GRANULARITIES:
+        key = {
+            "user_id": counted.user_id,
+            "granularity": granularity,
+            "bucket_start": bucket_start(counted.entry_date, granularity),
+            "emotion_type": counted.emotion_type,
+        }
+        if delta > 0:
+            _increment(connection, key, counted.confidence)
+        else:
+            _decrement(connection, key, counted.confidence)
+
+
+def _latest_emotions_query(entry_ids: Optional[Iterable[int]] = None):
+    """일기별 감정을 최신순으로 (일기 id 순서), 일기마다 첫 행이 집계 대상"""
+    from .models import Emotion, Entry
+
+    query = (
+        select(Entry.id, Entry.user_id, Entry.date, Emotion.emotion_type, Emotion.confidence_score)
+        .join(Emotion, Emotion.entry_id == Entry.id)
+        .order_by(Entry.id, Emotion.created_at.desc(), Emotion.id.desc())
+    )
+    if entry_ids is not None:
+        query = query.where(Entry.id.in_(list(entry_ids)))
+    return query
+
+
+def _iter_counted(rows) -> Iterable[tuple]:
+    previous = None
+    for entry_id, user_id, entry_date, emotion_type, confidence in rows:
+        if entry_id != previous and entry_date is not None:
+            yield entry_id, Counted(user_id, entry_date, emotion_type, confidence)
+        previous = entry_id
+
+
+def counted_emotions(connection: Connection, entry_ids: Set[int]) -> Dict[int, Counted]:
+    """일기별 현재 집계 대상 (감정이 없는 일기는 빠짐)"""
+    if not entry_ids:
+        return {}
+    return dict(_iter_counted(connection.execute(_latest_emotions_query(entry_ids))))
+
+
+def apply_changes(connection: Connection, before: Dict[int, Counted], entry_ids: Set[int]):
+    """flush 전 집계 대상(before)과 현재 집계 대상이 다른 일기만 롤업에서 빼고 더함"""
+    after = counted_emotions(connection, entry_ids)
+    for entry_id in entry_ids:
+        old, new = before.get(entry_id), after.get(entry_id)
+        if old == new:
+            continue
+        if old is not None:
+            _apply(connection, old, -1)
+        if new is not None:
+            _apply(connection, new, +1)
+
+
+def get_emotion_stats(db: Session, user_id: int, granularity: str,
+                      start: Optional[date] = None, end: Optional[date] = None) -> List[Dict[str, Any]]:
+    """구간별 감정 분포 (구간 시작일 오름차순)"""
+    from .models import EmotionRollup
+
+    query = db.query(
+        EmotionRollup.bucket_start,
+        EmotionRollup.emotion_type,
+        EmotionRollup.emotion_count,
+        EmotionRollup.confidence_sum
+    ).filter(EmotionRollup.user_id == user_id, EmotionRollup.granularity == granularity)
+    if start is not None:
+        query = query.filter(EmotionRollup.bucket_start >= bucket_start(start, granularity))
+    if end is not None:
+        query = query.filter(EmotionRollup.bucket_start <= end)
+
+    buckets: Dict[date, Dict[str, Any]] = {}
+    for bucket, emotion_type, count, confidence_sum in query.order_by(EmotionRollup.bucket_start):
+        stats = buckets.setdefault(bucket, {"bucket_start": bucket, "total": 0, "emotions": {}})
+        stats["total"] += count
+        stats["emotions"][emotion_type] = {
+            "count": count,
+            "mean_confidence": confidence_sum / count
+        }
+    return list(buckets.values())
+
+
+def rebuild_rollups(connection: Connection):
+    """emotions 테이블 전체로 롤업을 다시 계산 (기존 데이터 백필/복구용)"""
+    table = _rollup_table()
+    connection.execute(delete(table))
+
+    totals: Dict[tuple, List[float]] = {}
+    for _, counted in _iter_counted(connection.execute(_latest_emotions_query())):
+        for granularity in GRANULARITIES:
+            key = (counted.user_id, granularity, bucket_start(counted.entry_date, granularity), counted.emotion_type)
+            total = totals.setdefault(key, [0, 0.0])
+            total[0] += 1
+            total[1] += counted.confidence
+
+    if totals:
+        connection.execute(table.insert(), [
+            {"user_id": user_id, "granularity": granularity, "bucket_start": bucket, "emotion_type": emotion_type,
+             "emotion_count": count, "confidence_sum": confidence_sum}
+            for (user_id, granularity, bucket, emotion_type), (count, confidence_sum) in totals.items()
+        ])
+
+
+def backfill_rollups(engine):
+    """일별 롤업 건수가 분석된 일기 수와 다르면 (비어 있거나 이전 방식으로 집계됨) 다시 계산"""
+    from .models import Emotion
+
+    table = _rollup_table()
+    with engine.begin() as connection:
+        counted = connection.execute(
+            select(func.coalesce(func.sum(table.c.emotion_count), 0)).where(table.c.granularity == "day")
+        ).scalar()
+        analyzed_entries = connection.execute(select(func.count(distinct(Emotion.entry_id)))).scalar()
+        if counted != analyzed_entries:
+            rebuild_rollups(connection)
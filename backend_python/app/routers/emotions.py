@@ -1,48 +1,69 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Literal, Optional
+from datetime import date
 from loguru import logger
 
 from ..database import get_db
 from ..models import Emotion, User
-from ..schemas import Emotion as EmotionSchema, EmotionAnalysisRequest, EmotionAnalysisResponse
+from ..schemas import (
+    Emotion as EmotionSchema,
+    EmotionAnalysisRequest,
+    EmotionAnalysisResponse,
+    BatchEmotionAnalysisRequest,
+    BatchEmotionAnalysisItem,
+    BatchEmotionAnalysisResponse,
+    EmotionStatsResponse,
+)
 from ..routers.auth import get_current_user
+from ..config import settings
+from ..exceptions import ValidationError
+from ..pagination import NEXT_CURSOR_HEADER, keyset_page
+from ..queries import get_owned_emotion, owned_emotions
+from ..rollups import get_emotion_stats
 
 router = APIRouter()
 
 @router.get("/", response_model=List[EmotionSchema])
-async def read_emotions(
-    skip: int = 0, 
-    limit: int = 100, 
+def read_emotions(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    skip: int = Query(0, ge=0, deprecated=True),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
+    """Newest emotions first; pass the X-Next-Cursor header back as ?cursor= for the next page"""
     # Get emotions for entries owned by current user
-    emotions = (
-        db.query(Emotion)
-        .join(Emotion.entry)
-        .filter(Emotion.entry.has(user_id=current_user.id))
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    query = owned_emotions(db, current_user.id)
+    emotions, next_cursor = keyset_page(query, [Emotion.created_at, Emotion.id], limit, cursor, skip=skip)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return emotions
 
+# Declared before /{emotion_id} so "stats" is not parsed as an id
+@router.get("/stats", response_model=EmotionStatsResponse)
+def read_emotion_stats(
+    granularity: Literal["day", "week", "month"] = "day",
+    start: Optional[date] = Query(None, alias="from"),
+    end: Optional[date] = Query(None, alias="to"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Emotion distribution per day/week/month by entry date (latest result per entry, UTC buckets, inclusive range)"""
+    if start is not None and end is not None and start > end:
+        raise ValidationError("'from' must not be after 'to'")
+    
+    buckets = get_emotion_stats(db, current_user.id, granularity, start, end)
+    return EmotionStatsResponse(granularity=granularity, buckets=buckets)
+
 @router.get("/{emotion_id}", response_model=EmotionSchema)
-async def read_emotion(
+def read_emotion(
     emotion_id: int, 
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    emotion = (
-        db.query(Emotion)
-        .join(Emotion.entry)
-        .filter(
-            Emotion.id == emotion_id,
-            Emotion.entry.has(user_id=current_user.id)
-        )
-        .first()
-    )
+    emotion = get_owned_emotion(db, emotion_id, current_user.id)
     if emotion is None:
         raise HTTPException(status_code=404, detail="Emotion not found")
     return emotion
@@ -53,9 +74,9 @@ async def analyze_text_emotion(
     current_user: User = Depends(get_current_user)
 ):
     """Analyze emotion for arbitrary text without saving to database"""
-    from ..services.kobert_emotion_service import analyze_emotion
+    from ..services.kobert_emotion_service import analyze_emotion_async
     
-    result = analyze_emotion(request.text)
+    result = await analyze_emotion_async(request.text)
     
     logger.info(f"User {current_user.username} analyzed text emotion: {result['emotion_type']}")
     
@@ -65,13 +86,53 @@ async def analyze_text_emotion(
         all_emotions=result["all_emotions"]
     )
 
+@router.post("/analyze/batch", response_model=BatchEmotionAnalysisResponse)
+async def analyze_text_emotions_batch(
+    request: BatchEmotionAnalysisRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """Analyze emotions for many texts with one batched model call, results in request order"""
+    from ..services.kobert_emotion_service import analyze_emotions_batch
+    
+    if len(request.items) > settings.BATCH_ANALYSIS_MAX_ITEMS:
+        raise ValidationError(
+            f"Too many items: {len(request.items)} (max {settings.BATCH_ANALYSIS_MAX_ITEMS})"
+        )
+    
+    results = [BatchEmotionAnalysisItem(index=i) for i in range(len(request.items))]
+    valid_indices = []
+    for i, item in enumerate(request.items):
+        if not item.text.strip():
+            results[i].error = "Text is empty"
+        elif len(item.text) > settings.BATCH_ANALYSIS_MAX_TEXT_LENGTH:
+            results[i].error = f"Text is longer than {settings.BATCH_ANALYSIS_MAX_TEXT_LENGTH} characters"
+        else:
+            valid_indices.append(i)
+    
+    analyses = await analyze_emotions_batch([request.items[i].text for i in valid_indices])
+    
+    for i, analysis in zip(valid_indices, analyses):
+        if isinstance(analysis, Exception):
+            results[i].error = "Emotion analysis failed"
+        else:
+            results[i].result = EmotionAnalysisResponse(
+                emotion_type=analysis["emotion_type"],
+                confidence_score=analysis["confidence_score"],
+                all_emotions=analysis["all_emotions"]
+            )
+    
+    logger.info(
+        f"User {current_user.username} analyzed {len(valid_indices)}/{len(request.items)} texts in batch"
+    )
+    return BatchEmotionAnalysisResponse(results=results)
+
 @router.post("/test", response_model=EmotionAnalysisResponse)
 async def test_emotion_analysis(request: EmotionAnalysisRequest):
     """공개 테스트용 감정 분석 엔드포인트 (인증 불필요)"""
-    from ..services.kobert_emotion_service import analyze_emotion
+    from ..services.kobert_emotion_service import analyze_emotion_async
     
     try:
-        result = analyze_emotion(request.text)
+        result = await analyze_emotion_async(request.text)
         logger.info(f"Test emotion analysis: {result['emotion_type']}")
         
         return EmotionAnalysisResponse(
@@ -79,25 +140,19 @@ async def test_emotion_analysis(request: EmotionAnalysisRequest):
             confidence_score=result["confidence_score"],
             all_emotions=result["all_emotions"]
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Test emotion analysis error: {e}")
         raise HTTPException(status_code=500, detail="감정 분석 중 오류가 발생했습니다.")
 
 @router.delete("/{emotion_id}")
-async def delete_emotion(
+def delete_emotion(
     emotion_id: int, 
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    emotion = (
-        db.query(Emotion)
-        .join(Emotion.entry)
-        .filter(
-            Emotion.id == emotion_id,
-            Emotion.entry.has(user_id=current_user.id)
-        )
-        .first()
-    )
+    emotion = get_owned_emotion(db, emotion_id, current_user.id)
     if emotion is None:
         raise HTTPException(status_code=404, detail="Emotion not found")
     
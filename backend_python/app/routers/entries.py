@@ -1,18 +1,35 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 from loguru import logger
 
-from ..database import get_db
-from ..models import Entry, User
-from ..schemas import Entry as EntrySchema, EntryCreate, EntryUpdate, EntryWithEmotions
+from ..database import get_async_db, get_db
+from ..models import Emotion, Entry, User
+from ..schemas import (
+    Entry as EntrySchema,
+    EntryCreate,
+    EntryUpdate,
+    EntryWithEmotions,
+    EntryAnalysisStatus,
+    EntrySearchHit,
+)
 from ..routers.auth import get_current_user
+from ..config import settings
+from ..exceptions import ServiceUnavailableError, ValidationError
+from ..queries import get_user_entry, list_user_entries
+from ..pagination import NEXT_CURSOR_HEADER
+from ..search import search_entries
+from ..services.analysis_queue import get_analysis_queue
+from ..services.emotion_records import add_emotion_record, find_reusable_emotions
 
 router = APIRouter()
 
 @router.post("/", response_model=EntrySchema)
-async def create_entry(
+def create_entry(
     entry: EntryCreate, 
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -25,38 +42,76 @@ async def create_entry(
     db.commit()
     db.refresh(db_entry)
     
+    if settings.ANALYSIS_QUEUE_ENABLED:
+        get_analysis_queue().enqueue(db_entry.id)
+    
     logger.info(f"User {current_user.username} created a new entry: {db_entry.id}")
     return db_entry
 
-@router.get("/", response_model=List[EntrySchema])
-async def read_entries(
-    skip: int = 0, 
-    limit: int = 100, 
+@router.get(
+    "/",
+    response_model=List[EntrySchema],
+    responses={200: {"description": "With include=emotions each entry also carries its emotions",
+                     "model": List[EntryWithEmotions]}}
+)
+def read_entries(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    skip: int = Query(0, ge=0, deprecated=True),
+    include: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    entries = db.query(Entry).filter(Entry.user_id == current_user.id).offset(skip).limit(limit).all()
+    """Newest entries first; pass the X-Next-Cursor header back as ?cursor= for the next page"""
+    includes = {part.strip() for part in include.split(",") if part.strip()} if include else set()
+    if includes - {"emotions"}:
+        raise ValidationError(f"Unsupported include: {', '.join(sorted(includes - {'emotions'}))}")
+    
+    with_emotions = "emotions" in includes
+    entries, next_cursor = list_user_entries(
+        db, current_user.id, limit, cursor, skip=skip, with_emotions=with_emotions
+    )
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+    if with_emotions:
+        # Serialized here since the response shape differs from the default listing
+        return JSONResponse(
+            jsonable_encoder([EntryWithEmotions.model_validate(entry) for entry in entries]),
+            headers=headers
+        )
+    response.headers.update(headers)
     return entries
 
+# Declared before /{entry_id} so "search" is not parsed as an id
+@router.get("/search", response_model=List[EntrySearchHit])
+def search_user_entries(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Full-text search over the current user's entries, most relevant first"""
+    return search_entries(db, current_user.id, q, limit)
+
 @router.get("/{entry_id}", response_model=EntryWithEmotions)
-async def read_entry(
+def read_entry(
     entry_id: int, 
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    entry = db.query(Entry).filter(Entry.id == entry_id, Entry.user_id == current_user.id).first()
+    entry = get_user_entry(db, entry_id, current_user.id, with_emotions=True)
     if entry is None:
         raise HTTPException(status_code=404, detail="Entry not found")
     return entry
 
 @router.put("/{entry_id}", response_model=EntrySchema)
-async def update_entry(
+def update_entry(
     entry_id: int, 
     entry_update: EntryUpdate, 
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    entry = db.query(Entry).filter(Entry.id == entry_id, Entry.user_id == current_user.id).first()
+    entry = get_user_entry(db, entry_id, current_user.id)
     if entry is None:
         raise HTTPException(status_code=404, detail="Entry not found")
     
@@ -67,16 +122,19 @@ async def update_entry(
     db.commit()
     db.refresh(entry)
     
+    if settings.ANALYSIS_QUEUE_ENABLED and "content" in update_data:
+        get_analysis_queue().enqueue(entry.id)
+    
     logger.info(f"User {current_user.username} updated entry: {entry_id}")
     return entry
 
 @router.delete("/{entry_id}")
-async def delete_entry(
+def delete_entry(
     entry_id: int, 
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    entry = db.query(Entry).filter(Entry.id == entry_id, Entry.user_id == current_user.id).first()
+    entry = get_user_entry(db, entry_id, current_user.id)
     if entry is None:
         raise HTTPException(status_code=404, detail="Entry not found")
     
@@ -89,36 +147,82 @@ async def delete_entry(
 @router.get("/{entry_id}/analyze", response_model=EntryWithEmotions)
 async def analyze_entry_emotions(
     entry_id: int, 
-    db: Session = Depends(get_db),
+    force: bool = False,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Analyze emotions for a specific entry"""
-    entry = db.query(Entry).filter(Entry.id == entry_id, Entry.user_id == current_user.id).first()
+    """Analyze emotions for a specific entry
+    
+    Reuses the latest result when the content and model version are unchanged,
+    unless force=true.
+    """
+    # DB work goes through the async session and inference through the
+    # inference executor, so neither blocks the event loop
+    entry = await db.run_sync(get_user_entry, entry_id, current_user.id, True)
     if entry is None:
         raise HTTPException(status_code=404, detail="Entry not found")
     
+    if not force:
+        reusable = await db.run_sync(find_reusable_emotions, [entry])
+        if entry.id in reusable:
+            logger.info(f"Entry {entry_id} unchanged since last analysis, reusing result")
+            return entry
+    
     # Import emotion service here to avoid circular imports
-    from ..services.kobert_emotion_service import analyze_emotion
-    from ..models import Emotion
+    from ..services.kobert_emotion_service import analyze_emotion_async
     
     # Analyze emotion
-    emotion_result = analyze_emotion(entry.content)
-    
-    # Save emotion analysis
-    db_emotion = Emotion(
-        entry_id=entry.id,
-        emotion_type=emotion_result["emotion_type"],
-        confidence_score=emotion_result["confidence_score"],
-        analyzed_text=entry.content,
-        model_version="v1.0"
-    )
+    content = entry.content
+    emotion_result = await analyze_emotion_async(content)
     
-    db.add(db_emotion)
-    db.commit()
-    db.refresh(db_emotion)
+    # Save emotion analysis, fingerprinted by the text that was analyzed
+    await db.run_sync(add_emotion_record, entry, emotion_result, content)
+    await db.commit()
     
-    # Refresh entry to include new emotion
-    db.refresh(entry)
+    # Reload the entry with its emotions so serialization does not lazy-load
+    entry = await db.run_sync(get_user_entry, entry_id, current_user.id, True)
     
     logger.info(f"Analyzed emotions for entry {entry_id}: {emotion_result['emotion_type']}")
-    return entry
\ No newline at end of file
+    return entry
+
+def _analysis_status(db: Session, entry: Entry) -> EntryAnalysisStatus:
+    queued_status = get_analysis_queue().status(entry.id)
+    latest = (
+        db.query(Emotion)
+        .filter(Emotion.entry_id == entry.id)
+        .order_by(Emotion.created_at.desc(), Emotion.id.desc())
+        .first()
+    )
+    if queued_status is None:
+        queued_status = "done" if latest is not None else "not_queued"
+    return EntryAnalysisStatus(entry_id=entry.id, status=queued_status, emotion=latest)
+
+@router.get("/{entry_id}/analysis", response_model=EntryAnalysisStatus)
+def get_entry_analysis_status(
+    entry_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Background analysis status for an entry, with the latest saved emotion"""
+    entry = get_user_entry(db, entry_id, current_user.id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Entry not found")
+    return _analysis_status(db, entry)
+
+@router.post("/{entry_id}/analysis", response_model=EntryAnalysisStatus, status_code=status.HTTP_202_ACCEPTED)
+def enqueue_entry_analysis(
+    entry_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Queue an entry for background analysis without waiting on the model"""
+    if not settings.ANALYSIS_QUEUE_ENABLED:
+        # No worker would ever pick the job up
+        raise ServiceUnavailableError(
+            f"Background analysis is disabled; use GET /api/entries/{entry_id}/analyze"
+        )
+    entry = get_user_entry(db, entry_id, current_user.id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Entry not found")
+    get_analysis_queue().enqueue(entry.id)
+    return _analysis_status(db, entry)
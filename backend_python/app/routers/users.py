@@ -1,30 +1,43 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from loguru import logger
 
-from ..database import get_db
+from ..database import get_async_db, get_db
 from ..models import User
 from ..schemas import User as UserSchema, UserUpdate, UserWithEntries
 from ..routers.auth import get_current_user
+from ..queries import get_user_with_entries
+from ..pagination import NEXT_CURSOR_HEADER, keyset_page
+from ..principals import invalidate_principal
+from ..services.password_hasher import get_password_hasher
 
 router = APIRouter()
 
 @router.get("/", response_model=List[UserSchema])
-async def read_users(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    users = db.query(User).offset(skip).limit(limit).all()
+def read_users(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    skip: int = Query(0, ge=0, deprecated=True),
+    db: Session = Depends(get_db)
+):
+    users, next_cursor = keyset_page(db.query(User), [User.id], limit, cursor, descending=False, skip=skip)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return users
 
 @router.get("/{user_id}", response_model=UserSchema)
-async def read_user(user_id: int, db: Session = Depends(get_db)):
+def read_user(user_id: int, db: Session = Depends(get_db)):
     user = db.query(User).filter(User.id == user_id).first()
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
     return user
 
 @router.get("/{user_id}/entries", response_model=UserWithEntries)
-async def read_user_with_entries(user_id: int, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.id == user_id).first()
+def read_user_with_entries(user_id: int, db: Session = Depends(get_db)):
+    user = get_user_with_entries(db, user_id)
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
     return user
@@ -33,36 +46,37 @@ async def read_user_with_entries(user_id: int, db: Session = Depends(get_db)):
 async def update_user(
     user_id: int, 
     user_update: UserUpdate, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     # Users can only update their own profile
     if current_user.id != user_id:
         raise HTTPException(status_code=403, detail="Not authorized to update this user")
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
     
+    previous_username = user.username
     update_data = user_update.dict(exclude_unset=True)
     
-    # Handle password update
+    # Handle password update (hashed on the password executor)
     if "password" in update_data:
-        from ..routers.auth import get_password_hash
-        update_data["hashed_password"] = get_password_hash(update_data["password"])
+        update_data["hashed_password"] = await get_password_hasher().hash(update_data["password"])
         del update_data["password"]
     
     for field, value in update_data.items():
         setattr(user, field, value)
     
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
+    invalidate_principal(previous_username)
     
     logger.info(f"User {user.username} updated their profile")
     return user
 
 @router.delete("/{user_id}")
-async def delete_user(
+def delete_user(
     user_id: int, 
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -77,6 +91,7 @@ async def delete_user(
     
     db.delete(user)
     db.commit()
+    invalidate_principal(user.username)
     
     logger.info(f"User {user.username} deleted their account")
     return {"message": "User deleted successfully"}
\ No newline at end of file
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, EmailStr
-from typing import List, Optional
-from datetime import datetime
+from typing import Dict, List, Optional
+from datetime import date, datetime
 
 # User schemas
 class UserBase(BaseModel):
@@ -89,4 +89,42 @@ class EmotionAnalysisRequest(BaseModel):
 class EmotionAnalysisResponse(BaseModel):
     emotion_type: str
     confidence_score: float
-    all_emotions: dict
\ No newline at end of file
+    all_emotions: dict
+
+# Batch emotion analysis
+class BatchEmotionAnalysisRequest(BaseModel):
+    items: List[EmotionAnalysisRequest]
+
+class BatchEmotionAnalysisItem(BaseModel):
+    index: int
+    result: Optional[EmotionAnalysisResponse] = None
+    error: Optional[str] = None
+
+class BatchEmotionAnalysisResponse(BaseModel):
+    results: List[BatchEmotionAnalysisItem]
+
+# Background analysis status
+class EntryAnalysisStatus(BaseModel):
+    entry_id: int
+    status: str  # pending | processing | done | failed | not_queued
+    emotion: Optional[Emotion] = None
+
+# Emotion statistics
+class EmotionTypeStats(BaseModel):
+    count: int
+    mean_confidence: float
+
+class EmotionStatsBucket(BaseModel):
+    bucket_start: date
+    total: int
+    emotions: Dict[str, EmotionTypeStats]
+
+class EmotionStatsResponse(BaseModel):
+    granularity: str
+    buckets: List[EmotionStatsBucket]
+
+# Entry search
+class EntrySearchHit(BaseModel):
+    entry: Entry
+    score: float
+    highlight: str  # HTML-escaped snippet with <mark> around matched terms
@@ -0,0 +1,232 @@
+"""
+일기 전문 검색 (역색인)
+- 제목과 본문을 바이그램 토큰 문서로 만들어 entry_search_documents에 저장
+  (한국어는 띄어쓰기/조사와 무관하게 부분 문자열로 찾을 수 있도록 두 글자 단위로 색인)
+- PostgreSQL: to_tsvector('simple', document) GIN 인덱스 + ts_rank
+- SQLite: FTS5 외부 콘텐츠 테이블(entry_search_fts) + bm25, 트리거로 동기화
+- 그 밖의 DB: 문서 LIKE 검색 (색인 없음)
+- 일기 생성/수정/삭제 시 models.py의 매퍼 이벤트가 같은 트랜잭션에서 문서를 갱신
+"""
+
+import html
+import re
+import unicodedata
+from typing import Any, Dict, List, Tuple
+from sqlalchemy import delete, func, literal_column, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+FTS_TABLE = "entry_search_fts"
+SIMPLE_CONFIG = literal_column("'simple'::regconfig")
+
+_WORD = re.compile(r"\w+")
+# 한글/한자/가나는 바이그램, 그 밖(영문/숫자)은 단어 단위로 색인
+_CJK = re.compile(r"[ᄀ-ᇿ぀-ヿ㄰-㆏㐀-鿿가-힯]")
+
+SQLITE_FTS_DDL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        document, content='entry_search_documents', content_rowid='entry_id'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS entry_search_documents_ai AFTER INSERT ON entry_search_documents BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, document) VALUES (new.entry_id, new.document);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS entry_search_documents_ad AFTER DELETE ON entry_search_documents BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, document) VALUES ('delete', old.entry_id, old.document);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS entry_search_documents_au AFTER UPDATE ON entry_search_documents BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, document) VALUES ('delete', old.entry_id, old.document);
+        INSERT INTO {FTS_TABLE}(rowid, document) VALUES (new.entry_id, new.document);
+    END""",
+    # 테이블을 다시 만든 경우 남아 있는 색인을 문서 테이블 기준으로 재구성
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+
+
+def _words(text_value: str) -> List[str]:
+    text_value = unicodedata.normalize("NFC", text_value or "").lower()
+    return _WORD.findall(text_value)
+
+
+def _word_tokens(word: str) -> List[str]:
+    """단어 하나의 색인 토큰 (CJK: 바이그램 + 마지막 글자, 그 밖: 단어 그대로)"""
+    if not _CJK.search(word) or len(word) == 1:
+        return [word]
+    # 마지막 글자 유니그램을 함께 넣어 한 글자 검색어도 접두어 검색으로 찾을 수 있게 함
+    return [word[i:i + 2] for i in range(len(word) - 1)] + [word[-1]]
+
+
+def tokenize(text_value: str) -> List[str]:
+    """색인용 토큰 목록"""
+    tokens = []
+    for word in _words(text_value):
+        tokens.extend(_word_tokens(word))
+    return tokens
+
+
+def build_document(title: str, content: str) -> str:
+    return " ".join(tokenize(f"{title or ''} {content or ''}"))
+
+
+def query_terms(query: str) -> List[Tuple[str, bool]]:
+    """검색어 토큰 (토큰, 접두어 검색 여부), 모든 토큰이 일치해야 함"""
+    terms = []
+    for word in _words(query):
+        if len(word) == 1 and _CJK.search(word):
+            terms.append((word, True))
+        elif _CJK.search(word):
+            terms.extend((word[i:i + 2], False) for i in range(len(word) - 1))
+        else:
+            # 영문/숫자는 앞부분만 입력해도 찾도록 접두어 검색
+            terms.append((word, True))
+    # 순서를 유지하며 중복 제거
+    return list(dict.fromkeys(terms))
+
+
+# -- 색인 동기화 --------------------------------------------------------------
+
+def create_sqlite_index(connection: Connection):
+    """SQLite FTS5 테이블과 동기화 트리거 생성"""
+    for statement in SQLITE_FTS_DDL:
+        connection.exec_driver_sql(statement)
+
+
+def drop_sqlite_index(connection: Connection):
+    connection.exec_driver_sql(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+def index_entry(connection: Connection, entry_id: int, user_id: int, title: str, content: str):
+    """일기 검색 문서 저장 (있으면 교체)"""
+    from .models import EntrySearchDocument
+
+    table = EntrySearchDocument.__table__
+    connection.execute(delete(table).where(table.c.entry_id == entry_id))
+    connection.execute(table.insert().values(
+        entry_id=entry_id, user_id=user_id, document=build_document(title, content)
+    ))
+
+
+def unindex_entry(connection: Connection, entry_id: int):
+    from .models import EntrySearchDocument
+
+    table = EntrySearchDocument.__table__
+    connection.execute(delete(table).where(table.c.entry_id == entry_id))
+
+
+def rebuild_index(connection: Connection):
+    """entries 전체로 검색 문서를 다시 생성 (기존 데이터 백필/복구용)"""
+    from .models import Entry, EntrySearchDocument
+
+    table = EntrySearchDocument.__table__
+    connection.execute(delete(table))
+    rows = connection.execute(select(Entry.id, Entry.user_id, Entry.title, Entry.content)).all()
+    if rows:
+        connection.execute(table.insert(), [
+            {"entry_id": entry_id, "user_id": user_id, "document": build_document(title, content)}
+            for entry_id, user_id, title, content in rows
+        ])
+
+
+def backfill_index(engine):
+    """검색 문서가 비어 있고 일기가 있으면 한 번 채움"""
+    from .models import Entry, EntrySearchDocument
+
+    with engine.begin() as connection:
+        has_documents = connection.execute(select(func.count()).select_from(EntrySearchDocument.__table__)).scalar()
+        has_entries = connection.execute(select(func.count(Entry.id))).scalar()
+        if not has_documents and has_entries:
+            rebuild_index(connection)
+
+
+# -- 검색 ---------------------------------------------------------------------
+
+def _search_ids(db: Session, user_id: int, terms: List[Tuple[str, bool]], limit: int) -> List[Tuple[int, float]]:
+    """(entry_id, 점수) 목록, 점수가 높을수록 관련도 높음"""
+    from .models import Entry, EntrySearchDocument
+
+    dialect = db.bind.dialect.name
+
+    if dialect == "postgresql":
+        tsquery = func.to_tsquery(
+            SIMPLE_CONFIG, " & ".join(f"{token}:*" if prefix else token for token, prefix in terms)
+        )
+        vector = func.to_tsvector(SIMPLE_CONFIG, EntrySearchDocument.document)
+        rank = func.ts_rank(vector, tsquery)
+        rows = (
+            db.query(EntrySearchDocument.entry_id, rank)
+            .join(Entry, Entry.id == EntrySearchDocument.entry_id)
+            .filter(EntrySearchDocument.user_id == user_id, vector.bool_op("@@")(tsquery))
+            .order_by(rank.desc(), Entry.date.desc())
+            .limit(limit)
+            .all()
+        )
+        return [(entry_id, float(score)) for entry_id, score in rows]
+
+    if dialect == "sqlite":
+        match = " ".join(f'"{token}"*' if prefix else f'"{token}"' for token, prefix in terms)
+        rows = db.execute(
+            text(
+                f"SELECT d.entry_id, bm25({FTS_TABLE}) AS score "
+                f"FROM {FTS_TABLE} "
+                f"JOIN entry_search_documents d ON d.entry_id = {FTS_TABLE}.rowid "
+                f"JOIN entries e ON e.id = d.entry_id "
+                f"WHERE {FTS_TABLE} MATCH :match AND d.user_id = :user_id "
+                f"ORDER BY score, e.date DESC LIMIT :limit"
+            ),
+            {"match": match, "user_id": user_id, "limit": limit}
+        ).all()
+        # bm25는 낮을수록 관련도가 높음
+        return [(entry_id, -float(score)) for entry_id, score in rows]
+
+    query = db.query(EntrySearchDocument.entry_id).join(Entry, Entry.id == EntrySearchDocument.entry_id)
+    query = query.filter(EntrySearchDocument.user_id == user_id)
+    for token, _ in terms:
+        query = query.filter(EntrySearchDocument.document.contains(token))
+    return [(entry_id, 0.0) for (entry_id,) in query.order_by(Entry.date.desc()).limit(limit)]
+
+
+def highlight(content: str, query: str, context: int = 40, tag: str = "mark") -> str:
+    """본문에서 검색어 주변을 잘라 <mark>로 강조한 스니펫 (HTML 이스케이프됨)"""
+    words = sorted({word for word in _words(query)}, key=len, reverse=True)
+    normalized = unicodedata.normalize("NFC", content or "")
+    if not words:
+        return html.escape(normalized[:context * 2])
+
+    pattern = re.compile("|".join(re.escape(word) for word in words), re.IGNORECASE)
+    first = pattern.search(normalized)
+    if first is None:
+        snippet_start, snippet_end = 0, min(len(normalized), context * 2)
+    else:
+        snippet_start = max(0, first.start() - context)
+        snippet_end = min(len(normalized), first.end() + context)
+
+    snippet = normalized[snippet_start:snippet_end]
+    parts, last = [], 0
+    for match in pattern.finditer(snippet):
+        parts.append(html.escape(snippet[last:match.start()]))
+        parts.append(f"<{tag}>{html.escape(match.group())}</{tag}>")
+        last = match.end()
+    parts.append(html.escape(snippet[last:]))
+
+    prefix = "…" if snippet_start > 0 else ""
+    suffix = "…" if snippet_end < len(normalized) else ""
+    return prefix + "".join(parts) + suffix
+
+
+def search_entries(db: Session, user_id: int, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+    """사용자 일기 검색, 관련도 순 (일기, 점수, 강조 스니펫)"""
+    from .models import Entry
+
+    terms = query_terms(query)
+    if not terms:
+        return []
+
+    hits = _search_ids(db, user_id, terms, limit)
+    if not hits:
+        return []
+
+    entries = {entry.id: entry for entry in db.query(Entry).filter(Entry.id.in_([entry_id for entry_id, _ in hits]))}
+    return [
+        {"entry": entries[entry_id], "score": score, "highlight": highlight(entries[entry_id].content, query)}
+        for entry_id, score in hits
+        if entry_id in entries
+    ]
@@ -0,0 +1,381 @@
+"""
+일기 감정 분석 백그라운드 작업 큐
+- 일기 생성/수정 시 작업을 등록하고, 워커가 배치 단위로 꺼내 분석 후 Emotion 행 저장
+- memory 백엔드: 프로세스 내부 큐 (테스트/단일 프로세스)
+- redis 백엔드: 여러 레플리카가 공유하는 Redis 리스트 (k8s/05-redis.yaml)
+  꺼낸 작업은 처리 중 리스트로 옮기고 결과 저장 후 확인(ack), 워커가 종료되어
+  visibility timeout 동안 확인되지 않은 작업은 다시 대기열에 넣음
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from loguru import logger
+
+from ..cache import text_fingerprint
+from ..config import settings
+from ..database import SessionLocal
+from ..exceptions import ServiceUnavailableError
+from ..models import Entry
+
+PENDING = "pending"
+PROCESSING = "processing"
+FAILED = "failed"
+
+
+class InMemoryQueueBackend:
+    """프로세스 내부 작업 큐"""
+
+    def __init__(self):
+        self._queue: "queue.Queue[int]" = queue.Queue()
+        self._statuses: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def push(self, entry_id: int) -> bool:
+        with self._lock:
+            # 이미 대기 중인 일기는 다시 넣지 않음 (처리 시점에 최신 내용을 읽음)
+            if self._statuses.get(entry_id) == PENDING:
+                return False
+            self._statuses[entry_id] = PENDING
+        self._queue.put(entry_id)
+        return True
+
+    def pop_batch(self, max_items: int, timeout: float) -> List[int]:
+        try:
+            entry_ids = [self._queue.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+        while len(entry_ids) < max_items:
+            try:
+                entry_ids.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return entry_ids
+
+    def get_status(self, entry_id: int) -> Optional[str]:
+        with self._lock:
+            return self._statuses.get(entry_id)
+
+    def set_status(self, entry_id: int, status: Optional[str]):
+        with self._lock:
+            if status is None:
+                self._statuses.pop(entry_id, None)
+            else:
+                self._statuses[entry_id] = status
+
+    def ack(self, entry_ids: List[int]):
+        # 프로세스 내부 큐는 프로세스와 함께 사라지므로 확인할 작업이 없음
+        pass
+
+    def requeue_stale(self, visibility_timeout: float) -> int:
+        return 0
+
+
+# 대기 중이 아닐 때만 상태를 pending으로 바꾸고 대기열에 추가 (KEYS: 대기열, 상태 / ARGV: entry_id, pending)
+_PUSH_SCRIPT = """
+if redis.call('HGET', KEYS[2], ARGV[1]) == ARGV[2] then
+    return 0
+end
+redis.call('HSET', KEYS[2], ARGV[1], ARGV[2])
+redis.call('RPUSH', KEYS[1], ARGV[1])
+return 1
+"""
+
+# 처리 중 리스트에 남아 있으면 꺼내서 다시 대기열에 추가 (KEYS: 처리 중, 대기열, 시작 시각, 상태)
+# 그 사이 수정으로 이미 다시 등록되었으면 대기열에 한 번만 남김
+_REQUEUE_SCRIPT = """
+if redis.call('LREM', KEYS[1], 1, ARGV[1]) == 0 then
+    return 0
+end
+redis.call('HDEL', KEYS[3], ARGV[1])
+if redis.call('HGET', KEYS[4], ARGV[1]) ~= ARGV[2] then
+    redis.call('HSET', KEYS[4], ARGV[1], ARGV[2])
+    redis.call('RPUSH', KEYS[2], ARGV[1])
+end
+return 1
+"""
+
+
+class RedisQueueBackend:
+    """Redis 리스트 기반 작업 큐 (레플리카 간 공유)
+
+    pop_batch는 작업을 처리 중 리스트로 옮기고(BLMOVE) 시작 시각을 기록하며,
+    ack 전에 워커가 종료된 작업은 requeue_stale이 다시 대기열에 넣음
+    """
+
+    QUEUE_KEY = "emotion-analysis:queue"
+    PROCESSING_KEY = "emotion-analysis:processing"
+    CLAIMED_KEY = "emotion-analysis:claimed"
+    STATUS_KEY = "emotion-analysis:status"
+
+    def __init__(self, url: str):
+        import redis
+
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+        self._push = self.client.register_script(_PUSH_SCRIPT)
+        self._requeue = self.client.register_script(_REQUEUE_SCRIPT)
+
+    def push(self, entry_id: int) -> bool:
+        return bool(self._push(keys=[self.QUEUE_KEY, self.STATUS_KEY], args=[entry_id, PENDING]))
+
+    def pop_batch(self, max_items: int, timeout: float) -> List[int]:
+        item = self.client.blmove(self.QUEUE_KEY, self.PROCESSING_KEY, max(int(timeout), 1), "LEFT", "RIGHT")
+        if item is None:
+            return []
+        entry_ids = [int(item)]
+        if max_items > 1:
+            pipe = self.client.pipeline()
+            for _ in range(max_items - 1):
+                pipe.lmove(self.QUEUE_KEY, self.PROCESSING_KEY, "LEFT", "RIGHT")
+            entry_ids.extend(int(value) for value in pipe.execute() if value is not None)
+        self.client.hset(self.CLAIMED_KEY, mapping={entry_id: time.time() for entry_id in entry_ids})
+        return entry_ids
+
+    def ack(self, entry_ids: List[int]):
+        """처리를 마친 작업을 처리 중 리스트에서 제거"""
+        if not entry_ids:
+            return
+        pipe = self.client.pipeline()
+        for entry_id in entry_ids:
+            pipe.lrem(self.PROCESSING_KEY, 1, entry_id)
+        pipe.hdel(self.CLAIMED_KEY, *entry_ids)
+        pipe.execute()
+
+    def requeue_stale(self, visibility_timeout: float) -> int:
+        """visibility_timeout보다 오래 확인되지 않은 작업을 다시 대기열에 넣고 개수 반환"""
+        now = time.time()
+        requeued = 0
+        for value in self.client.lrange(self.PROCESSING_KEY, 0, -1):
+            claimed = self.client.hget(self.CLAIMED_KEY, value)
+            if claimed is None:
+                # 옮긴 직후 종료되어 시작 시각이 없는 작업은 지금부터 계산
+                self.client.hsetnx(self.CLAIMED_KEY, value, now)
+            elif now - float(claimed) >= visibility_timeout:
+                requeued += self._requeue(
+                    keys=[self.PROCESSING_KEY, self.QUEUE_KEY, self.CLAIMED_KEY, self.STATUS_KEY],
+                    args=[value, PENDING]
+                )
+        return requeued
+
+    def get_status(self, entry_id: int) -> Optional[str]:
+        return self.client.hget(self.STATUS_KEY, entry_id)
+
+    def set_status(self, entry_id: int, status: Optional[str]):
+        if status is None:
+            self.client.hdel(self.STATUS_KEY, entry_id)
+        else:
+            self.client.hset(self.STATUS_KEY, entry_id, status)
+
+
+class AnalysisQueue:
+    """감정 분석 작업 큐와 배치 워커"""
+
+    def __init__(self, backend, batch_size: int = 16, poll_timeout: float = 1.0,
+                 session_factory: Callable = SessionLocal, visibility_timeout: float = 300.0):
+        self.backend = backend
+        self.batch_size = batch_size
+        self.poll_timeout = poll_timeout
+        self.session_factory = session_factory
+        self.visibility_timeout = visibility_timeout
+
+        # 블로킹 pop과 DB 작업은 이벤트 루프 밖에서 실행
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="analysis-queue")
+        self._worker: Optional[asyncio.Task] = None
+        self._stopping = False
+
+        self.processed = 0
+        self.failed = 0
+        self.requeued = 0
+
+    def enqueue(self, entry_id: int) -> bool:
+        """일기 분석 작업 등록"""
+        try:
+            return self.backend.push(entry_id)
+        except Exception as e:
+            logger.error(f"분석 작업 등록 실패 (entry {entry_id}): {e}")
+            return False
+
+    def status(self, entry_id: int) -> Optional[str]:
+        """대기/처리 중/실패 상태 (완료된 작업은 None, Emotion 행으로 확인)"""
+        return self.backend.get_status(entry_id)
+
+    async def start(self):
+        if self._worker is None or self._worker.done():
+            self._stopping = False
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+            logger.info(f"감정 분석 워커 시작 (batch_size={self.batch_size})")
+
+    async def stop(self):
+        self._stopping = True
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        next_reap = 0.0
+        while not self._stopping:
+            try:
+                # 종료된 워커(다른 레플리카 포함)가 확인하지 못한 작업 복구
+                if loop.time() >= next_reap:
+                    next_reap = loop.time() + self.visibility_timeout / 2
+                    requeued = await loop.run_in_executor(
+                        self._executor, self.backend.requeue_stale, self.visibility_timeout
+                    )
+                    if requeued:
+                        self.requeued += requeued
+                        logger.warning(f"확인되지 않은 분석 작업 {requeued}개를 다시 등록")
+                entry_ids = await loop.run_in_executor(
+                    self._executor, self.backend.pop_batch, self.batch_size, self.poll_timeout
+                )
+                if entry_ids:
+                    await self._process(entry_ids)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"감정 분석 워커 오류: {e}")
+                await asyncio.sleep(self.poll_timeout)
+
+    async def _process(self, entry_ids: List[int]):
+        """배치 하나를 분석하고 결과 저장"""
+        from .kobert_emotion_service import analyze_emotions_batch
+
+        loop = asyncio.get_running_loop()
+        for entry_id in entry_ids:
+            self.backend.set_status(entry_id, PROCESSING)
+
+        try:
+            contents = await loop.run_in_executor(self._executor, self._load_contents, entry_ids)
+        except Exception as e:
+            self._fail(entry_ids, e)
+            return
+        # 처리 전에 삭제되었거나 이미 분석된 일기는 건너뜀
+        skipped = [entry_id for entry_id in entry_ids if entry_id not in contents]
+        for entry_id in skipped:
+            self.backend.set_status(entry_id, None)
+        self.backend.ack(skipped)
+        entry_ids = [entry_id for entry_id in entry_ids if entry_id in contents]
+        if not entry_ids:
+            return
+
+        try:
+            analyses = await analyze_emotions_batch([contents[entry_id] for entry_id in entry_ids])
+        except ServiceUnavailableError:
+            # 추론 대기열이 가득 차면 잠시 후 다시 등록
+            await asyncio.sleep(self.poll_timeout)
+            for entry_id in entry_ids:
+                self.backend.set_status(entry_id, None)
+                self.enqueue(entry_id)
+            self.backend.ack(entry_ids)
+            return
+        except Exception as e:
+            self._fail(entry_ids, e)
+            return
+
+        # 분석한 텍스트를 함께 넘겨 그 사이 수정된 내용에 이전 결과가 저장되지 않게 함
+        results = {
+            entry_id: (contents[entry_id], analysis) for entry_id, analysis in zip(entry_ids, analyses)
+        }
+        try:
+            await loop.run_in_executor(self._executor, self._save_results, results)
+        finally:
+            # 저장했거나 실패로 기록한 작업만 확인 (그 전에 종료되면 requeue_stale이 복구)
+            self.backend.ack(entry_ids)
+
+    def _fail(self, entry_ids: List[int], error: Exception):
+        """결과를 저장하기 전에 실패한 배치를 실패로 기록하고 확인 (처리 중 상태로 남지 않게 함)"""
+        logger.error(f"감정 분석 배치 처리 실패 ({len(entry_ids)}개 일기): {error}")
+        for entry_id in entry_ids:
+            self.backend.set_status(entry_id, FAILED)
+        self.failed += len(entry_ids)
+        self.backend.ack(entry_ids)
+
+    def _load_contents(self, entry_ids: List[int]) -> Dict[int, str]:
+        """분석이 필요한 일기 내용 (내용과 모델 버전이 그대로인 일기는 제외)"""
+        from .emotion_records import find_reusable_emotions
+
+        db = self.session_factory()
+        try:
+            entries = db.query(Entry).filter(Entry.id.in_(entry_ids)).all()
+            reusable = find_reusable_emotions(db, entries)
+            return {entry.id: entry.content for entry in entries if entry.id not in reusable}
+        finally:
+            db.close()
+
+    def _save_results(self, results: Dict[int, Tuple[str, object]]):
+        """(분석한 내용, 결과)를 저장, 분석 중 내용이 바뀐 일기는 저장하지 않고 다시 등록"""
+        from .emotion_records import add_emotion_record
+
+        db = self.session_factory()
+        try:
+            entries = {entry.id: entry for entry in db.query(Entry).filter(Entry.id.in_(list(results))).all()}
+            saved, changed = [], []
+            for entry_id, (content, analysis) in results.items():
+                entry = entries.get(entry_id)
+                if entry is None:
+                    self.backend.set_status(entry_id, None)
+                elif isinstance(analysis, Exception):
+                    logger.error(f"일기 {entry_id} 감정 분석 실패: {analysis}")
+                    self.backend.set_status(entry_id, FAILED)
+                    self.failed += 1
+                elif text_fingerprint(entry.content) != text_fingerprint(content):
+                    changed.append(entry_id)
+                else:
+                    add_emotion_record(db, entry, analysis, content)
+                    saved.append(entry_id)
+            db.commit()
+        except Exception:
+            db.rollback()
+            for entry_id in results:
+                self.backend.set_status(entry_id, FAILED)
+            self.failed += len(results)
+            raise
+        finally:
+            db.close()
+
+        for entry_id in saved:
+            # 이후 수정으로 다시 등록된 경우가 아니면 완료 처리
+            if self.backend.get_status(entry_id) == PROCESSING:
+                self.backend.set_status(entry_id, None)
+        for entry_id in changed:
+            # 수정 시 이미 다시 등록되었으면 그대로 대기 (push가 중복을 무시)
+            self.enqueue(entry_id)
+        self.processed += len(saved)
+        logger.info(f"백그라운드 감정 분석 완료: {len(saved)}개 일기")
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "backend": type(self.backend).__name__,
+            "batch_size": self.batch_size,
+            "running": self._worker is not None and not self._worker.done(),
+            "processed": self.processed,
+            "failed": self.failed,
+            "requeued": self.requeued,
+        }
+
+
+_analysis_queue: Optional[AnalysisQueue] = None
+
+
+def get_analysis_queue() -> AnalysisQueue:
+    """분석 작업 큐 싱글톤 인스턴스 반환"""
+    global _analysis_queue
+    if _analysis_queue is None:
+        if settings.ANALYSIS_QUEUE_BACKEND == "redis":
+            backend = RedisQueueBackend(settings.REDIS_URL)
+        else:
+            backend = InMemoryQueueBackend()
+        _analysis_queue = AnalysisQueue(
+            backend,
+            batch_size=settings.ANALYSIS_QUEUE_BATCH_SIZE,
+            poll_timeout=settings.ANALYSIS_QUEUE_POLL_TIMEOUT,
+            visibility_timeout=settings.ANALYSIS_QUEUE_VISIBILITY_TIMEOUT
+        )
+    return _analysis_queue
@@ -0,0 +1,122 @@
+"""
+동적 마이크로 배칭 스케줄러
+- 짧은 대기 시간 동안 동시 요청을 모아 한 번에 처리
+- 배치 결과를 각 요청의 future로 돌려줌
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from loguru import logger
+
+
+class MicroBatcher:
+    """동시 요청을 모아 배치 함수 한 번으로 처리하는 스케줄러"""
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0,
+        executor: Optional[Executor] = None,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max(max_wait_ms, 0.0) / 1000.0
+        self.executor = executor
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        self.batches_processed = 0
+        self.items_processed = 0
+
+    async def submit(self, item: Any) -> Any:
+        """요청 하나를 큐에 넣고 배치 처리 결과를 기다림"""
+        loop = asyncio.get_running_loop()
+        self._ensure_worker(loop)
+
+        future = loop.create_future()
+        self._queue.put_nowait((item, future))
+        return await future
+
+    def _ensure_worker(self, loop: asyncio.AbstractEventLoop):
+        """현재 이벤트 루프에서 동작하는 워커 태스크 보장"""
+        if self._worker is not None and self._loop is loop and not self._worker.done():
+            return
+
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._worker = loop.create_task(self._run())
+
+    async def _run(self):
+        """큐에서 요청을 모아 배치 단위로 처리"""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                # 이미 도착한 요청은 대기 없이 바로 가져옴
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._process(batch)
+
+    async def _process(self, batch: List[Tuple[Any, asyncio.Future]]):
+        """배치 함수를 실행하고 각 future에 결과 전달"""
+        # 클라이언트가 끊겨 취소된 요청은 제외
+        batch = [(item, future) for item, future in batch if not future.done()]
+        if not batch:
+            return
+
+        items = [item for item, _ in batch]
+        loop = asyncio.get_running_loop()
+
+        try:
+            results = await loop.run_in_executor(self.executor, self.batch_fn, items)
+            if len(results) != len(items):
+                raise RuntimeError(
+                    f"batch_fn returned {len(results)} results for {len(items)} items"
+                )
+        except Exception as e:
+            logger.error(f"배치 처리 오류 (size={len(items)}): {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.batches_processed += 1
+        self.items_processed += len(items)
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        """배치 처리 통계"""
+        avg_batch_size = (
+            self.items_processed / self.batches_processed if self.batches_processed else 0.0
+        )
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000.0,
+            "batches_processed": self.batches_processed,
+            "items_processed": self.items_processed,
+            "avg_batch_size": round(avg_batch_size, 2),
+            "queue_size": self._queue.qsize() if self._queue is not None else 0,
+        }
@@ -0,0 +1,68 @@
+"""
+감정 분석 결과를 Emotion 행으로 저장
+- 동기 분석 엔드포인트와 백그라운드 분석 워커가 함께 사용
+- 일기 내용 지문(content_hash)과 모델 버전이 같으면 기존 결과를 재사용
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+from sqlalchemy.orm import Session
+
+from ..cache import text_fingerprint
+from ..config import settings
+from ..models import Emotion, Entry
+
+
+def find_reusable_emotions(db: Session, entries: List[Entry]) -> Dict[int, Emotion]:
+    """현재 내용과 모델 버전으로 이미 분석된 일기의 최신 결과 (entry_id -> Emotion)"""
+    if not entries:
+        return {}
+
+    fingerprints = {entry.id: text_fingerprint(entry.content) for entry in entries}
+    candidates = (
+        db.query(Emotion)
+        .filter(
+            Emotion.entry_id.in_(list(fingerprints)),
+            Emotion.content_hash.in_(set(fingerprints.values())),
+            Emotion.model_version == settings.MODEL_VERSION
+        )
+        .order_by(Emotion.created_at.desc(), Emotion.id.desc())
+        .all()
+    )
+
+    reusable: Dict[int, Emotion] = {}
+    for emotion in candidates:
+        if emotion.content_hash == fingerprints[emotion.entry_id]:
+            reusable.setdefault(emotion.entry_id, emotion)
+    return reusable
+
+
+def add_emotion_record(db: Session, entry: Entry, emotion_result: Dict[str, Any],
+                       content: Optional[str] = None) -> Emotion:
+    """분석 결과를 세션에 추가 (커밋은 호출자가 수행)
+
+    content는 실제로 분석한 텍스트로, 지문은 현재 일기 내용이 아니라 이 텍스트로 계산
+    (기본값: 현재 일기 내용)
+    """
+    from .kobert_emotion_service import get_kobert_analyzer
+
+    if content is None:
+        content = entry.content
+
+    # 윈도우 단위로 분석된 긴 일기는 구간별 감정을 함께 보관
+    segments = emotion_result.get("segments")
+    analyzed_text = json.dumps(segments, ensure_ascii=False) if segments else content
+
+    # fallback 결과는 지문을 남기지 않아 다음 요청에서 다시 분석
+    reusable = get_kobert_analyzer().is_cacheable(emotion_result)
+
+    db_emotion = Emotion(
+        entry_id=entry.id,
+        emotion_type=emotion_result["emotion_type"],
+        confidence_score=emotion_result["confidence_score"],
+        analyzed_text=analyzed_text,
+        model_version=settings.MODEL_VERSION,
+        content_hash=text_fingerprint(content) if reusable else None
+    )
+    db.add(db_emotion)
+    return db_emotion
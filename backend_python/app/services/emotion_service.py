@@ -1,7 +1,8 @@
 import re
 from typing import Dict, Any
 from loguru import logger
-import numpy as np
+
+from .lexicon import KeywordLexicon
 
 class EmotionAnalyzer:
     def __init__(self):
@@ -40,6 +41,7 @@ class EmotionAnalyzer:
                 "할만", "적당", "무난", "평소", "항상", "언제나", "매일", "계속", "반복"
             ]
         }
+        self.lexicon = KeywordLexicon(self.emotion_keywords)
         
     def preprocess_text(self, text: str) -> str:
         """텍스트 전처리"""
@@ -54,15 +56,12 @@ class EmotionAnalyzer:
         preprocessed_text = self.preprocess_text(text)
         emotion_scores = {}
         
-        for emotion, keywords in self.emotion_keywords.items():
-            score = 0
-            for keyword in keywords:
-                # 키워드가 텍스트에 포함된 횟수
-                count = preprocessed_text.count(keyword)
-                score += count
-            
-            # 텍스트 길이로 정규화
-            text_length = len(preprocessed_text.split())
+        # 키워드가 텍스트에 포함된 횟수 (한 번의 스캔으로 모든 감정 계산)
+        keyword_counts = self.lexicon.count(preprocessed_text)
+        
+        # 텍스트 길이로 정규화
+        text_length = len(preprocessed_text.split())
+        for emotion, score in keyword_counts.items():
             if text_length > 0:
                 emotion_scores[emotion] = score / text_length
             else:
@@ -0,0 +1,53 @@
+"""
+추론 전용 크기 제한 실행기
+- CPU를 많이 쓰는 모델 추론을 이벤트 루프 밖의 전용 스레드에서 실행
+- 대기 중인 요청 수가 한도를 넘으면 즉시 거절 (backpressure)
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, Dict
+
+from ..exceptions import ServiceUnavailableError
+
+
+class InferencePool:
+    """추론 작업용 스레드 풀과 대기열 한도"""
+
+    def __init__(self, max_workers: int = 1, max_pending: int = 64):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="inference")
+
+        # 이벤트 루프 스레드에서만 변경됨
+        self.pending = 0
+        self.rejected = 0
+
+    @contextmanager
+    def reserve(self):
+        """대기열 자리를 확보 (가득 차면 503)"""
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise ServiceUnavailableError("Emotion analysis is busy, please retry shortly")
+
+        self.pending += 1
+        try:
+            yield
+        finally:
+            self.pending -= 1
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """함수를 추론 스레드에서 실행하고 결과를 기다림"""
+        with self.reserve():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, partial(fn, *args))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "rejected": self.rejected,
+        }
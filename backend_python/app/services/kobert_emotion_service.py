@@ -1,16 +1,32 @@
 """
 학습된 KoBERT 모델을 사용한 감정 분석 서비스
 기존의 규칙 기반 분석기를 대체
+- torch/transformers는 모델을 실제로 로드할 때 import (API 기동 시간 단축)
+- MODEL_WARMUP 모드에 따라 기동 시/백그라운드/첫 요청 시 모델 로드
 """
 
-import torch
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
 import numpy as np
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from loguru import logger
+import asyncio
+import copy
 import os
+import re
+import threading
+import time
 from pathlib import Path
 
+from ..cache import TTLCache, make_redis_tier, text_fingerprint
+from ..config import settings
+from ..exceptions import ServiceUnavailableError
+from .batching import MicroBatcher
+from .inference_pool import InferencePool
+from .lexicon import KeywordLexicon
+from .onnx_backend import default_onnx_path
+
+# 문장 경계: 문장부호 뒤 공백 또는 줄바꿈
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?。？！])\s+|\n+")
+
 class KoBERTEmotionAnalyzer:
     """KoBERT 기반 감정 분석기"""
     
@@ -24,11 +40,25 @@ class KoBERTEmotionAnalyzer:
         6: "혐오"
     }
     
-    def __init__(self, model_path: str = "models/kobert_emotion"):
+    # 규칙 기반 fallback 키워드 사전 (클래스 로드 시 한 번만 컴파일)
+    RULE_KEYWORDS = {
+        "기쁨": ["기쁘", "행복", "좋", "웃", "즐거", "신나", "만족", "성공", "사랑", "고마워"],
+        "슬픔": ["슬프", "우울", "힘들", "아프", "괴로", "눈물", "울", "실망", "좌절", "외로"],
+        "분노": ["화", "짜증", "분노", "열받", "빡치", "싫", "미워", "증오", "억울", "불만"],
+        "두려움": ["무서", "두려", "걱정", "불안", "긴장", "떨", "공포", "위험", "조심"],
+        "놀라움": ["놀라", "깜짝", "의외", "갑자기", "예상외", "충격", "발견", "처음"],
+        "혐오": ["더러", "역겨", "싫", "혐오", "구역", "토", "못참", "지겨"],
+        "중립": ["그냥", "평범", "보통", "일반", "무난", "평소"]
+    }
+    RULE_LEXICON = KeywordLexicon(RULE_KEYWORDS)
+    
+    def __init__(self, model_path: str = "models/kobert_emotion", backend: Optional[str] = None):
         self.model_path = model_path
+        self.backend = (backend or settings.INFERENCE_BACKEND).lower()
         self.tokenizer = None
         self.model = None
-        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        # PyTorch 백엔드를 로드할 때 실제 장치로 결정
+        self.device = "cpu"
         
         # 모델 로드 시도
         if self._model_exists():
@@ -37,17 +67,43 @@ class KoBERTEmotionAnalyzer:
             logger.warning(f"KoBERT 모델을 찾을 수 없습니다: {model_path}")
             logger.info("규칙 기반 분석기를 사용합니다.")
     
+    def _onnx_path(self) -> Path:
+        """양자화 ONNX 모델 경로"""
+        if settings.ONNX_MODEL_PATH:
+            return Path(settings.ONNX_MODEL_PATH)
+        return default_onnx_path(self.model_path)
+    
     def _model_exists(self) -> bool:
         """모델 파일 존재 확인"""
         model_path = Path(self.model_path)
-        return (model_path / "pytorch_model.bin").exists() and (model_path / "tokenizer.json").exists()
+        if not (model_path / "tokenizer.json").exists():
+            return False
+        if self.backend == "onnx" and self._onnx_path().exists():
+            return True
+        # safetensors 또는 PyTorch 체크포인트
+        return (model_path / "model.safetensors").exists() or (model_path / "pytorch_model.bin").exists()
     
     def _load_model(self):
         """모델과 토크나이저 로드"""
         try:
-            logger.info(f"KoBERT 모델 로딩: {self.model_path}")
+            logger.info(f"KoBERT 모델 로딩: {self.model_path} (Backend: {self.backend})")
+            
+            from transformers import AutoTokenizer, AutoModelForSequenceClassification
             
             self.tokenizer = AutoTokenizer.from_pretrained(self.model_path)
+            
+            if self.backend == "onnx":
+                try:
+                    self._load_onnx_model()
+                    logger.info(f"KoBERT ONNX 모델 로딩 완료: {self.model.onnx_path}")
+                    return
+                except Exception as e:
+                    logger.error(f"ONNX 백엔드 로딩 실패, PyTorch 백엔드로 전환합니다: {e}")
+                    self.backend = "pytorch"
+            
+            import torch
+            
+            self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
             self.model = AutoModelForSequenceClassification.from_pretrained(self.model_path)
             self.model.to(self.device)
             self.model.eval()
@@ -59,81 +115,210 @@ class KoBERTEmotionAnalyzer:
             self.tokenizer = None
             self.model = None
     
+    def _load_onnx_model(self):
+        """양자화 ONNX 모델 로드 (없으면 체크포인트에서 내보내기)"""
+        from .onnx_backend import ONNXEmotionModel, export_quantized_onnx
+        
+        onnx_path = self._onnx_path()
+        if not onnx_path.exists():
+            export_quantized_onnx(self.model_path, str(onnx_path))
+        
+        self.model = ONNXEmotionModel(str(onnx_path), num_threads=settings.ONNX_NUM_THREADS)
+    
+    @property
+    def model_identity(self) -> str:
+        """캐시 키에 쓰이는 모델 식별자 (모델 버전 + 실제 추론 경로)"""
+        if self.model is None:
+            return f"{settings.MODEL_VERSION}:rules"
+        return f"{settings.MODEL_VERSION}:{self.backend}:{settings.LONG_TEXT_MODE}"
+    
+    def is_cacheable(self, result: Dict[str, Any]) -> bool:
+        """모델 오류로 인한 fallback 결과는 캐시하지 않음"""
+        model_type = result.get("model_type")
+        if model_type == "error_fallback":
+            return False
+        return not (self.model is not None and model_type == "rule_based")
+    
     def predict(self, text: str) -> Dict[str, Any]:
         """감정 예측"""
-        if not text or not text.strip():
-            return {
-                "emotion_type": "중립",
-                "confidence_score": 0.5,
-                "all_emotions": {"중립": 0.5}
-            }
-        
-        # KoBERT 모델이 로드되어 있으면 사용
-        if self.model is not None and self.tokenizer is not None:
-            return self._predict_with_kobert(text)
-        else:
-            # fallback: 규칙 기반 분석
-            return self._predict_with_rules(text)
+        return self.predict_batch([text])[0]
     
-    def _predict_with_kobert(self, text: str) -> Dict[str, Any]:
-        """KoBERT 모델로 예측"""
-        try:
-            # 토크나이징
-            inputs = self.tokenizer(
-                text,
-                return_tensors="pt",
-                truncation=True,
-                padding=True,
-                max_length=512
-            )
-            
-            # GPU로 이동
-            inputs = {key: value.to(self.device) for key, value in inputs.items()}
-            
-            # 예측
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-                predictions = torch.nn.functional.softmax(outputs.logits, dim=-1)
-                predictions = predictions.cpu().numpy()[0]
+    def predict_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """여러 텍스트 감정 예측 (한 번의 forward pass)"""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        pending = []
+        
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                results[i] = {
+                    "emotion_type": "중립",
+                    "confidence_score": 0.5,
+                    "all_emotions": {"중립": 0.5}
+                }
+            else:
+                pending.append(i)
+        
+        if pending:
+            pending_texts = [texts[i] for i in pending]
             
-            # 결과 파싱
-            emotion_probs = {self.EMOTIONS[i]: float(predictions[i]) for i in range(len(predictions))}
+            # KoBERT 모델이 로드되어 있으면 사용
+            if self.model is not None and self.tokenizer is not None:
+                predictions = self._predict_with_kobert(pending_texts)
+            else:
+                # fallback: 규칙 기반 분석
+                predictions = [self._predict_with_rules(text) for text in pending_texts]
             
-            # 가장 높은 확률의 감정
-            best_emotion_idx = np.argmax(predictions)
-            best_emotion = self.EMOTIONS[best_emotion_idx]
-            confidence = float(predictions[best_emotion_idx])
+            for i, prediction in zip(pending, predictions):
+                results[i] = prediction
+        
+        return results
+    
+    def _predict_with_kobert(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """KoBERT 모델로 예측 (배치 내 가장 긴 텍스트 길이로 패딩)"""
+        try:
+            if settings.LONG_TEXT_MODE == "chunked":
+                return self._predict_chunked(texts)
             
-            return {
-                "emotion_type": best_emotion,
-                "confidence_score": confidence,
-                "all_emotions": emotion_probs,
-                "model_type": "kobert"
-            }
+            predictions = self._forward(texts)
+            return [self._parse_probabilities(row) for row in predictions]
             
         except Exception as e:
             logger.error(f"KoBERT 예측 오류: {e}")
             # fallback to rule-based
-            return self._predict_with_rules(text)
+            return [self._predict_with_rules(text) for text in texts]
     
-    def _predict_with_rules(self, text: str) -> Dict[str, Any]:
-        """규칙 기반 예측 (fallback)"""
-        emotion_keywords = {
-            "기쁨": ["기쁘", "행복", "좋", "웃", "즐거", "신나", "만족", "성공", "사랑", "고마워"],
-            "슬픔": ["슬프", "우울", "힘들", "아프", "괴로", "눈물", "울", "실망", "좌절", "외로"],
-            "분노": ["화", "짜증", "분노", "열받", "빡치", "싫", "미워", "증오", "억울", "불만"],
-            "두려움": ["무서", "두려", "걱정", "불안", "긴장", "떨", "공포", "위험", "조심"],
-            "놀라움": ["놀라", "깜짝", "의외", "갑자기", "예상외", "충격", "발견", "처음"],
-            "혐오": ["더러", "역겨", "싫", "혐오", "구역", "토", "못참", "지겨"],
-            "중립": ["그냥", "평범", "보통", "일반", "무난", "평소"]
-        }
+    def _predict_chunked(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """문장 단위 윈도우로 나눠 모든 윈도우를 예측한 뒤 텍스트별로 집계"""
+        windows_per_text = [self._split_windows(text) for text in texts]
+        flat_windows = [window for windows in windows_per_text for window, _ in windows]
+        
+        # 윈도우 길이로만 패딩되므로 짧은 텍스트가 512 토큰까지 패딩되지 않음
+        # 아주 긴 글도 윈도우를 버리지 않고 CHUNK_WINDOW_BATCH_SIZE개씩 나눠 forward (메모리 제한)
+        batch_size = max(settings.CHUNK_WINDOW_BATCH_SIZE, 1)
+        probabilities = np.concatenate([
+            self._forward(flat_windows[start:start + batch_size], max_length=settings.CHUNK_MAX_TOKENS + 2)
+            for start in range(0, len(flat_windows), batch_size)
+        ])
+        
+        results = []
+        offset = 0
+        for windows in windows_per_text:
+            window_probs = probabilities[offset:offset + len(windows)]
+            offset += len(windows)
+            results.append(self._aggregate_windows(windows, window_probs))
+        
+        return results
+    
+    def _split_windows(self, text: str) -> List[Tuple[str, int]]:
+        """문장 경계를 유지하며 CHUNK_MAX_TOKENS 이하의 윈도우로 분할 (윈도우, 토큰 수)"""
+        max_tokens = settings.CHUNK_MAX_TOKENS
+        sentences = [sentence.strip() for sentence in SENTENCE_BOUNDARY.split(text) if sentence and sentence.strip()]
+        if not sentences:
+            return [(text, 1)]
+        
+        pieces = []
+        for sentence, ids, offsets in self._tokenize_sentences(sentences):
+            if len(ids) <= max_tokens:
+                pieces.append((sentence, max(len(ids), 1)))
+                continue
+            # 한 문장이 윈도우보다 길면 토큰 경계에서 max_tokens씩 나눔 (잘려 버려지는 부분 없음)
+            for start in range(0, len(ids), max_tokens):
+                end = min(start + max_tokens, len(ids))
+                if offsets is not None:
+                    piece = sentence[offsets[start][0]:offsets[end - 1][1]]
+                else:
+                    piece = self.tokenizer.decode(ids[start:end])
+                pieces.append((piece.strip() or piece, end - start))
+        
+        windows = []
+        current, current_tokens = [], 0
+        for piece, n_tokens in pieces:
+            if current and current_tokens + n_tokens > max_tokens:
+                windows.append((" ".join(current), current_tokens))
+                current, current_tokens = [], 0
+            current.append(piece)
+            current_tokens += n_tokens
+        if current:
+            windows.append((" ".join(current), current_tokens))
+        
+        return [(window, min(n_tokens, max_tokens)) for window, n_tokens in windows]
+    
+    def _tokenize_sentences(self, sentences: List[str]) -> List[Tuple[str, List[int], Optional[List[Tuple[int, int]]]]]:
+        """문장별 (문장, 토큰 id, 문자 오프셋) - 오프셋은 fast 토크나이저에서만 (없으면 None)"""
+        if getattr(self.tokenizer, "is_fast", False):
+            encoded = self.tokenizer(sentences, add_special_tokens=False, return_offsets_mapping=True)
+            return list(zip(sentences, encoded["input_ids"], encoded["offset_mapping"]))
+        encoded = self.tokenizer(sentences, add_special_tokens=False)
+        return [(sentence, ids, None) for sentence, ids in zip(sentences, encoded["input_ids"])]
+    
+    def _aggregate_windows(self, windows: List[Tuple[str, int]], window_probs: np.ndarray) -> Dict[str, Any]:
+        """윈도우별 확률을 토큰 수로 가중 평균해 텍스트 단위 결과 생성"""
+        weights = np.array([n_tokens for _, n_tokens in windows], dtype=np.float64)
+        result = self._parse_probabilities(np.average(window_probs, axis=0, weights=weights))
+        
+        if len(windows) > 1:
+            result["segments"] = [
+                {
+                    "text": window,
+                    "emotion_type": segment["emotion_type"],
+                    "confidence_score": segment["confidence_score"]
+                }
+                for (window, _), segment in zip(windows, map(self._parse_probabilities, window_probs))
+            ]
+        
+        return result
+    
+    def _forward(self, texts: List[str], max_length: int = 512) -> np.ndarray:
+        """선택된 백엔드로 forward pass 후 감정별 확률 반환"""
+        if self.backend == "onnx":
+            inputs = self.tokenizer(
+                texts,
+                return_tensors="np",
+                truncation=True,
+                padding=True,
+                max_length=max_length
+            )
+            return self.model.predict_proba(inputs)
+        
+        import torch
+        
+        # 토크나이징
+        inputs = self.tokenizer(
+            texts,
+            return_tensors="pt",
+            truncation=True,
+            padding=True,
+            max_length=max_length
+        )
         
-        emotion_scores = {}
-        text_lower = text.lower()
+        # GPU로 이동
+        inputs = {key: value.to(self.device) for key, value in inputs.items()}
         
-        for emotion, keywords in emotion_keywords.items():
-            score = sum(text_lower.count(keyword) for keyword in keywords)
-            emotion_scores[emotion] = score
+        # 예측
+        with torch.no_grad():
+            outputs = self.model(**inputs)
+            predictions = torch.nn.functional.softmax(outputs.logits, dim=-1)
+            return predictions.cpu().numpy()
+    
+    def _parse_probabilities(self, probabilities: np.ndarray) -> Dict[str, Any]:
+        """확률 벡터를 결과 형식으로 변환"""
+        emotion_probs = {self.EMOTIONS[i]: float(probabilities[i]) for i in range(len(probabilities))}
+        
+        # 가장 높은 확률의 감정
+        best_emotion_idx = int(np.argmax(probabilities))
+        best_emotion = self.EMOTIONS[best_emotion_idx]
+        confidence = float(probabilities[best_emotion_idx])
+        
+        return {
+            "emotion_type": best_emotion,
+            "confidence_score": confidence,
+            "all_emotions": emotion_probs,
+            "model_type": "kobert_onnx" if self.backend == "onnx" else "kobert"
+        }
+    
+    def _predict_with_rules(self, text: str) -> Dict[str, Any]:
+        """규칙 기반 예측 (fallback)"""
+        emotion_scores = self.RULE_LEXICON.count(text.lower())
         
         # 정규화
         total_score = sum(emotion_scores.values())
@@ -158,39 +343,235 @@ class KoBERTEmotionAnalyzer:
 
 # 전역 분석기 인스턴스
 _kobert_analyzer = None
+_batcher = None
+_result_cache = None
+_inference_pool = None
+_analyzer_lock = threading.Lock()
 
 def get_kobert_analyzer():
-    """KoBERT 분석기 싱글톤 인스턴스 반환"""
+    """KoBERT 분석기 싱글톤 인스턴스 반환 (워밍업과 요청이 겹쳐도 한 번만 로드)"""
     global _kobert_analyzer
     if _kobert_analyzer is None:
-        _kobert_analyzer = KoBERTEmotionAnalyzer()
-        logger.info("KoBERT 감정 분석기 초기화 완료")
+        with _analyzer_lock:
+            if _kobert_analyzer is None:
+                _kobert_analyzer = KoBERTEmotionAnalyzer()
+                logger.info("KoBERT 감정 분석기 초기화 완료")
     return _kobert_analyzer
 
+# 모델 워밍업 상태 (readiness 판단용)
+WARMUP_MODES = ("eager", "background", "lazy")
+_warmup = {"mode": None, "state": "pending", "seconds": None, "error": None}
+
+def warm_up_model():
+    """모델 로드 후 샘플 문장으로 한 번 추론 (첫 요청 지연 제거)"""
+    start = time.perf_counter()
+    _warmup["state"] = "running"
+    try:
+        get_kobert_analyzer().predict("오늘은 평범한 하루였다")
+        _warmup["state"] = "ready"
+    except Exception as e:
+        logger.error(f"모델 워밍업 실패: {e}")
+        _warmup.update(state="failed", error=str(e))
+    _warmup["seconds"] = round(time.perf_counter() - start, 3)
+    logger.info(f"모델 워밍업 종료 ({_warmup['state']}, {_warmup['seconds']}s)")
+
+async def start_warmup(mode: str):
+    """기동 시 워밍업 시작
+
+    - eager: 워밍업이 끝난 뒤 요청을 받기 시작
+    - background: 요청을 먼저 받고 추론 스레드에서 워밍업 (끝날 때까지 not ready)
+    - lazy: 첫 분석 요청에서 로드 (즉시 ready)
+    """
+    mode = mode.lower()
+    if mode not in WARMUP_MODES:
+        raise ValueError(f"Unknown MODEL_WARMUP mode: {mode}")
+    _warmup["mode"] = mode
+    if mode == "lazy":
+        _warmup["state"] = "ready"
+        return
+
+    # 추론 스레드에서 실행해 같은 스레드를 쓰는 분석 요청이 워밍업 뒤에 처리되도록 함
+    future = asyncio.get_running_loop().run_in_executor(get_inference_pool().executor, warm_up_model)
+    if mode == "eager":
+        await future
+
+def readiness() -> Dict[str, Any]:
+    """트래픽을 받을 준비가 되었는지 (실패 시에도 규칙 기반 분석으로 서비스 가능)"""
+    return dict(_warmup, ready=_warmup["state"] in ("ready", "failed"))
+
+def get_inference_pool() -> InferencePool:
+    """추론 전용 실행기 싱글톤 인스턴스 반환"""
+    global _inference_pool
+    if _inference_pool is None:
+        _inference_pool = InferencePool(
+            max_workers=settings.INFERENCE_WORKERS,
+            max_pending=settings.INFERENCE_MAX_PENDING
+        )
+    return _inference_pool
+
+def get_batcher() -> MicroBatcher:
+    """추론 마이크로 배처 싱글톤 인스턴스 반환"""
+    global _batcher
+    if _batcher is None:
+        analyzer = get_kobert_analyzer()
+        _batcher = MicroBatcher(
+            analyzer.predict_batch,
+            max_batch_size=settings.INFERENCE_BATCH_MAX_SIZE,
+            max_wait_ms=settings.INFERENCE_BATCH_MAX_WAIT_MS,
+            executor=get_inference_pool().executor
+        )
+        logger.info(
+            f"추론 배처 초기화 완료 (max_batch_size={settings.INFERENCE_BATCH_MAX_SIZE}, "
+            f"max_wait_ms={settings.INFERENCE_BATCH_MAX_WAIT_MS})"
+        )
+    return _batcher
+
+def get_result_cache() -> Optional[TTLCache]:
+    """분석 결과 캐시 싱글톤 인스턴스 반환 (비활성화 시 None)"""
+    global _result_cache
+    if _result_cache is None and settings.RESULT_CACHE_ENABLED:
+        ttl = settings.RESULT_CACHE_TTL_SECONDS
+        _result_cache = TTLCache(
+            maxsize=settings.RESULT_CACHE_MAXSIZE,
+            ttl=ttl,
+            redis_tier=make_redis_tier("emotion-result", ttl)
+        )
+        logger.info(f"분석 결과 캐시 초기화 완료 (maxsize={settings.RESULT_CACHE_MAXSIZE}, ttl={ttl})")
+    return _result_cache
+
+def _lookup_cached_result(analyzer: KoBERTEmotionAnalyzer, text: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """캐시 키와 캐시된 결과 반환"""
+    cache = get_result_cache()
+    if cache is None:
+        return None, None
+    
+    key = f"{analyzer.model_identity}:{text_fingerprint(text)}"
+    cached = cache.get(key)
+    return key, copy.deepcopy(cached) if cached is not None else None
+
+def _store_result(analyzer: KoBERTEmotionAnalyzer, key: Optional[str], result: Dict[str, Any]):
+    """캐시 가능한 결과 저장"""
+    if key is not None and analyzer.is_cacheable(result):
+        get_result_cache().set(key, copy.deepcopy(result))
+
+def _error_fallback_result() -> Dict[str, Any]:
+    """오류 시 기본값"""
+    return {
+        "emotion_type": "중립",
+        "confidence_score": 0.5,
+        "all_emotions": {"중립": 0.5},
+        "model_type": "error_fallback"
+    }
+
 def analyze_emotion(text: str) -> Dict[str, Any]:
     """감정 분석 함수 (업데이트된 버전)"""
     try:
         analyzer = get_kobert_analyzer()
+        key, cached = _lookup_cached_result(analyzer, text)
+        if cached is not None:
+            return cached
+        
         result = analyzer.predict(text)
+        _store_result(analyzer, key, result)
         logger.debug(f"감정 분석 결과: {result}")
         return result
     except Exception as e:
         logger.error(f"감정 분석 오류: {str(e)}")
         # 오류 시 기본값 반환
-        return {
-            "emotion_type": "중립",
-            "confidence_score": 0.5,
-            "all_emotions": {"중립": 0.5},
-            "model_type": "error_fallback"
-        }
+        return _error_fallback_result()
+
+async def analyze_emotion_async(text: str) -> Dict[str, Any]:
+    """감정 분석 함수 (비동기, 추론은 전용 실행기에서 수행)
+    
+    배칭이 켜져 있으면 동시 요청을 마이크로 배치로 묶어 처리하고,
+    대기 중인 요청이 INFERENCE_MAX_PENDING을 넘으면 ServiceUnavailableError를 발생시킴
+    """
+    try:
+        analyzer = get_kobert_analyzer()
+        key, cached = _lookup_cached_result(analyzer, text)
+        if cached is not None:
+            return cached
+        
+        pool = get_inference_pool()
+        if settings.INFERENCE_BATCHING:
+            with pool.reserve():
+                result = await get_batcher().submit(text)
+        else:
+            result = await pool.run(analyzer.predict, text)
+        
+        _store_result(analyzer, key, result)
+        logger.debug(f"감정 분석 결과: {result}")
+        return result
+    except ServiceUnavailableError:
+        raise
+    except Exception as e:
+        logger.error(f"감정 분석 오류: {str(e)}")
+        return _error_fallback_result()
+
+async def analyze_emotions_batch(texts: List[str]) -> List[Any]:
+    """여러 텍스트를 한 번의 배치 추론으로 분석
+    
+    입력 순서대로 결과를 반환하며, 분석에 실패한 항목은 결과 대신 예외 객체가 들어감
+    """
+    analyzer = get_kobert_analyzer()
+    pool = get_inference_pool()
+    
+    results: List[Any] = [None] * len(texts)
+    keys: List[Optional[str]] = [None] * len(texts)
+    misses: Dict[str, List[int]] = {}
+    
+    for i, text in enumerate(texts):
+        keys[i], cached = _lookup_cached_result(analyzer, text)
+        if cached is not None:
+            results[i] = cached
+        else:
+            # 같은 텍스트는 한 번만 추론
+            misses.setdefault(text, []).append(i)
+    
+    if not misses:
+        return results
+    
+    unique_texts = list(misses)
+    try:
+        predictions = await pool.run(analyzer.predict_batch, unique_texts)
+    except ServiceUnavailableError:
+        raise
+    except Exception as e:
+        logger.error(f"배치 감정 분석 오류, 항목별로 재시도합니다: {e}")
+        predictions = []
+        for text in unique_texts:
+            try:
+                predictions.append(await pool.run(analyzer.predict, text))
+            except ServiceUnavailableError:
+                raise
+            except Exception as item_error:
+                predictions.append(item_error)
+    
+    for text, prediction in zip(unique_texts, predictions):
+        indices = misses[text]
+        if not isinstance(prediction, Exception):
+            _store_result(analyzer, keys[indices[0]], prediction)
+        for i in indices:
+            results[i] = prediction if isinstance(prediction, Exception) else copy.deepcopy(prediction)
+    
+    return results
 
 # 모델 로드 확인 함수
 def check_model_status():
     """모델 상태 확인"""
+    from .analysis_queue import get_analysis_queue
+
     analyzer = get_kobert_analyzer()
     return {
         "model_loaded": analyzer.model is not None,
         "model_path": analyzer.model_path,
+        "backend": analyzer.backend,
         "device": str(analyzer.device),
-        "available_emotions": list(analyzer.EMOTIONS.values())
+        "warmup": readiness(),
+        "available_emotions": list(analyzer.EMOTIONS.values()),
+        "model_version": settings.MODEL_VERSION,
+        "inference_pool": get_inference_pool().stats(),
+        "batching": get_batcher().stats() if settings.INFERENCE_BATCHING else None,
+        "result_cache": get_result_cache().stats() if settings.RESULT_CACHE_ENABLED else None,
+        "analysis_queue": get_analysis_queue().stats() if settings.ANALYSIS_QUEUE_ENABLED else None
     }
\ No newline at end of file
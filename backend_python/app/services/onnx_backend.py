@@ -0,0 +1,96 @@
+"""
+ONNX Runtime 기반 감정 분류 추론 백엔드
+- 학습된 KoBERT 체크포인트를 ONNX로 내보내고 int8 동적 양자화
+- GPU가 없는 환경에서 PyTorch fp32 대비 빠르고 가벼운 CPU 추론
+"""
+
+from pathlib import Path
+from typing import Dict, Optional
+import numpy as np
+from loguru import logger
+
+ONNX_FILENAME = "model.onnx"
+QUANTIZED_FILENAME = "model_quantized.onnx"
+
+
+def default_onnx_path(model_path: str) -> Path:
+    """체크포인트 경로 기준 양자화 ONNX 모델 기본 위치"""
+    return Path(model_path) / "onnx" / QUANTIZED_FILENAME
+
+
+def export_quantized_onnx(model_path: str, output_path: Optional[str] = None, opset: int = 14) -> Path:
+    """체크포인트를 ONNX로 내보낸 뒤 int8 동적 양자화"""
+    import torch
+    from transformers import AutoTokenizer, AutoModelForSequenceClassification
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    quantized_path = Path(output_path) if output_path else default_onnx_path(model_path)
+    quantized_path.parent.mkdir(parents=True, exist_ok=True)
+    fp32_path = quantized_path.parent / ONNX_FILENAME
+
+    logger.info(f"ONNX 내보내기 시작: {model_path} -> {fp32_path}")
+
+    tokenizer = AutoTokenizer.from_pretrained(model_path)
+    model = AutoModelForSequenceClassification.from_pretrained(model_path)
+    model.eval()
+
+    sample = tokenizer(["감정 분석 모델 내보내기"], return_tensors="pt")
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["logits"] = {0: "batch"}
+
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            tuple(sample[name] for name in input_names),
+            str(fp32_path),
+            input_names=input_names,
+            output_names=["logits"],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+            do_constant_folding=True,
+        )
+
+    quantize_dynamic(str(fp32_path), str(quantized_path), weight_type=QuantType.QInt8)
+    logger.info(f"int8 동적 양자화 완료: {quantized_path}")
+
+    return quantized_path
+
+
+class ONNXEmotionModel:
+    """양자화된 ONNX 감정 분류 모델"""
+
+    def __init__(self, onnx_path: str, num_threads: int = 0):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads > 0:
+            options.intra_op_num_threads = num_threads
+
+        self.onnx_path = str(onnx_path)
+        self.session = ort.InferenceSession(
+            self.onnx_path, sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = [node.name for node in self.session.get_inputs()]
+
+    def predict_proba(self, inputs: Dict[str, np.ndarray]) -> np.ndarray:
+        """토크나이저 출력(numpy)으로 감정별 확률 계산"""
+        feed = {name: inputs[name].astype(np.int64) for name in self.input_names if name in inputs}
+        logits = self.session.run(["logits"], feed)[0]
+
+        # softmax
+        logits = logits - logits.max(axis=-1, keepdims=True)
+        exp = np.exp(logits)
+        return exp / exp.sum(axis=-1, keepdims=True)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="KoBERT 체크포인트를 양자화된 ONNX 모델로 내보내기")
+    parser.add_argument("--model-path", default="models/kobert_emotion", help="학습된 체크포인트 경로")
+    parser.add_argument("--output", default=None, help="양자화 ONNX 출력 경로")
+    args = parser.parse_args()
+
+    export_quantized_onnx(args.model_path, args.output)
@@ -0,0 +1,101 @@
+"""
+비밀번호 해시/검증 전용 크기 제한 실행기
+- bcrypt 연산(요청당 100~300ms CPU)을 이벤트 루프와 요청 스레드풀 밖의 전용 스레드에서 실행
+  (bcrypt는 해시 중 GIL을 해제하므로 스레드로 병렬 처리됨)
+- 대기 중인 작업 수가 한도를 넘으면 즉시 503 (backpressure)
+- 같은 username에 대한 동시 검증 수를 제한해 반복 로그인 시도가 풀을 독점하지 못하게 함 (429)
+- 해시 비용은 BCRYPT_ROUNDS로 설정 (기존 해시는 저장된 비용으로 계속 검증됨)
+"""
+
+import asyncio
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+from passlib.context import CryptContext
+
+from ..config import settings
+from ..exceptions import ServiceUnavailableError, TooManyRequestsError
+
+
+class PasswordHasher:
+    """bcrypt 작업용 스레드 풀, 대기열 한도, 사용자별 동시 검증 한도"""
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 32, max_per_user: int = 2, rounds: int = 12):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.max_per_user = max_per_user
+        self.rounds = rounds
+        self.context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password")
+
+        # 요청 스레드와 이벤트 루프에서 함께 변경되므로 잠금으로 보호
+        self._lock = threading.Lock()
+        self._per_user: Dict[str, int] = defaultdict(int)
+        self.pending = 0
+        self.rejected = 0
+        self.rejected_per_user = 0
+
+    @contextmanager
+    def reserve(self, username: Optional[str] = None):
+        """대기열 자리와 사용자별 검증 자리를 확보"""
+        with self._lock:
+            if username is not None and self._per_user[username] >= self.max_per_user:
+                self.rejected_per_user += 1
+                raise TooManyRequestsError("Too many concurrent login attempts, please retry shortly")
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise ServiceUnavailableError("Authentication is busy, please retry shortly")
+            self.pending += 1
+            if username is not None:
+                self._per_user[username] += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.pending -= 1
+                if username is not None:
+                    self._per_user[username] -= 1
+                    if not self._per_user[username]:
+                        del self._per_user[username]
+
+    async def _run(self, fn: Callable[..., Any], *args: Any, username: Optional[str] = None) -> Any:
+        with self.reserve(username):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, partial(fn, *args))
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.context.hash, password)
+
+    async def verify(self, password: str, hashed_password: str, username: Optional[str] = None) -> bool:
+        return await self._run(self.context.verify, password, hashed_password, username=username)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "max_per_user": self.max_per_user,
+                "bcrypt_rounds": self.rounds,
+                "pending": self.pending,
+                "users_verifying": len(self._per_user),
+                "rejected": self.rejected,
+                "rejected_per_user": self.rejected_per_user,
+            }
+
+
+_password_hasher = None
+
+def get_password_hasher() -> PasswordHasher:
+    """비밀번호 실행기 싱글톤 인스턴스 반환"""
+    global _password_hasher
+    if _password_hasher is None:
+        _password_hasher = PasswordHasher(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+            max_per_user=settings.PASSWORD_VERIFY_MAX_PER_USER,
+            rounds=settings.BCRYPT_ROUNDS
+        )
+    return _password_hasher
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""
+인증 요청 처리량 벤치마크 (사용자 캐시 사용/미사용)
+- 임시 SQLite DB에 사용자를 만들고 발급한 토큰으로 /api/auth/me를 반복 호출
+- --db-latency-ms로 쿼리마다 지연을 넣어 네트워크 너머 DB(PostgreSQL 등)를 흉내냄
+- 요청 수, 초당 요청 수, p50/p99 지연, 사용자 SELECT 횟수 출력
+
+사용법:
+    python benchmarks/bench_auth_cache.py --users 200 --requests 5000 --db-latency-ms 1
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+
+def run(client, tokens, num_requests):
+    """토큰을 돌아가며 /api/auth/me 호출, (초당 요청 수, p50 ms, p99 ms)"""
+    timings = []
+    start = time.perf_counter()
+    for i in range(num_requests):
+        headers = {"Authorization": f"Bearer {tokens[i % len(tokens)]}"}
+        request_start = time.perf_counter()
+        response = client.get("/api/auth/me", headers=headers)
+        timings.append((time.perf_counter() - request_start) * 1000.0)
+        assert response.status_code == 200, response.text
+    elapsed = time.perf_counter() - start
+    timings.sort()
+    return num_requests / elapsed, statistics.median(timings), timings[int(len(timings) * 0.99) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="사용자 캐시 처리량 벤치마크")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--db-latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # 앱 설정을 읽기 전에 임시 DB와 벤치마크용 옵션 지정
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        os.environ["ANALYSIS_QUEUE_ENABLED"] = "False"
+        os.environ.setdefault("REDIS_URL", "")
+
+        from fastapi.testclient import TestClient
+        from sqlalchemy import event, insert
+
+        from app import principals
+        from app.config import settings
+        from app.database import Base, engine
+        from app.main import app
+        from app.models import User
+        from app.routers.auth import create_access_token
+
+        Base.metadata.create_all(bind=engine)
+        with engine.begin() as conn:
+            conn.execute(insert(User), [
+                {"email": f"user{i}@example.com", "username": f"user{i}", "hashed_password": "x"}
+                for i in range(args.users)
+            ])
+        tokens = [create_access_token({"sub": f"user{i}"}) for i in range(args.users)]
+
+        user_selects = []
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if "FROM users" in statement:
+                user_selects.append(statement)
+            if args.db_latency_ms:
+                time.sleep(args.db_latency_ms / 1000.0)
+
+        client = TestClient(app)
+        print(f"사용자 {args.users:,}명, 요청 {args.requests:,}건, 쿼리 지연 {args.db_latency_ms}ms")
+        print(f"\n{'모드':<12}{'req/s':>10}{'p50 (ms)':>10}{'p99 (ms)':>10}{'user SELECT':>13}")
+        for name, enabled in (("캐시 없음", False), ("캐시 사용", True)):
+            settings.PRINCIPAL_CACHE_ENABLED = enabled
+            principals._principal_cache = None
+            user_selects.clear()
+            # 토큰별 첫 요청(캐시 채우기)은 측정에서 제외
+            run(client, tokens, len(tokens))
+            user_selects.clear()
+            rps, p50, p99 = run(client, tokens, args.requests)
+            print(f"{name:<12}{rps:>10.0f}{p50:>10.3f}{p99:>10.3f}{len(user_selects):>13,}")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""
+API 콜드 스타트 측정 (MODEL_WARMUP 모드별)
+- 모드마다 새 uvicorn 프로세스를 띄우고 다음 시점까지 걸린 시간을 측정
+  live: /api/health 200 (요청 수신 시작), ready: /api/health/ready 200,
+  first analysis: 첫 /api/emotions/test 응답
+- 모드별 목표 시간(TARGETS)과 비교해 출력
+- 학습된 모델로 측정하려면 models/kobert_emotion이 있는 디렉토리를 --workdir로 지정
+  (기본값은 모델이 없는 임시 디렉토리 → 규칙 기반, import 비용만 측정)
+
+사용법:
+    python benchmarks/bench_cold_start.py --modes eager background lazy --workdir .
+"""
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 모드별 목표 (초): background/lazy는 모델 크기와 무관하게 빨리 요청을 받아야 함
+TARGETS = {
+    "eager": {"live": 30.0, "ready": 30.0},
+    "background": {"live": 3.0, "ready": 30.0},
+    "lazy": {"live": 3.0, "ready": 3.0},
+}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def request(url, data=None, timeout=60.0):
+    body = json.dumps(data).encode("utf-8") if data is not None else None
+    req = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+    except (urllib.error.URLError, ConnectionError, socket.timeout):
+        return None
+
+
+def wait_for(url, start, deadline):
+    while time.perf_counter() - start < deadline:
+        if request(url, timeout=1.0) == 200:
+            return time.perf_counter() - start
+        time.sleep(0.05)
+    return None
+
+
+def measure(mode, workdir, deadline):
+    port = free_port()
+    base = f"http://127.0.0.1:{port}"
+    env = dict(
+        os.environ,
+        PYTHONPATH=BACKEND_DIR,
+        MODEL_WARMUP=mode,
+        DATABASE_URL=os.environ.get("DATABASE_URL", f"sqlite:///{os.path.join(workdir, 'cold_start.db')}"),
+    )
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=workdir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        live = wait_for(f"{base}/api/health", start, deadline)
+        ready = wait_for(f"{base}/api/health/ready", start, deadline)
+        request(f"{base}/api/emotions/test", {"text": "오늘은 기분이 좋다"}, timeout=deadline)
+        first_analysis = time.perf_counter() - start
+        return {"live": live, "ready": ready, "first_analysis": first_analysis}
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def fmt(value):
+    return f"{value:.2f}" if value is not None else "timeout"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="콜드 스타트 측정")
+    parser.add_argument("--modes", nargs="+", default=["eager", "background", "lazy"], choices=list(TARGETS))
+    parser.add_argument("--workdir", default=None, help="서버 실행 디렉토리 (models/가 있는 곳)")
+    parser.add_argument("--deadline", type=float, default=120.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = os.path.abspath(args.workdir) if args.workdir else tmp
+        print(f"실행 디렉토리: {workdir}")
+        print(f"\n{'mode':<12}{'live (s)':>10}{'ready (s)':>11}{'first analysis (s)':>20}   목표")
+        for mode in args.modes:
+            result = measure(mode, workdir, args.deadline)
+            target = TARGETS[mode]
+            met = all(
+                result[key] is not None and result[key] <= limit for key, limit in target.items()
+            )
+            print(
+                f"{mode:<12}{fmt(result['live']):>10}{fmt(result['ready']):>11}{fmt(result['first_analysis']):>20}"
+                f"   {'OK' if met else 'MISSED'} (live<={target['live']}s, ready<={target['ready']}s)"
+            )
+
+
+if __name__ == "__main__":
+    main()
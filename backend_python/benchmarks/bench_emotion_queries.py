@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+"""
+감정 분석 결과 소유권 쿼리 벤치마크 (SQLite)
+- 기존 방식: JOIN + relationship.has() (상관 EXISTS 서브쿼리)
+- 현재 방식: queries.owned_emotions (인덱스를 타는 JOIN 한 번)
+- 단건 조회(read_emotion/delete_emotion)와 목록 첫 페이지(read_emotions) 지연 시간 비교
+
+사용법:
+    python benchmarks/bench_emotion_queries.py --emotions 1000000 --users 1000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+
+def build_database(url, num_users, num_emotions, emotions_per_entry):
+    """사용자/일기/감정 더미 데이터 생성"""
+    from sqlalchemy import create_engine, insert
+
+    from app.database import Base
+    from app.models import Emotion, Entry, User
+
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+
+    num_entries = max(num_emotions // emotions_per_entry, 1)
+    start = datetime(2020, 1, 1)
+    rng = random.Random(0)
+
+    with engine.begin() as conn:
+        conn.execute(insert(User), [
+            {"id": i, "email": f"user{i}@example.com", "username": f"user{i}", "hashed_password": "x"}
+            for i in range(1, num_users + 1)
+        ])
+        conn.execute(insert(Entry), [
+            {"id": i, "user_id": rng.randint(1, num_users), "title": "t", "content": "c",
+             "date": start + timedelta(hours=i)}
+            for i in range(1, num_entries + 1)
+        ])
+        batch = []
+        for i in range(1, num_emotions + 1):
+            batch.append({"id": i, "entry_id": (i - 1) // emotions_per_entry + 1, "emotion_type": "기쁨",
+                          "confidence_score": 0.9, "model_version": "v1.0",
+                          "created_at": start + timedelta(minutes=i)})
+            if len(batch) == 50000:
+                conn.execute(insert(Emotion), batch)
+                batch = []
+        if batch:
+            conn.execute(insert(Emotion), batch)
+
+    return engine, num_entries
+
+
+def measure(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(timings), max(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="감정 소유권 쿼리 벤치마크")
+    parser.add_argument("--emotions", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--emotions-per-entry", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    from sqlalchemy import text
+    from sqlalchemy.orm import Session
+
+    from app.models import Emotion, Entry
+    from app.queries import owned_emotions
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"데이터 생성 중: 감정 {args.emotions:,}개, 사용자 {args.users:,}명")
+        start = time.perf_counter()
+        engine, num_entries = build_database(
+            f"sqlite:///{os.path.join(tmp, 'bench.db')}", args.users, args.emotions, args.emotions_per_entry
+        )
+        with engine.begin() as conn:
+            conn.execute(text("ANALYZE"))
+        print(f"생성 완료 ({time.perf_counter() - start:.1f}s)")
+
+        rng = random.Random(1)
+        with Session(engine) as db:
+            def legacy_query(user_id):
+                return db.query(Emotion).join(Emotion.entry).filter(Emotion.entry.has(user_id=user_id))
+
+            def owner_of(emotion_id):
+                return db.query(Entry.user_id).join(Emotion, Emotion.entry_id == Entry.id).filter(
+                    Emotion.id == emotion_id).scalar()
+
+            samples = [rng.randint(1, args.emotions) for _ in range(args.repeat)]
+            owners = {emotion_id: owner_of(emotion_id) for emotion_id in samples}
+            samples_iter = iter(samples * 2)
+
+            def lookup(build):
+                def run():
+                    emotion_id = next(samples_iter)
+                    assert build(owners[emotion_id]).filter(Emotion.id == emotion_id).first() is not None
+                    db.expunge_all()
+                return run
+
+            def first_page(build):
+                def run():
+                    user_id = rng.randint(1, args.users)
+                    build(user_id).order_by(Emotion.created_at.desc(), Emotion.id.desc()).limit(args.page_size).all()
+                    db.expunge_all()
+                return run
+
+            cases = [
+                ("단건 조회 (JOIN + EXISTS)", lookup(legacy_query)),
+                ("단건 조회 (owned_emotions)", lookup(lambda user_id: owned_emotions(db, user_id))),
+                ("목록 첫 페이지 (JOIN + EXISTS)", first_page(legacy_query)),
+                ("목록 첫 페이지 (owned_emotions)", first_page(lambda user_id: owned_emotions(db, user_id))),
+            ]
+            print(f"\n{'쿼리':<32}{'p50 (ms)':>10}{'max (ms)':>10}")
+            for name, fn in cases:
+                p50, worst = measure(fn, args.repeat)
+                print(f"{name:<32}{p50:>10.3f}{worst:>10.3f}")
+
+            sql = str(owned_emotions(db, 1).filter(Emotion.id == 1).statement.compile(
+                engine, compile_kwargs={"literal_binds": True}))
+            print("\nowned_emotions 단건 조회 실행 계획:")
+            for row in db.execute(text(f"EXPLAIN QUERY PLAN {sql}")):
+                print(f"  {row[3]}")
+
+
+if __name__ == "__main__":
+    main()
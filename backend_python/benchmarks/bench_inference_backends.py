@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+"""
+PyTorch(fp32) / ONNX Runtime(int8) 추론 백엔드 비교 벤치마크
+- 텍스트 1건 지연 시간 (p50/p95)과 배치 처리량
+- 백엔드별 최대 RSS (백엔드마다 별도 프로세스에서 측정)
+- PyTorch 대비 정확도 드리프트 (예측 일치율, 확률 오차), 라벨이 있으면 정확도
+
+사용법:
+    python benchmarks/bench_inference_backends.py \\
+        --model-path models/kobert_emotion \\
+        --data ../data_pipeline/data/labeled/auto_labeled_data.csv
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+BACKENDS = ("pytorch", "onnx")
+
+
+def load_samples(data_path, limit):
+    """벤치마크용 텍스트와 (있다면) 라벨 로드"""
+    import pandas as pd
+
+    df = pd.read_csv(data_path).dropna(subset=["text"]).head(limit)
+    labels = df["emotion"].tolist() if "emotion" in df.columns else None
+    return df["text"].astype(str).tolist(), labels
+
+
+def run_backend(backend, model_path, data_path, limit, batch_size):
+    """자식 프로세스: 한 백엔드로 추론하고 결과를 JSON으로 출력"""
+    from app.services.kobert_emotion_service import KoBERTEmotionAnalyzer
+
+    texts, _ = load_samples(data_path, limit)
+
+    analyzer = KoBERTEmotionAnalyzer(model_path=model_path, backend=backend)
+    if analyzer.model is None:
+        raise SystemExit(f"{backend} 백엔드 모델 로딩 실패: {model_path}")
+
+    # 워밍업
+    analyzer.predict_batch(texts[:batch_size])
+
+    latencies = []
+    predictions = []
+    for text in texts:
+        start = time.perf_counter()
+        predictions.append(analyzer.predict(text))
+        latencies.append((time.perf_counter() - start) * 1000.0)
+
+    start = time.perf_counter()
+    for i in range(0, len(texts), batch_size):
+        analyzer.predict_batch(texts[i:i + batch_size])
+    batch_elapsed = time.perf_counter() - start
+
+    emotions = list(analyzer.EMOTIONS.values())
+    print(json.dumps({
+        "backend": analyzer.backend,
+        "p50_ms": float(np.percentile(latencies, 50)),
+        "p95_ms": float(np.percentile(latencies, 95)),
+        "batch_throughput": len(texts) / batch_elapsed,
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0,
+        "predictions": [p["emotion_type"] for p in predictions],
+        "probabilities": [[p["all_emotions"].get(e, 0.0) for e in emotions] for p in predictions],
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="추론 백엔드 지연 시간/RSS/정확도 드리프트 비교")
+    parser.add_argument("--model-path", default="models/kobert_emotion")
+    parser.add_argument("--data", default="../data_pipeline/data/labeled/auto_labeled_data.csv")
+    parser.add_argument("--limit", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--backend", choices=BACKENDS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.backend:
+        run_backend(args.backend, args.model_path, args.data, args.limit, args.batch_size)
+        return
+
+    results = {}
+    for backend in BACKENDS:
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--backend", backend,
+             "--model-path", args.model_path, "--data", args.data,
+             "--limit", str(args.limit), "--batch-size", str(args.batch_size)],
+            capture_output=True, text=True, check=True
+        ).stdout
+        results[backend] = json.loads(output.strip().splitlines()[-1])
+
+    _, labels = load_samples(args.data, args.limit)
+    base, quant = results["pytorch"], results["onnx"]
+
+    print(f"{'backend':<10}{'p50 ms':>10}{'p95 ms':>10}{'texts/s':>10}{'RSS MB':>10}{'accuracy':>10}")
+    for backend in BACKENDS:
+        r = results[backend]
+        accuracy = (
+            f"{np.mean([p == l for p, l in zip(r['predictions'], labels)]):.3f}" if labels else "-"
+        )
+        print(f"{backend:<10}{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}"
+              f"{r['batch_throughput']:>10.1f}{r['max_rss_mb']:>10.1f}{accuracy:>10}")
+
+    agreement = np.mean([a == b for a, b in zip(base["predictions"], quant["predictions"])])
+    prob_diff = np.abs(np.array(base["probabilities"]) - np.array(quant["probabilities"]))
+    print(f"\nONNX int8 vs PyTorch fp32 drift: "
+          f"top-1 agreement={agreement:.3f}, "
+          f"mean |Δp|={prob_diff.mean():.4f}, max |Δp|={prob_diff.max():.4f}")
+
+
+if __name__ == "__main__":
+    main()
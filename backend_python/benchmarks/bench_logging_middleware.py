@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""
+요청 로깅 미들웨어 처리량 벤치마크
+- 이전 방식: BaseHTTPMiddleware + 요청당 f-string 로그 2줄 + 동기 파일 sink
+- 현재 방식: 순수 ASGI LoggingMiddleware + 지연 포맷 로그 1줄 + enqueue sink (선택적 샘플링)
+- 빈 엔드포인트를 동시 요청으로 호출해 초당 요청 수 비교 (미들웨어/로깅 비용만 측정)
+
+사용법:
+    python benchmarks/bench_logging_middleware.py --requests 5000 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import uuid
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from fastapi import FastAPI, Request
+from loguru import logger
+from starlette.middleware.base import BaseHTTPMiddleware
+
+
+class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+    """변경 전 LoggingMiddleware (비교용)"""
+
+    async def dispatch(self, request: Request, call_next):
+        request_id = str(uuid.uuid4())[:8]
+        start_time = time.time()
+        logger.info(f"[{request_id}] {request.method} {request.url} - Client: {request.client.host}")
+        response = await call_next(request)
+        logger.info(
+            f"[{request_id}] {request.method} {request.url} - "
+            f"Status: {response.status_code} - "
+            f"Time: {time.time() - start_time:.4f}s"
+        )
+        response.headers["X-Request-ID"] = request_id
+        return response
+
+
+def make_app(middleware, **options):
+    app = FastAPI()
+    app.add_middleware(middleware, **options)
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+async def measure(app, num_requests, concurrency):
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        remaining = iter(range(num_requests))
+
+        async def worker():
+            for _ in remaining:
+                response = await client.get("/ping")
+                assert response.status_code == 200
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return num_requests / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로깅 미들웨어 처리량 벤치마크")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--sample-rate", type=float, default=0.1, help="샘플링 사례의 성공 로그 기록 비율")
+    args = parser.parse_args()
+
+    from app.middleware import LoggingMiddleware
+
+    cases = [
+        ("BaseHTTPMiddleware, 동기 sink", LegacyLoggingMiddleware, {}, False),
+        ("ASGI, 동기 sink", LoggingMiddleware, {}, False),
+        ("ASGI, enqueue sink", LoggingMiddleware, {}, True),
+        (f"ASGI, enqueue, 샘플링 {args.sample_rate}", LoggingMiddleware,
+         {"success_sample_rate": args.sample_rate}, True),
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"요청 {args.requests:,}건, 동시 {args.concurrency}")
+        print(f"\n{'구성':<36}{'req/s':>10}")
+        for name, middleware, options, enqueue in cases:
+            logger.remove()
+            logger.add(os.path.join(tmp, "bench.log"), level="DEBUG", enqueue=enqueue)
+            app = make_app(middleware, **options)
+            # 워밍업
+            asyncio.run(measure(app, min(200, args.requests), args.concurrency))
+            rps = asyncio.run(measure(app, args.requests, args.concurrency))
+            logger.complete()
+            print(f"{name:<36}{rps:>10.0f}")
+        logger.remove()
+
+
+if __name__ == "__main__":
+    main()
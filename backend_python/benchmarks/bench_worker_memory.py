@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+"""
+워커 프로세스별 메모리 측정 (모델 preload 공유 vs 워커별 로드)
+- run_server.py로 gunicorn 워커 N개를 띄우고 모든 워커가 모델을 워밍업한 뒤 측정
+- 워커별 RSS, PSS(공유 페이지를 나눠 계산), USS(워커 전용 페이지) 출력
+  RSS는 공유 페이지도 워커마다 포함하므로 실제 사용량은 PSS/USS 합계로 비교
+- 학습된 모델이 없으면 KoBERT 크기의 무작위 BERT 체크포인트를 만들어 사용
+
+사용법:
+    python benchmarks/bench_worker_memory.py --workers 3
+    python benchmarks/bench_worker_memory.py --workers 3 --model-dir models/kobert_emotion
+"""
+
+import argparse
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def build_synthetic_model(model_dir, layers, hidden):
+    """KoBERT와 같은 구조의 무작위 가중치 체크포인트 생성 (tokenizer.json + pytorch_model.bin)"""
+    from tokenizers import Tokenizer, models, pre_tokenizers
+    from transformers import BertConfig, BertForSequenceClassification, PreTrainedTokenizerFast
+
+    specials = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"]
+    vocab = {token: i for i, token in enumerate(specials + [chr(0xAC00 + i) for i in range(8002 - len(specials))])}
+    tokenizer = Tokenizer(models.WordPiece(vocab, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = pre_tokenizers.Whitespace()
+    PreTrainedTokenizerFast(
+        tokenizer_object=tokenizer, unk_token="[UNK]", pad_token="[PAD]", cls_token="[CLS]",
+        sep_token="[SEP]", mask_token="[MASK]"
+    ).save_pretrained(model_dir)
+
+    config = BertConfig(vocab_size=len(vocab), hidden_size=hidden, num_hidden_layers=layers,
+                        num_attention_heads=hidden // 64, intermediate_size=hidden * 4, num_labels=7)
+    BertForSequenceClassification(config).save_pretrained(model_dir, safe_serialization=False)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def is_ready(url):
+    try:
+        with urllib.request.urlopen(url, timeout=2) as response:
+            return response.status == 200
+    except (urllib.error.URLError, ConnectionError, socket.timeout):
+        return False
+
+
+def children(pid):
+    result = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        if int(fields[1]) == pid:
+            result.append(int(entry))
+    return sorted(result)
+
+
+def memory_mb(pid):
+    """(RSS, PSS, USS) MB"""
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[0].endswith(":"):
+                values[parts[0][:-1]] = int(parts[1]) / 1024.0
+    uss = values.get("Private_Clean", 0.0) + values.get("Private_Dirty", 0.0)
+    return values.get("Rss", 0.0), values.get("Pss", 0.0), uss
+
+
+def measure(workdir, workers, preload, settle):
+    port = free_port()
+    env = dict(
+        os.environ,
+        MODEL_WARMUP="background",
+        ANALYSIS_QUEUE_ENABLED="False",
+        DATABASE_URL=f"sqlite:///{os.path.join(workdir, 'memory.db')}",
+    )
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(BACKEND_DIR, "run_server.py"), "--workers", str(workers),
+         "--port", str(port), "--preload" if preload else "--no-preload"],
+        cwd=workdir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        deadline = time.time() + 600
+        # 요청이 여러 워커로 분산되도록 여러 번 ready를 확인한 뒤 워밍업이 끝날 때까지 대기
+        ready_count = 0
+        while ready_count < workers * 3 and time.time() < deadline:
+            ready_count += is_ready(f"http://127.0.0.1:{port}/api/health/ready")
+            time.sleep(0.2)
+        time.sleep(settle)
+        return memory_mb(process.pid), [memory_mb(pid) for pid in children(process.pid)]
+    finally:
+        process.terminate()
+        process.wait(timeout=60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="워커별 메모리 측정")
+    parser.add_argument("--workers", type=int, default=3)
+    parser.add_argument("--model-dir", default=None, help="학습된 체크포인트 (없으면 무작위 체크포인트 생성)")
+    parser.add_argument("--layers", type=int, default=12)
+    parser.add_argument("--hidden", type=int, default=768)
+    parser.add_argument("--settle", type=float, default=10.0, help="ready 이후 워밍업 대기 시간 (초)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        model_dir = os.path.join(workdir, "models", "kobert_emotion")
+        if args.model_dir:
+            shutil.copytree(os.path.abspath(args.model_dir), model_dir)
+        else:
+            print("무작위 BERT 체크포인트 생성 중...")
+            build_synthetic_model(model_dir, args.layers, args.hidden)
+
+        print(f"워커 {args.workers}개\n")
+        print(f"{'mode':<12}{'process':<10}{'RSS (MB)':>10}{'PSS (MB)':>10}{'USS (MB)':>10}")
+        for name, preload in (("per-worker", False), ("preload", True)):
+            master, workers = measure(workdir, args.workers, preload, args.settle)
+            print(f"{name:<12}{'master':<10}{master[0]:>10.0f}{master[1]:>10.0f}{master[2]:>10.0f}")
+            for i, (rss, pss, uss) in enumerate(workers):
+                print(f"{'':<12}{f'worker {i}':<10}{rss:>10.0f}{pss:>10.0f}{uss:>10.0f}")
+            total_pss = master[1] + sum(pss for _, pss, _ in workers)
+            print(f"{'':<12}{'total PSS':<10}{'':>10}{total_pss:>10.0f}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,13 @@
 #!/usr/bin/env python
 """
 FastAPI 서버 실행 스크립트
+- 워커 1개: uvicorn 단일 프로세스 (기본값, 개발용 reload)
+- 워커 여러 개: gunicorn + UvicornWorker
+  --preload(기본값)면 마스터 프로세스가 앱과 감정 분석 모델을 먼저 로드한 뒤 fork 하므로
+  모델 가중치를 모든 워커가 copy-on-write로 공유 (워커마다 모델을 따로 올리지 않음)
 """
-import uvicorn
+import argparse
+import gc
 import sys
 import os
 
@@ -11,11 +16,66 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
-if __name__ == "__main__":
+from app.config import settings
+
+
+def preload_model(server=None):
+    """fork 전에 마스터 프로세스에서 모델 로드
+
+    추론은 실행하지 않음 (torch 스레드 풀을 fork 전에 만들지 않도록 워커에서 워밍업)
+    gc.freeze()로 로드된 객체를 GC 대상에서 제외해 워커에서 페이지가 복사되지 않게 함
+    """
+    from app.services.kobert_emotion_service import get_kobert_analyzer
+
+    get_kobert_analyzer()
+    gc.freeze()
+
+
+def run_gunicorn(host: str, port: int, workers: int, preload: bool):
+    from gunicorn.app.base import BaseApplication
+
+    class GunicornServer(BaseApplication):
+        def load_config(self):
+            self.cfg.set("bind", f"{host}:{port}")
+            self.cfg.set("workers", workers)
+            self.cfg.set("worker_class", "uvicorn.workers.UvicornWorker")
+            self.cfg.set("preload_app", preload)
+            self.cfg.set("timeout", 120)
+            if preload:
+                self.cfg.set("on_starting", preload_model)
+
+        def load(self):
+            from app.main import app
+            return app
+
+    GunicornServer().run()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Emotion Diary API 서버")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=settings.SERVER_WORKERS)
+    parser.add_argument("--preload", action=argparse.BooleanOptionalAction, default=settings.SERVER_PRELOAD_MODEL,
+                        help="fork 전에 모델을 로드해 워커 간 공유 (워커 2개 이상)")
+    parser.add_argument("--reload", action=argparse.BooleanOptionalAction, default=True,
+                        help="코드 변경 시 재시작 (워커 1개일 때만)")
+    args = parser.parse_args()
+
+    if args.workers > 1:
+        run_gunicorn(args.host, args.port, args.workers, args.preload)
+        return
+
+    import uvicorn
+
     uvicorn.run(
         "app.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
+        host=args.host,
+        port=args.port,
+        reload=args.reload,
         log_level="info"
-    )
\ No newline at end of file
+    )
+
+
+if __name__ == "__main__":
+    main()
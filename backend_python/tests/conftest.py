@@ -1,20 +1,25 @@
+import uuid
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
 
 from app.main import app
-from app.database import get_db, Base
+from app.database import get_async_db, get_db, Base
 from app.config import Settings
+from app.services.analysis_queue import get_analysis_queue
 
 # Test database setup
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
 
+# A file database with one connection per session: the background analysis
+# worker commits concurrently with request sessions, which a single shared
+# connection (StaticPool) would interleave into one transaction
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -25,7 +30,18 @@ def override_get_db():
     finally:
         db.close()
 
+# Async endpoints use the same file through aiosqlite
+async_engine = create_async_engine("sqlite+aiosqlite:///./test.db")
+TestingAsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+async def override_get_async_db():
+    async with TestingAsyncSessionLocal() as session:
+        yield session
+
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_async_db] = override_get_async_db
+# Background analysis workers write through the same test database
+get_analysis_queue().session_factory = TestingSessionLocal
 
 @pytest.fixture(scope="session")
 def client():
@@ -40,4 +56,40 @@ def db_session():
     db = TestingSessionLocal()
     yield db
     db.close()
-    Base.metadata.drop_all(bind=engine)
\ No newline at end of file
+    Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def auth_headers(client):
+    """Register a fresh user and return bearer auth headers for it"""
+    username = f"user_{uuid.uuid4().hex[:8]}"
+    password = "test-password"
+    response = client.post(
+        "/api/auth/register",
+        json={"email": f"{username}@example.com", "username": username, "password": password},
+    )
+    assert response.status_code == 200
+    token = client.post(
+        "/api/auth/token", data={"username": username, "password": password}
+    ).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+@pytest.fixture(scope="session")
+def tiny_model_dir(tmp_path_factory):
+    """A tiny random BERT classifier checkpoint with a word-level tokenizer (one token per word)"""
+    from tokenizers import Tokenizer, models, pre_tokenizers
+    from transformers import BertConfig, BertForSequenceClassification, PreTrainedTokenizerFast
+
+    model_dir = tmp_path_factory.mktemp("kobert_emotion")
+    specials = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"]
+    vocab = {token: i for i, token in enumerate(specials + [chr(0xAC00 + i) for i in range(64)])}
+    tokenizer = Tokenizer(models.WordPiece(vocab, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = pre_tokenizers.WhitespaceSplit()
+    PreTrainedTokenizerFast(
+        tokenizer_object=tokenizer, unk_token="[UNK]", pad_token="[PAD]", cls_token="[CLS]",
+        sep_token="[SEP]", mask_token="[MASK]"
+    ).save_pretrained(model_dir)
+
+    config = BertConfig(vocab_size=len(vocab), hidden_size=32, num_hidden_layers=1, num_attention_heads=2,
+                        intermediate_size=64, num_labels=7)
+    BertForSequenceClassification(config).save_pretrained(model_dir)
+    return model_dir
@@ -0,0 +1,202 @@
+import asyncio
+import time
+
+from app.cache import text_fingerprint
+from app.config import settings
+from app.models import Emotion, Entry
+from app.services import kobert_emotion_service
+from app.services.analysis_queue import AnalysisQueue, InMemoryQueueBackend
+from tests.conftest import TestingSessionLocal
+
+class RecordingBackend(InMemoryQueueBackend):
+    """Records acks together with the number of saved emotions at that moment"""
+
+    def __init__(self, stale=0):
+        super().__init__()
+        self.stale = stale
+        self.acks = []
+
+    def ack(self, entry_ids):
+        db = TestingSessionLocal()
+        try:
+            self.acks.append((list(entry_ids), db.query(Emotion).filter(Emotion.entry_id.in_(entry_ids)).count()))
+        finally:
+            db.close()
+
+    def requeue_stale(self, visibility_timeout):
+        stale, self.stale = self.stale, 0
+        return stale
+
+def _wait_for_status(client, entry_id, headers, expected="done", timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        response = client.get(f"/api/entries/{entry_id}/analysis", headers=headers)
+        assert response.status_code == 200
+        body = response.json()
+        if body["status"] == expected or time.monotonic() > deadline:
+            return body
+        time.sleep(0.05)
+
+def test_in_memory_backend_deduplicates_pending_jobs():
+    backend = InMemoryQueueBackend()
+
+    assert backend.push(1) is True
+    assert backend.push(1) is False
+    assert backend.push(2) is True
+    assert backend.get_status(1) == "pending"
+
+    assert backend.pop_batch(10, timeout=0.01) == [1, 2]
+    assert backend.pop_batch(10, timeout=0.01) == []
+
+def test_stats_report_backend():
+    queue = AnalysisQueue(InMemoryQueueBackend(), batch_size=4)
+    stats = queue.stats()
+    assert stats["backend"] == "InMemoryQueueBackend"
+    assert stats["running"] is False
+
+def test_created_entry_is_analyzed_in_background(client, auth_headers):
+    response = client.post(
+        "/api/entries/",
+        json={"title": "큐 테스트", "content": "오늘은 정말 기쁘고 행복한 하루였다", "date": "2024-01-01T00:00:00"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    entry_id = response.json()["id"]
+
+    body = _wait_for_status(client, entry_id, auth_headers)
+    assert body["status"] == "done"
+    assert body["emotion"]["entry_id"] == entry_id
+    assert body["emotion"]["emotion_type"]
+
+def test_content_update_requeues_entry(client, auth_headers):
+    entry_id = client.post(
+        "/api/entries/",
+        json={"title": "수정 전", "content": "평범한 하루", "date": "2024-01-02T00:00:00"},
+        headers=auth_headers,
+    ).json()["id"]
+    _wait_for_status(client, entry_id, auth_headers)
+
+    client.put(f"/api/entries/{entry_id}", json={"content": "너무 슬프고 우울한 하루"}, headers=auth_headers)
+    _wait_for_status(client, entry_id, auth_headers)
+
+    entry = client.get(f"/api/entries/{entry_id}", headers=auth_headers).json()
+    assert len(entry["emotions"]) == 2
+
+def test_analysis_status_is_scoped_to_owner(client, auth_headers):
+    response = client.get("/api/entries/999999/analysis", headers=auth_headers)
+    assert response.status_code == 404
+
+def test_enqueue_requires_background_queue(client, auth_headers, monkeypatch):
+    monkeypatch.setattr(settings, "ANALYSIS_QUEUE_ENABLED", False)
+    entry_id = client.post(
+        "/api/entries/",
+        json={"title": "큐 비활성", "content": "평범한 하루", "date": "2024-01-03T00:00:00"},
+        headers=auth_headers,
+    ).json()["id"]
+
+    response = client.post(f"/api/entries/{entry_id}/analysis", headers=auth_headers)
+
+    assert response.status_code == 503
+    assert client.get(f"/api/entries/{entry_id}/analysis", headers=auth_headers).json()["status"] == "not_queued"
+
+def test_jobs_are_acked_after_results_are_saved(client, auth_headers, monkeypatch):
+    monkeypatch.setattr(settings, "ANALYSIS_QUEUE_ENABLED", False)
+    entry_id = client.post(
+        "/api/entries/",
+        json={"title": "확인 테스트", "content": "오늘은 정말 기쁜 하루", "date": "2024-01-04T00:00:00"},
+        headers=auth_headers,
+    ).json()["id"]
+    backend = RecordingBackend()
+    queue = AnalysisQueue(backend, session_factory=TestingSessionLocal)
+
+    asyncio.run(queue._process([entry_id, 999999]))
+
+    # The deleted entry is acked up front, the analyzed one only once its emotion row exists
+    assert backend.acks == [([999999], 0), ([entry_id], 1)]
+    assert backend.get_status(entry_id) is None
+
+def test_failed_batch_does_not_stay_processing(client, auth_headers, monkeypatch):
+    monkeypatch.setattr(settings, "ANALYSIS_QUEUE_ENABLED", False)
+    entry_id = client.post(
+        "/api/entries/",
+        json={"title": "실패 테스트", "content": "평범한 하루", "date": "2024-01-04T00:00:00"},
+        headers=auth_headers,
+    ).json()["id"]
+    backend = RecordingBackend()
+    queue = AnalysisQueue(backend, session_factory=TestingSessionLocal)
+
+    def fail_to_load(entry_ids):
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(queue, "_load_contents", fail_to_load)
+    asyncio.run(queue._process([entry_id]))
+
+    assert backend.get_status(entry_id) == "failed"
+    assert backend.acks == [([entry_id], 0)]
+    assert queue.stats()["failed"] == 1
+
+def test_worker_requeues_stale_jobs():
+    queue = AnalysisQueue(RecordingBackend(stale=2), poll_timeout=0.01, visibility_timeout=60)
+
+    async def run_briefly():
+        await queue.start()
+        await asyncio.sleep(0.05)
+        await queue.stop()
+
+    asyncio.run(run_briefly())
+
+    assert queue.stats()["requeued"] == 2
+
+def _create_unqueued_entry(client, auth_headers, monkeypatch, content):
+    monkeypatch.setattr(settings, "ANALYSIS_QUEUE_ENABLED", False)
+    return client.post(
+        "/api/entries/",
+        json={"title": "지문 테스트", "content": content, "date": "2024-01-05T00:00:00"},
+        headers=auth_headers,
+    ).json()["id"]
+
+def test_saved_emotion_is_fingerprinted_by_analyzed_text(client, auth_headers, monkeypatch):
+    entry_id = _create_unqueued_entry(client, auth_headers, monkeypatch, "오늘은 정말 기쁜 하루")
+    # Fingerprint rule-based results too, as a loaded model's would be
+    analyzer = kobert_emotion_service.get_kobert_analyzer()
+    monkeypatch.setattr(type(analyzer), "is_cacheable", lambda self, result: True)
+    queue = AnalysisQueue(RecordingBackend(), session_factory=TestingSessionLocal)
+
+    asyncio.run(queue._process([entry_id]))
+
+    db = TestingSessionLocal()
+    try:
+        emotion = db.query(Emotion).filter(Emotion.entry_id == entry_id).one()
+    finally:
+        db.close()
+    assert emotion.content_hash == text_fingerprint("오늘은 정말 기쁜 하루")
+    assert emotion.analyzed_text == "오늘은 정말 기쁜 하루"
+
+def test_entry_edited_during_analysis_is_requeued(client, auth_headers, monkeypatch):
+    entry_id = _create_unqueued_entry(client, auth_headers, monkeypatch, "평범한 하루")
+    analyze = kobert_emotion_service.analyze_emotions_batch
+
+    async def analyze_then_edit(texts):
+        results = await analyze(texts)
+        # The entry is edited while the model is running
+        db = TestingSessionLocal()
+        try:
+            db.query(Entry).filter(Entry.id == entry_id).update({"content": "너무 슬프고 우울한 하루"})
+            db.commit()
+        finally:
+            db.close()
+        return results
+
+    monkeypatch.setattr(kobert_emotion_service, "analyze_emotions_batch", analyze_then_edit)
+    backend = RecordingBackend()
+    queue = AnalysisQueue(backend, session_factory=TestingSessionLocal)
+
+    asyncio.run(queue._process([entry_id]))
+
+    db = TestingSessionLocal()
+    try:
+        assert db.query(Emotion).filter(Emotion.entry_id == entry_id).count() == 0
+    finally:
+        db.close()
+    assert backend.get_status(entry_id) == "pending"
+    assert backend.pop_batch(10, timeout=0.01) == [entry_id]
@@ -0,0 +1,47 @@
+import asyncio
+import pytest
+
+from app.services.batching import MicroBatcher
+from app.services.kobert_emotion_service import KoBERTEmotionAnalyzer
+
+def test_micro_batcher_groups_concurrent_requests():
+    batch_sizes = []
+
+    def batch_fn(items):
+        batch_sizes.append(len(items))
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=8, max_wait_ms=20)
+
+    async def run():
+        return await asyncio.gather(*(batcher.submit(i) for i in range(20)))
+
+    results = asyncio.run(run())
+
+    # Results come back in submission order
+    assert results == [i * 2 for i in range(20)]
+    assert max(batch_sizes) <= 8
+    assert len(batch_sizes) < 20
+    assert batcher.stats()["items_processed"] == 20
+
+def test_micro_batcher_propagates_errors():
+    def batch_fn(items):
+        raise ValueError("boom")
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=4, max_wait_ms=1)
+
+    async def run():
+        return await batcher.submit("text")
+
+    with pytest.raises(ValueError):
+        asyncio.run(run())
+
+def test_predict_batch_matches_single_predictions():
+    analyzer = KoBERTEmotionAnalyzer(model_path="models/does_not_exist")
+    texts = ["오늘 정말 행복했다", "", "너무 슬프고 우울하다"]
+
+    batch_results = analyzer.predict_batch(texts)
+
+    assert len(batch_results) == len(texts)
+    for text, result in zip(texts, batch_results):
+        assert result == analyzer.predict(text)
@@ -0,0 +1,56 @@
+from app.cache import TTLCache, text_fingerprint
+from app.services.kobert_emotion_service import analyze_emotion, get_result_cache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_ttl_cache_lru_eviction():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # Touch "a" so "b" becomes least recently used
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+def test_ttl_cache_expiry():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=10, ttl=60, timer=clock)
+    cache.set("key", "value")
+
+    clock.now = 59
+    assert cache.get("key") == "value"
+
+    clock.now = 61
+    assert cache.get("key") is None
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+def test_text_fingerprint_normalizes_whitespace():
+    assert text_fingerprint("  오늘은 \t  행복한 하루 ") == text_fingerprint("오늘은 행복한 하루")
+    assert text_fingerprint("오늘은 \r\n\n 행복한 하루") == text_fingerprint("오늘은\n행복한 하루")
+    # 줄바꿈은 긴 글의 문장 분할에 쓰이므로 공백과 구분
+    assert text_fingerprint("오늘은\n행복한 하루") != text_fingerprint("오늘은 행복한 하루")
+    assert text_fingerprint("오늘은 행복한 하루") != text_fingerprint("오늘은 슬픈 하루")
+
+def test_analyze_emotion_uses_result_cache():
+    cache = get_result_cache()
+    cache.clear()
+    hits_before = cache.hits
+
+    first = analyze_emotion("친구를 만나서 정말 즐거웠다")
+    second = analyze_emotion("친구를 만나서   정말 즐거웠다")
+
+    assert first == second
+    assert cache.hits == hits_before + 1
@@ -0,0 +1,66 @@
+import pytest
+from sqlalchemy import create_engine
+
+from app.config import settings
+from app.database import async_database_url, engine_options, pool_status
+
+def test_async_database_url_uses_async_drivers():
+    assert async_database_url("postgresql://u:p@db:5432/diary") == "postgresql+asyncpg://u:p@db:5432/diary"
+    assert async_database_url("postgresql+psycopg2://u:p@db/diary") == "postgresql+asyncpg://u:p@db/diary"
+    assert async_database_url("sqlite:///./emotion_diary.db") == "sqlite+aiosqlite:///./emotion_diary.db"
+
+def test_engine_options_size_pool_for_server_databases():
+    options = engine_options("postgresql://u:p@db/diary")
+    assert {"pool_size", "max_overflow", "pool_timeout", "pool_recycle", "pool_pre_ping"} <= set(options)
+
+    sqlite_options = engine_options("sqlite:///./emotion_diary.db")
+    assert "pool_size" not in sqlite_options
+    assert sqlite_options["connect_args"] == {"check_same_thread": False}
+
+def test_pool_status_reports_utilization(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", pool_size=2, max_overflow=2)
+    with engine.connect():
+        status = pool_status(engine, max_overflow=2)
+        default_status = pool_status(engine)
+    assert status["pool_class"] == "QueuePool"
+    assert status["checked_out"] == 1
+    assert status["utilization"] == 0.25
+    # SQLite engines keep SQLAlchemy's pool sizing, which engine_options() does not configure
+    assert default_status["max_overflow"] is None
+    assert default_status["utilization"] is None
+    assert pool_status(None) is None
+
+def test_pool_status_uses_configured_max_overflow(monkeypatch):
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 4)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 6)
+    url = "postgresql://u:p@db/diary"
+    engine = create_engine(url, **engine_options(url))
+
+    status = pool_status(engine)
+    assert (status["size"], status["max_overflow"], status["utilization"]) == (4, 6, 0.0)
+
+def test_async_analyze_endpoint(client, auth_headers):
+    entry_id = client.post(
+        "/api/entries/",
+        json={"title": "비동기 세션", "content": "오늘은 기쁜 날", "date": "2024-03-01T00:00:00"},
+        headers=auth_headers,
+    ).json()["id"]
+
+    response = client.get(f"/api/entries/{entry_id}/analyze?force=true", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["emotions"]
+
+    missing = client.get("/api/entries/999999/analyze", headers=auth_headers)
+    assert missing.status_code == 404
+
+def test_database_diagnostics(client, auth_headers):
+    response = client.get("/api/diagnostics/db", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["sync"]["pool_class"]
+
+@pytest.mark.parametrize("path", ["/api/diagnostics/db", "/api/diagnostics/auth"])
+def test_diagnostics_require_auth_and_debug(client, auth_headers, monkeypatch, path):
+    assert client.get(path).status_code == 401
+
+    monkeypatch.setattr(settings, "DEBUG", False)
+    assert client.get(path, headers=auth_headers).status_code == 404
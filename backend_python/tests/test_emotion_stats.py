@@ -0,0 +1,143 @@
+from datetime import date, datetime, timezone
+
+import pytest
+from sqlalchemy import select
+
+from app.models import EmotionRollup
+from app.rollups import bucket_start, rebuild_rollups
+from tests.conftest import engine
+from tests.test_analysis_queue import _wait_for_status
+
+@pytest.mark.parametrize("granularity, expected", [
+    ("day", date(2024, 5, 16)),
+    ("week", date(2024, 5, 13)),
+    ("month", date(2024, 5, 1)),
+])
+def test_bucket_start(granularity, expected):
+    assert bucket_start(datetime(2024, 5, 16, 23, 59), granularity) == expected
+    assert bucket_start(date(2024, 5, 16), granularity) == expected
+
+def test_bucket_start_uses_utc():
+    from datetime import timedelta
+
+    kst = timezone(timedelta(hours=9))
+    assert bucket_start(datetime(2024, 5, 17, 1, 0, tzinfo=kst), "day") == date(2024, 5, 16)
+
+def _create_analyzed_entries(client, headers, contents, entry_date="2024-05-16T00:00:00"):
+    entry_ids = []
+    for content in contents:
+        entry_ids.append(client.post(
+            "/api/entries/",
+            json={"title": "통계", "content": content, "date": entry_date},
+            headers=headers,
+        ).json()["id"])
+    for entry_id in entry_ids:
+        _wait_for_status(client, entry_id, headers)
+    return entry_ids
+
+def _stats(client, headers, **params):
+    response = client.get("/api/emotions/stats", params=params, headers=headers)
+    assert response.status_code == 200
+    return response.json()
+
+def _rollup_rows():
+    with engine.connect() as conn:
+        return sorted(conn.execute(select(EmotionRollup.__table__)).all())
+
+def test_stats_follow_emotion_inserts_and_deletes(client, auth_headers):
+    entry_ids = _create_analyzed_entries(
+        client, auth_headers, ["정말 기쁘고 행복한 하루", "너무 슬프고 우울했다", "기쁘고 신나는 날"]
+    )
+    emotions = client.get("/api/emotions/", headers=auth_headers).json()
+    expected = {}
+    for emotion in emotions:
+        expected.setdefault(emotion["emotion_type"], []).append(emotion["confidence_score"])
+
+    for granularity in ("day", "week", "month"):
+        stats = _stats(client, auth_headers, granularity=granularity)
+        assert stats["granularity"] == granularity
+        assert len(stats["buckets"]) == 1
+        bucket = stats["buckets"][0]
+        assert bucket["total"] == 3
+        assert {k: v["count"] for k, v in bucket["emotions"].items()} == {k: len(v) for k, v in expected.items()}
+        for emotion_type, scores in expected.items():
+            assert bucket["emotions"][emotion_type]["mean_confidence"] == pytest.approx(sum(scores) / len(scores))
+
+    client.delete(f"/api/emotions/{emotions[0]['id']}", headers=auth_headers)
+    assert _stats(client, auth_headers)["buckets"][0]["total"] == 2
+
+    for entry_id in entry_ids:
+        client.delete(f"/api/entries/{entry_id}", headers=auth_headers)
+    assert _stats(client, auth_headers)["buckets"] == []
+
+def test_rebuild_matches_incremental_rollups(client, auth_headers):
+    _create_analyzed_entries(client, auth_headers, ["화가 나고 짜증나", "평범한 하루"])
+    incremental = _rollup_rows()
+
+    with engine.begin() as conn:
+        rebuild_rollups(conn)
+
+    assert _rollup_rows() == incremental
+
+def test_stats_date_range(client, auth_headers):
+    _create_analyzed_entries(client, auth_headers, ["기쁜 하루"])
+
+    assert _stats(client, auth_headers, **{"from": "2024-05-16", "to": "2024-05-16"})["buckets"]
+    assert _stats(client, auth_headers, **{"to": "2000-01-01"})["buckets"] == []
+
+    response = client.get("/api/emotions/stats", params={"from": "2024-02-01", "to": "2024-01-01"}, headers=auth_headers)
+    assert response.status_code == 400
+    response = client.get("/api/emotions/stats", params={"granularity": "year"}, headers=auth_headers)
+    assert response.status_code == 422
+
+def test_stats_bucket_by_entry_date(client, auth_headers):
+    _create_analyzed_entries(client, auth_headers, ["기쁜 하루"], entry_date="2024-03-10T00:00:00")
+    entry_id = _create_analyzed_entries(client, auth_headers, ["기쁜 하루"], entry_date="2024-04-02T00:00:00")[0]
+
+    buckets = _stats(client, auth_headers, granularity="month")["buckets"]
+    assert [(b["bucket_start"], b["total"]) for b in buckets] == [("2024-03-01", 1), ("2024-04-01", 1)]
+
+    # Moving the entry moves its emotion to the new bucket
+    client.put(f"/api/entries/{entry_id}", json={"date": "2024-03-20T00:00:00"}, headers=auth_headers)
+    buckets = _stats(client, auth_headers, granularity="month")["buckets"]
+    assert [(b["bucket_start"], b["total"]) for b in buckets] == [("2024-03-01", 2)]
+
+def test_stats_count_only_latest_emotion_per_entry(client, auth_headers):
+    entry_id = _create_analyzed_entries(client, auth_headers, ["정말 기쁘고 행복한 하루"])[0]
+    first = client.get("/api/emotions/", headers=auth_headers).json()[0]
+
+    # Re-analysis replaces the entry's contribution instead of adding to it
+    client.put(f"/api/entries/{entry_id}", json={"content": "너무 슬프고 우울했다"}, headers=auth_headers)
+    _wait_for_status(client, entry_id, auth_headers)
+    emotions = client.get("/api/emotions/", headers=auth_headers).json()
+    assert len(emotions) == 2
+    latest = next(emotion for emotion in emotions if emotion["id"] != first["id"])
+
+    bucket = _stats(client, auth_headers)["buckets"][0]
+    assert bucket["total"] == 1
+    assert bucket["emotions"] == {
+        latest["emotion_type"]: {"count": 1, "mean_confidence": pytest.approx(latest["confidence_score"])}
+    }
+
+    # Deleting the latest result falls back to the previous one
+    client.delete(f"/api/emotions/{latest['id']}", headers=auth_headers)
+    bucket = _stats(client, auth_headers)["buckets"][0]
+    assert bucket["total"] == 1
+    assert list(bucket["emotions"]) == [first["emotion_type"]]
+
+    # Deleting an entry with several results removes its single contribution
+    client.put(f"/api/entries/{entry_id}", json={"content": "화가 나고 짜증나"}, headers=auth_headers)
+    _wait_for_status(client, entry_id, auth_headers)
+    client.delete(f"/api/entries/{entry_id}", headers=auth_headers)
+    assert _stats(client, auth_headers)["buckets"] == []
+
+def test_rebuild_counts_latest_emotion_per_entry(client, auth_headers):
+    entry_id = _create_analyzed_entries(client, auth_headers, ["평범한 하루"], entry_date="2024-06-01T00:00:00")[0]
+    client.put(f"/api/entries/{entry_id}", json={"content": "기쁘고 신나는 날"}, headers=auth_headers)
+    _wait_for_status(client, entry_id, auth_headers)
+    incremental = _rollup_rows()
+
+    with engine.begin() as conn:
+        rebuild_rollups(conn)
+
+    assert _rollup_rows() == incremental
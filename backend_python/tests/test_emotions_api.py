@@ -0,0 +1,32 @@
+from app.config import settings
+
+def test_analyze_batch_returns_results_in_order(client, auth_headers):
+    texts = ["오늘 정말 기쁘고 행복했다", "   ", "너무 슬프고 우울한 하루", "오늘 정말 기쁘고 행복했다"]
+    response = client.post(
+        "/api/emotions/analyze/batch",
+        json={"items": [{"text": text} for text in texts]},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    results = response.json()["results"]
+
+    assert [item["index"] for item in results] == [0, 1, 2, 3]
+    assert results[0]["result"]["emotion_type"] == "기쁨"
+    assert results[1]["result"] is None
+    assert results[1]["error"] == "Text is empty"
+    assert results[2]["result"]["emotion_type"] == "슬픔"
+    assert results[3]["result"] == results[0]["result"]
+
+def test_analyze_batch_enforces_item_cap(client, auth_headers, monkeypatch):
+    monkeypatch.setattr(settings, "BATCH_ANALYSIS_MAX_ITEMS", 2)
+    response = client.post(
+        "/api/emotions/analyze/batch",
+        json={"items": [{"text": "하나"}, {"text": "둘"}, {"text": "셋"}]},
+        headers=auth_headers,
+    )
+    assert response.status_code == 400
+    assert response.json()["error"]["error_code"] == "VALIDATION_ERROR"
+
+def test_analyze_batch_requires_auth(client):
+    response = client.post("/api/emotions/analyze/batch", json={"items": [{"text": "기쁘다"}]})
+    assert response.status_code == 401
@@ -0,0 +1,52 @@
+from sqlalchemy import create_engine, inspect, text
+
+from app.database import sync_schema
+from tests.test_analysis_queue import _wait_for_status
+
+def _create_analyzed_entry(client, headers, content):
+    entry_id = client.post(
+        "/api/entries/",
+        json={"title": "재분석 테스트", "content": content, "date": "2024-02-01T00:00:00"},
+        headers=headers,
+    ).json()["id"]
+    assert _wait_for_status(client, entry_id, headers)["status"] == "done"
+    return entry_id
+
+def test_analyze_reuses_result_for_unchanged_content(client, auth_headers):
+    entry_id = _create_analyzed_entry(client, auth_headers, "오늘은 기쁘고 행복했다")
+
+    for _ in range(3):
+        response = client.get(f"/api/entries/{entry_id}/analyze", headers=auth_headers)
+        assert response.status_code == 200
+        assert len(response.json()["emotions"]) == 1
+
+    forced = client.get(f"/api/entries/{entry_id}/analyze?force=true", headers=auth_headers)
+    assert len(forced.json()["emotions"]) == 2
+
+def test_analyze_reinfers_after_content_change(client, auth_headers):
+    entry_id = _create_analyzed_entry(client, auth_headers, "평범한 하루")
+
+    client.put(f"/api/entries/{entry_id}", json={"title": "제목만 수정"}, headers=auth_headers)
+    assert client.get(f"/api/entries/{entry_id}/analysis", headers=auth_headers).json()["status"] == "done"
+
+    client.put(f"/api/entries/{entry_id}", json={"content": "너무 화가 나고 짜증나는 하루"}, headers=auth_headers)
+    _wait_for_status(client, entry_id, auth_headers)
+
+    response = client.get(f"/api/entries/{entry_id}/analyze", headers=auth_headers)
+    emotions = response.json()["emotions"]
+    assert len(emotions) == 2
+
+def test_sync_schema_adds_missing_columns_and_indexes(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE emotions (id INTEGER PRIMARY KEY, entry_id INTEGER NOT NULL, "
+            "emotion_type VARCHAR NOT NULL, confidence_score FLOAT NOT NULL, analyzed_text TEXT, "
+            "model_version VARCHAR, created_at DATETIME)"
+        ))
+
+    sync_schema(engine)
+
+    inspector = inspect(engine)
+    assert "content_hash" in {column["name"] for column in inspector.get_columns("emotions")}
+    assert "ix_emotions_entry_content_hash" in {index["name"] for index in inspector.get_indexes("emotions")}
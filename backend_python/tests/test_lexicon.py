@@ -0,0 +1,40 @@
+import pytest
+
+from app.services.emotion_service import EmotionAnalyzer
+from app.services.kobert_emotion_service import KoBERTEmotionAnalyzer
+from app.services.lexicon import KeywordLexicon
+
+TEXTS = [
+    "",
+    "오늘 정말 기쁘고 행복한 하루였어요! 좋아 좋아",
+    "너무 슬프고 힘든 하루였습니다. 우울해서 울었어요.",
+    "화가 나고 짜증나서 싫다 싫어 정말 미워",
+    "그냥 평범한 하루. 평소와 같이 무난했다 ㅋㅋㅋㅋㅋ",
+    "걱정 걱정 불안 불안 갑자기 깜짝 놀라서 충격",
+]
+
+def _count_with_str_count(emotion_keywords, text):
+    return {
+        emotion: sum(text.count(keyword) for keyword in keywords)
+        for emotion, keywords in emotion_keywords.items()
+    }
+
+@pytest.mark.parametrize("use_native", [True, False])
+@pytest.mark.parametrize("emotion_keywords", [
+    EmotionAnalyzer().emotion_keywords,
+    KoBERTEmotionAnalyzer.RULE_KEYWORDS,
+])
+def test_lexicon_matches_str_count(emotion_keywords, use_native):
+    lexicon = KeywordLexicon(emotion_keywords, use_native=use_native)
+
+    for text in TEXTS:
+        assert lexicon.count(text) == _count_with_str_count(emotion_keywords, text)
+
+@pytest.mark.parametrize("use_native", [True, False])
+def test_lexicon_self_overlapping_keywords(use_native):
+    # str.count counts non-overlapping occurrences: "ㅋㅋ" appears twice in "ㅋㅋㅋㅋㅋ"
+    keywords = {"웃음": ["ㅋㅋ", "ㅋ"], "반복": ["아아", "아아", "아"]}
+    lexicon = KeywordLexicon(keywords, use_native=use_native)
+
+    for text in ["ㅋㅋㅋㅋㅋ", "아아아 ㅋ 아아아아"]:
+        assert lexicon.count(text) == _count_with_str_count(keywords, text)
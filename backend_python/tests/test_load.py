@@ -0,0 +1,92 @@
+"""
+Load test: /api/health latency must stay flat while analysis requests
+saturate the inference executor.
+"""
+import asyncio
+import gc
+import time
+
+import httpx
+import numpy as np
+import pytest
+
+from app.config import settings
+from app.main import app
+from app.services import kobert_emotion_service
+
+INFERENCE_SECONDS = 0.3
+
+@pytest.fixture
+def slow_inference(monkeypatch):
+    analyzer = kobert_emotion_service.get_kobert_analyzer()
+
+    def slow_predict_batch(texts):
+        # Stand-in for a CPU-bound forward pass
+        time.sleep(INFERENCE_SECONDS)
+        return [{"emotion_type": "중립", "confidence_score": 0.5, "all_emotions": {"중립": 0.5}} for _ in texts]
+
+    monkeypatch.setattr(analyzer, "predict_batch", slow_predict_batch)
+    monkeypatch.setattr(analyzer, "predict", lambda text: slow_predict_batch([text])[0])
+    monkeypatch.setattr(settings, "RESULT_CACHE_ENABLED", False)
+    monkeypatch.setattr(kobert_emotion_service, "_batcher", None)
+    monkeypatch.setattr(kobert_emotion_service, "_inference_pool", None)
+    yield
+
+async def _health_latencies(client, count):
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        response = await client.get("/api/health")
+        latencies.append(time.perf_counter() - start)
+        assert response.status_code == 200
+    return latencies
+
+@pytest.mark.parametrize("batching", [True, False])
+def test_health_p99_flat_under_analysis_load(slow_inference, monkeypatch, batching):
+    monkeypatch.setattr(settings, "INFERENCE_BATCHING", batching)
+    monkeypatch.setattr(settings, "INFERENCE_BATCH_MAX_SIZE", 1)
+
+    async def run():
+        async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+            baseline = await _health_latencies(client, 30)
+
+            analysis = [
+                asyncio.create_task(client.post("/api/emotions/test", json={"text": f"부하 테스트 {i}"}))
+                for i in range(8)
+            ]
+            await asyncio.sleep(0.05)
+            under_load = await _health_latencies(client, 30)
+            responses = await asyncio.gather(*analysis)
+            return baseline, under_load, responses
+
+    # Keep a cyclic GC pass from landing inside the measurement window
+    gc.collect()
+    gc.disable()
+    try:
+        baseline, under_load, responses = asyncio.run(run())
+    finally:
+        gc.enable()
+
+    assert all(r.status_code == 200 for r in responses)
+    p99_baseline = np.percentile(baseline, 99)
+    p99_under_load = np.percentile(under_load, 99)
+
+    # Analysis work is queued for ~8 * 0.3s, but health checks never wait on it
+    assert p99_under_load < INFERENCE_SECONDS / 3
+    assert p99_under_load < p99_baseline + 0.05
+
+def test_analysis_backpressure_returns_503(slow_inference, monkeypatch):
+    monkeypatch.setattr(settings, "INFERENCE_MAX_PENDING", 2)
+
+    async def run():
+        async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+            return await asyncio.gather(*(
+                client.post("/api/emotions/test", json={"text": f"대기열 테스트 {i}"})
+                for i in range(5)
+            ))
+
+    responses = asyncio.run(run())
+    status_codes = sorted(r.status_code for r in responses)
+
+    assert status_codes.count(200) == 2
+    assert status_codes.count(503) == 3
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from app.config import settings
+from app.services.kobert_emotion_service import KoBERTEmotionAnalyzer
+
+# The tiny tokenizer maps every whitespace-separated word to exactly one token
+def words(count, start=0):
+    return " ".join(f"단어{i}" for i in range(start, start + count))
+
+@pytest.fixture
+def analyzer(tiny_model_dir, monkeypatch):
+    monkeypatch.setattr(settings, "INFERENCE_BACKEND", "pytorch")
+    monkeypatch.setattr(settings, "LONG_TEXT_MODE", "chunked")
+    monkeypatch.setattr(settings, "CHUNK_MAX_TOKENS", 254)
+    monkeypatch.setattr(settings, "CHUNK_WINDOW_BATCH_SIZE", 16)
+    return KoBERTEmotionAnalyzer(model_path=str(tiny_model_dir))
+
+def test_sentences_are_packed_into_windows(analyzer):
+    text = ". ".join(words(100, start) for start in (0, 100, 200)) + "."
+
+    windows = analyzer._split_windows(text)
+
+    assert [n_tokens for _, n_tokens in windows] == [200, 100]
+    assert windows[1][0] == words(100, 200) + "."
+
+def test_oversize_sentence_is_split_on_token_boundaries(analyzer):
+    text = words(600)
+
+    windows = analyzer._split_windows(text)
+
+    assert [n_tokens for _, n_tokens in windows] == [254, 254, 92]
+    # Nothing is truncated away: the windows cover the whole sentence in order
+    assert " ".join(window for window, _ in windows) == text
+    assert windows[1][0].split()[0] == "단어254"
+
+def test_oversize_sentence_split_without_offsets(analyzer, monkeypatch):
+    monkeypatch.setattr(type(analyzer.tokenizer), "is_fast", property(lambda self: False))
+
+    windows = analyzer._split_windows(words(600))
+
+    assert [n_tokens for _, n_tokens in windows] == [254, 254, 92]
+
+def test_every_window_is_analyzed_in_bounded_batches(analyzer, monkeypatch):
+    monkeypatch.setattr(settings, "CHUNK_WINDOW_BATCH_SIZE", 4)
+    text = ". ".join(words(200, start) for start in range(0, 2000, 200)) + "."
+    forward = analyzer._forward
+    batch_sizes = []
+
+    def recording_forward(texts, max_length=512):
+        batch_sizes.append(len(texts))
+        return forward(texts, max_length=max_length)
+
+    monkeypatch.setattr(analyzer, "_forward", recording_forward)
+    result = analyzer.predict_batch([text, words(10)])[0]
+
+    # No window is dropped, however long the text is
+    assert [segment["text"].split()[0] for segment in result["segments"]] == [
+        f"단어{start}" for start in range(0, 2000, 200)
+    ]
+    assert batch_sizes == [4, 4, 3]
+
+def test_windows_are_averaged_by_token_count(analyzer):
+    windows = [("첫 윈도우", 3), ("둘째", 1)]
+    window_probs = np.zeros((2, 7))
+    window_probs[0, 0] = 1.0
+    window_probs[1, 2] = 1.0
+
+    result = analyzer._aggregate_windows(windows, window_probs)
+
+    assert result["all_emotions"][analyzer.EMOTIONS[0]] == pytest.approx(0.75)
+    assert result["all_emotions"][analyzer.EMOTIONS[2]] == pytest.approx(0.25)
+    assert [segment["text"] for segment in result["segments"]] == ["첫 윈도우", "둘째"]
+    assert result["segments"][1]["emotion_type"] == analyzer.EMOTIONS[2]
+
+def test_single_window_has_no_segments(analyzer):
+    result = analyzer._aggregate_windows([("짧은 글", 2)], np.full((1, 7), 1 / 7))
+
+    assert "segments" not in result
+
+def test_long_text_prediction_reports_segments(analyzer):
+    result = analyzer.predict(words(600))
+
+    assert result["model_type"] == "kobert"
+    assert len(result["segments"]) == 3
+    assert sum(result["all_emotions"].values()) == pytest.approx(1.0)
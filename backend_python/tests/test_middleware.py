@@ -0,0 +1,67 @@
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from loguru import logger
+
+from app.middleware import LoggingMiddleware
+
+def _make_app(success_sample_rate=1.0):
+    app = FastAPI()
+    app.add_middleware(LoggingMiddleware, success_sample_rate=success_sample_rate)
+
+    @app.get("/ok")
+    async def ok():
+        return {"ok": True}
+
+    @app.get("/missing")
+    async def missing():
+        raise HTTPException(status_code=404, detail="missing")
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"chunk-{i}\n"
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    return app
+
+def _capture_logs():
+    messages = []
+    handler_id = logger.add(lambda message: messages.append(message.record["message"]), level="INFO")
+    return messages, handler_id
+
+def test_request_id_is_shared_by_header_and_error_body(client):
+    response = client.get("/api/entries/1")
+    request_id = response.headers["X-Request-ID"]
+    assert response.json()["error"]["request_id"] == request_id
+    assert request_id != "unknown"
+
+def test_streaming_responses_pass_through():
+    client = TestClient(_make_app())
+    response = client.get("/stream")
+    assert response.text == "chunk-0\nchunk-1\nchunk-2\n"
+    assert response.headers["X-Request-ID"]
+
+def test_unhandled_exception_returns_500_with_request_id():
+    client = TestClient(_make_app(), raise_server_exceptions=False)
+    response = client.get("/boom")
+    assert response.status_code == 500
+    assert response.json()["error"]["request_id"] == response.headers["X-Request-ID"]
+
+def test_success_logs_are_sampled_but_errors_are_not():
+    client = TestClient(_make_app(success_sample_rate=0.0))
+    messages, handler_id = _capture_logs()
+    try:
+        client.get("/ok")
+        client.get("/missing")
+        logger.complete()
+    finally:
+        logger.remove(handler_id)
+
+    assert not any("/ok" in message for message in messages)
+    assert any("/missing" in message and "Status: 404" in message for message in messages)
@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+
+from app.config import settings
+from app.services import onnx_backend
+from app.services.kobert_emotion_service import KoBERTEmotionAnalyzer
+
+class FakeInput:
+    def __init__(self, name):
+        self.name = name
+
+class FakeSession:
+    """Stands in for onnxruntime.InferenceSession: logits always favor label 2 (슬픔)"""
+    instances = []
+
+    def __init__(self, path, sess_options=None, providers=None):
+        self.path = path
+        self.sess_options = sess_options
+        self.providers = providers
+        self.feeds = []
+        FakeSession.instances.append(self)
+
+    def get_inputs(self):
+        return [FakeInput("input_ids"), FakeInput("attention_mask")]
+
+    def run(self, output_names, feed):
+        self.feeds.append(feed)
+        logits = np.zeros((len(feed["input_ids"]), 7), dtype=np.float32)
+        logits[:, 2] = 5.0
+        return [logits]
+
+@pytest.fixture
+def fake_onnxruntime(monkeypatch):
+    import onnxruntime
+
+    FakeSession.instances = []
+    monkeypatch.setattr(onnxruntime, "InferenceSession", FakeSession)
+    return FakeSession
+
+@pytest.fixture
+def onnx_file(tmp_path):
+    path = tmp_path / "model_quantized.onnx"
+    path.write_bytes(b"stub")
+    return path
+
+def test_onnx_model_predict_proba_feeds_session_inputs(fake_onnxruntime, onnx_file, monkeypatch):
+    model = onnx_backend.ONNXEmotionModel(str(onnx_file), num_threads=2)
+    session = fake_onnxruntime.instances[0]
+    assert session.providers == ["CPUExecutionProvider"]
+    assert session.sess_options.intra_op_num_threads == 2
+
+    inputs = {
+        "input_ids": np.array([[2, 7, 3], [2, 8, 3]], dtype=np.int32),
+        "attention_mask": np.ones((2, 3), dtype=np.int32),
+        "token_type_ids": np.zeros((2, 3), dtype=np.int32),
+    }
+    probabilities = model.predict_proba(inputs)
+
+    # Only the graph's inputs are fed, as int64
+    feed = session.feeds[0]
+    assert set(feed) == {"input_ids", "attention_mask"}
+    assert all(value.dtype == np.int64 for value in feed.values())
+    assert probabilities.shape == (2, 7)
+    np.testing.assert_allclose(probabilities.sum(axis=1), 1.0, rtol=1e-6)
+    assert (probabilities.argmax(axis=1) == 2).all()
+
+def test_inference_backend_setting_selects_onnx(fake_onnxruntime, tiny_model_dir, onnx_file, monkeypatch):
+    monkeypatch.setattr(settings, "INFERENCE_BACKEND", "onnx")
+    monkeypatch.setattr(settings, "ONNX_MODEL_PATH", str(onnx_file))
+
+    analyzer = KoBERTEmotionAnalyzer(model_path=str(tiny_model_dir))
+
+    assert analyzer.backend == "onnx"
+    assert isinstance(analyzer.model, onnx_backend.ONNXEmotionModel)
+    assert fake_onnxruntime.instances[0].path == str(onnx_file)
+    assert ":onnx:" in analyzer.model_identity
+
+    result = analyzer.predict("가 나 다")
+    assert result["model_type"] == "kobert_onnx"
+    assert result["emotion_type"] == "슬픔"
+
+def test_missing_onnx_model_is_exported_to_configured_path(fake_onnxruntime, tiny_model_dir, tmp_path, monkeypatch):
+    target = tmp_path / "exported" / "model_quantized.onnx"
+    exported = []
+
+    def fake_export(model_path, output_path=None):
+        exported.append((model_path, output_path))
+        return output_path
+
+    monkeypatch.setattr(settings, "INFERENCE_BACKEND", "onnx")
+    monkeypatch.setattr(settings, "ONNX_MODEL_PATH", str(target))
+    monkeypatch.setattr(onnx_backend, "export_quantized_onnx", fake_export)
+
+    analyzer = KoBERTEmotionAnalyzer(model_path=str(tiny_model_dir))
+
+    assert exported == [(str(tiny_model_dir), str(target))]
+    assert analyzer.backend == "onnx"
+
+def test_missing_onnx_model_falls_back_to_pytorch(fake_onnxruntime, tiny_model_dir, tmp_path, monkeypatch):
+    def failing_export(model_path, output_path=None):
+        raise RuntimeError("export failed")
+
+    monkeypatch.setattr(settings, "INFERENCE_BACKEND", "onnx")
+    monkeypatch.setattr(settings, "ONNX_MODEL_PATH", str(tmp_path / "missing.onnx"))
+    monkeypatch.setattr(onnx_backend, "export_quantized_onnx", failing_export)
+
+    analyzer = KoBERTEmotionAnalyzer(model_path=str(tiny_model_dir))
+
+    assert analyzer.backend == "pytorch"
+    assert fake_onnxruntime.instances == []
+    assert analyzer.predict("가 나 다")["model_type"] == "kobert"
+
+def test_missing_onnx_model_without_checkpoint_uses_rules(fake_onnxruntime, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "INFERENCE_BACKEND", "onnx")
+    monkeypatch.setattr(settings, "ONNX_MODEL_PATH", str(tmp_path / "missing.onnx"))
+
+    analyzer = KoBERTEmotionAnalyzer(model_path=str(tmp_path / "no_checkpoint"))
+
+    assert analyzer.model is None
+    assert analyzer.predict("오늘 정말 기쁘다")["model_type"] == "rule_based"
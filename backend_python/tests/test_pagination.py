@@ -0,0 +1,74 @@
+import pytest
+
+from app.pagination import decode_cursor, encode_cursor
+from app.models import Entry
+from tests.test_analysis_queue import _wait_for_status
+
+def _walk(client, url, headers, limit):
+    items, cursor, pages = [], None, 0
+    # Bounded so a cursor that repeats its boundary row fails instead of looping
+    while pages < 20:
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(url, params=params, headers=headers)
+        assert response.status_code == 200
+        items.extend(response.json())
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return items, pages
+    pytest.fail("pagination did not terminate")
+
+def test_cursor_round_trip():
+    from datetime import datetime
+
+    values = [datetime(2024, 1, 2, 3, 4, 5, 678), 42]
+    assert decode_cursor(encode_cursor(values), [Entry.date, Entry.id]) == values
+
+def test_entries_paginate_newest_first_without_duplicates(client, auth_headers):
+    # Two entries share a date so the id tie-breaker decides their order
+    dates = ["2024-01-01T00:00:00", "2024-01-03T00:00:00", "2024-01-03T00:00:00",
+             "2024-01-02T12:30:00", "2024-01-05T08:00:00"]
+    created = [
+        client.post(
+            "/api/entries/",
+            json={"title": f"페이지 {i}", "content": f"페이지 테스트 {i}", "date": date},
+            headers=auth_headers,
+        ).json()
+        for i, date in enumerate(dates)
+    ]
+
+    entries, pages = _walk(client, "/api/entries/", auth_headers, limit=2)
+
+    expected = sorted(created, key=lambda entry: (entry["date"], entry["id"]), reverse=True)
+    assert [entry["id"] for entry in entries] == [entry["id"] for entry in expected]
+    assert pages == 3
+
+    for entry in created:
+        _wait_for_status(client, entry["id"], auth_headers)
+    with_emotions, _ = _walk(client, "/api/entries/?include=emotions", auth_headers, limit=2)
+    assert [entry["id"] for entry in with_emotions] == [entry["id"] for entry in expected]
+
+def test_emotions_paginate_across_same_second_rows(client, auth_headers):
+    entry_ids = [
+        client.post(
+            "/api/entries/",
+            json={"title": f"감정 {i}", "content": f"기쁜 하루 {i}", "date": "2024-04-01T00:00:00"},
+            headers=auth_headers,
+        ).json()["id"]
+        for i in range(4)
+    ]
+    for entry_id in entry_ids:
+        _wait_for_status(client, entry_id, auth_headers)
+
+    emotions, _ = _walk(client, "/api/emotions/", auth_headers, limit=1)
+
+    ids = [emotion["id"] for emotion in emotions]
+    assert len(ids) == len(set(ids)) == 4
+    assert ids == sorted(ids, reverse=True)
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor([1])])
+def test_invalid_cursor_is_rejected(client, auth_headers, cursor):
+    response = client.get("/api/entries/", params={"cursor": cursor}, headers=auth_headers)
+    assert response.status_code == 400
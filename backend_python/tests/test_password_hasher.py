@@ -0,0 +1,60 @@
+import asyncio
+import time
+
+from app.exceptions import ServiceUnavailableError, TooManyRequestsError
+from app.services.password_hasher import PasswordHasher
+
+def test_hash_and_verify_use_configured_rounds():
+    hasher = PasswordHasher(rounds=4)
+
+    async def run():
+        hashed = await hasher.hash("secret")
+        return hashed, await hasher.verify("secret", hashed), await hasher.verify("wrong", hashed)
+
+    hashed, ok, wrong = asyncio.run(run())
+    assert hashed.startswith("$2b$04$")
+    assert ok and not wrong
+    assert hasher.stats()["pending"] == 0
+
+def test_concurrent_verifications_limited_per_username(monkeypatch):
+    hasher = PasswordHasher(max_workers=4, max_per_user=1, rounds=4)
+    monkeypatch.setattr(hasher.context, "verify", lambda password, hashed: time.sleep(0.1) or True)
+
+    async def run():
+        return await asyncio.gather(
+            hasher.verify("pw", "hash", username="alice"),
+            hasher.verify("pw", "hash", username="alice"),
+            hasher.verify("pw", "hash", username="bob"),
+            return_exceptions=True,
+        )
+
+    alice_first, alice_second, bob = asyncio.run(run())
+    assert alice_first is True and bob is True
+    assert isinstance(alice_second, TooManyRequestsError)
+    assert hasher.stats()["rejected_per_user"] == 1
+    assert hasher.stats()["users_verifying"] == 0
+
+def test_rejects_when_queue_is_full(monkeypatch):
+    hasher = PasswordHasher(max_workers=1, max_pending=1, rounds=4)
+    monkeypatch.setattr(hasher.context, "hash", lambda password: time.sleep(0.1) or "hashed")
+
+    async def run():
+        return await asyncio.gather(hasher.hash("a"), hasher.hash("b"), return_exceptions=True)
+
+    first, second = asyncio.run(run())
+    assert first == "hashed"
+    assert isinstance(second, ServiceUnavailableError)
+    assert hasher.stats()["rejected"] == 1
+
+def test_login_and_password_change(client, auth_headers):
+    me = client.get("/api/auth/me", headers=auth_headers).json()
+    response = client.put(f"/api/users/{me['id']}", json={"password": "new-password"}, headers=auth_headers)
+    assert response.status_code == 200
+
+    old = client.post("/api/auth/token", data={"username": me["username"], "password": "test-password"})
+    assert old.status_code == 401
+    new = client.post("/api/auth/token", data={"username": me["username"], "password": "new-password"})
+    assert new.status_code == 200
+
+    diagnostics = client.get("/api/diagnostics/auth", headers=auth_headers).json()
+    assert diagnostics["password_hasher"]["pending"] == 0
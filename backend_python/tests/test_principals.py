@@ -0,0 +1,86 @@
+import uuid
+
+from app import cache as cache_module
+from app import principals
+from tests.test_queries import count_queries
+
+class SharedTier:
+    """In-process stand-in for the Redis tier that two replicas share"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key, cache_module._MISSING)
+
+    def set(self, key, value):
+        self.data[key] = value
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+def _register(client):
+    username = f"user_{uuid.uuid4().hex[:8]}"
+    password = "test-password"
+    user_id = client.post(
+        "/api/auth/register",
+        json={"email": f"{username}@example.com", "username": username, "password": password},
+    ).json()["id"]
+    token = client.post(
+        "/api/auth/token", data={"username": username, "password": password}
+    ).json()["access_token"]
+    return user_id, username, {"Authorization": f"Bearer {token}"}
+
+def _user_selects(statements):
+    return [s for s in statements if "FROM users" in s]
+
+def test_authenticated_requests_skip_user_lookup(client):
+    _, username, headers = _register(client)
+    assert client.get("/api/auth/me", headers=headers).json()["username"] == username
+
+    with count_queries() as statements:
+        response = client.get("/api/auth/me", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["username"] == username
+    assert response.json()["created_at"]
+    assert _user_selects(statements) == []
+
+def test_cached_principal_lazy_loads_relationships(client):
+    user_id, _, headers = _register(client)
+    client.get("/api/auth/me", headers=headers)
+
+    response = client.put(f"/api/users/{user_id}", json={"full_name": "캐시 사용자"}, headers=headers)
+    assert response.status_code == 200
+    assert client.get("/api/auth/me", headers=headers).json()["full_name"] == "캐시 사용자"
+
+def test_username_change_invalidates_old_subject(client):
+    user_id, _, headers = _register(client)
+    client.get("/api/auth/me", headers=headers)
+
+    new_username = f"renamed_{uuid.uuid4().hex[:8]}"
+    client.put(f"/api/users/{user_id}", json={"username": new_username}, headers=headers)
+    assert client.get("/api/auth/me", headers=headers).status_code == 401
+
+def test_deleted_user_is_rejected(client):
+    user_id, _, headers = _register(client)
+    client.get("/api/auth/me", headers=headers)
+
+    assert client.delete(f"/api/users/{user_id}", headers=headers).status_code == 200
+    assert client.get("/api/auth/me", headers=headers).status_code == 401
+
+def test_invalidation_reaches_other_replicas(monkeypatch):
+    tier = SharedTier()
+    monkeypatch.setattr(principals, "make_redis_tier", lambda prefix, ttl=None: tier)
+
+    def replica_cache():
+        monkeypatch.setattr(principals, "_principal_cache", None)
+        return principals.get_principal_cache()
+
+    replica_a, replica_b = replica_cache(), replica_cache()
+    replica_a.set("alice", {"username": "alice"})
+    assert replica_b.get("alice") == {"username": "alice"}
+    assert replica_a.get("alice") == {"username": "alice"}
+
+    # A password change or deletion handled by replica B
+    replica_b.delete("alice")
+    assert replica_a.get("alice") is None
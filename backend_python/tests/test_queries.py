@@ -0,0 +1,76 @@
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from tests.conftest import engine
+from tests.test_analysis_queue import _wait_for_status
+
+@contextmanager
+def count_queries():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+def _create_entries(client, headers, count):
+    entry_ids = []
+    for i in range(count):
+        entry_ids.append(client.post(
+            "/api/entries/",
+            json={"title": f"목록 {i}", "content": f"오늘은 기쁜 하루 {i}", "date": "2024-03-01T00:00:00"},
+            headers=headers,
+        ).json()["id"])
+    # Let the background worker finish so its queries don't land in the count
+    for entry_id in entry_ids:
+        _wait_for_status(client, entry_id, headers)
+    return entry_ids
+
+def _listing_query_count(client, headers):
+    with count_queries() as statements:
+        response = client.get("/api/entries/?include=emotions", headers=headers)
+    assert response.status_code == 200
+    return response.json(), len(statements)
+
+def test_listing_with_emotions_uses_constant_queries(client, auth_headers):
+    _create_entries(client, auth_headers, 2)
+    entries, small_count = _listing_query_count(client, auth_headers)
+    assert len(entries) == 2
+    assert all(len(entry["emotions"]) == 1 for entry in entries)
+
+    _create_entries(client, auth_headers, 5)
+    entries, large_count = _listing_query_count(client, auth_headers)
+    assert len(entries) == 7
+
+    # entries page + one IN query for all emotions (current user is cached)
+    assert small_count == large_count == 2
+
+def test_listing_without_include_omits_emotions(client, auth_headers):
+    _create_entries(client, auth_headers, 1)
+    entries = client.get("/api/entries/", headers=auth_headers).json()
+    assert "emotions" not in entries[0]
+
+    response = client.get("/api/entries/?include=tags", headers=auth_headers)
+    assert response.status_code == 400
+
+def test_read_entry_loads_emotions_eagerly(client, auth_headers):
+    entry_id = _create_entries(client, auth_headers, 1)[0]
+
+    with count_queries() as statements:
+        response = client.get(f"/api/entries/{entry_id}", headers=auth_headers)
+    assert len(response.json()["emotions"]) == 1
+    assert len(statements) == 2
+
+def test_user_with_entries_uses_constant_queries(client, auth_headers):
+    _create_entries(client, auth_headers, 3)
+    user_id = client.get("/api/auth/me", headers=auth_headers).json()["id"]
+
+    with count_queries() as statements:
+        response = client.get(f"/api/users/{user_id}/entries")
+    assert len(response.json()["entries"]) == 3
+    assert len(statements) == 2
@@ -0,0 +1,49 @@
+"""
+EXPLAIN QUERY PLAN regressions for ownership-scoped queries on SQLite.
+"""
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from app.models import Emotion, Entry
+from app.queries import owned_emotions
+
+@pytest.fixture
+def plan_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as session:
+        yield session
+
+def _query_plan(session, query):
+    sql = str(query.statement.compile(session.bind, compile_kwargs={"literal_binds": True}))
+    return [row[3] for row in session.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+
+def test_owned_emotion_lookup_is_a_single_join(plan_session):
+    plan = _query_plan(plan_session, owned_emotions(plan_session, 1).filter(Emotion.id == 5))
+
+    assert not any("SUBQUERY" in step for step in plan)
+    assert plan == [
+        "SEARCH emotions USING INTEGER PRIMARY KEY (rowid=?)",
+        "SEARCH entries USING INTEGER PRIMARY KEY (rowid=?)",
+    ]
+
+def test_owned_emotions_listing_uses_foreign_key_indexes(plan_session):
+    query = owned_emotions(plan_session, 1).order_by(Emotion.created_at.desc(), Emotion.id.desc())
+    plan = _query_plan(plan_session, query)
+
+    assert not any("SUBQUERY" in step or step.startswith("SCAN") for step in plan)
+    assert any("ix_entries_user_date_id (user_id=?)" in step for step in plan)
+    assert any("ix_emotions_entry_created_at (entry_id=?)" in step for step in plan)
+
+def test_entries_page_reads_the_keyset_index_in_order(plan_session):
+    query = (
+        plan_session.query(Entry)
+        .filter(Entry.user_id == 1)
+        .order_by(Entry.date.desc(), Entry.id.desc())
+        .limit(101)
+    )
+    plan = _query_plan(plan_session, query)
+
+    assert plan == ["SEARCH entries USING INDEX ix_entries_user_date_id (user_id=?)"]
@@ -0,0 +1,87 @@
+import uuid
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from app.models import EntrySearchDocument
+from app.search import highlight, query_terms, tokenize
+
+def test_tokenize_uses_bigrams_for_korean():
+    assert tokenize("행복한 하루 Happy") == ["행복", "복한", "한", "하루", "루", "happy"]
+    assert query_terms("행복한") == [("행복", False), ("복한", False)]
+    assert query_terms("꿈 hap") == [("꿈", True), ("hap", True)]
+
+def test_highlight_marks_terms_and_escapes_html():
+    content = "<b>평범한</b> 아침이었지만 오후에는 정말 행복한 일이 있었다"
+    snippet = highlight(content, "행복", context=10)
+
+    assert "<mark>행복</mark>" in snippet
+    assert snippet.startswith("…")
+    assert "<b>" not in highlight(content, "평범")
+
+def test_postgresql_uses_gin_index():
+    index = next(i for i in EntrySearchDocument.__table__.indexes if i.name == "ix_entry_search_documents_tsv")
+    ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+    assert "USING gin (to_tsvector('simple'::regconfig, document))" in ddl
+
+def _create(client, headers, title, content, date="2024-06-01T00:00:00"):
+    return client.post(
+        "/api/entries/", json={"title": title, "content": content, "date": date}, headers=headers
+    ).json()["id"]
+
+def _search(client, headers, q):
+    response = client.get("/api/entries/search", params={"q": q}, headers=headers)
+    assert response.status_code == 200
+    return response.json()
+
+def test_search_ranks_and_highlights(client, auth_headers):
+    once = _create(client, auth_headers, "산책", "공원을 걸으니 행복했다")
+    twice = _create(client, auth_headers, "행복한 저녁", "가족과 함께해서 행복하고 또 행복했다")
+    _create(client, auth_headers, "야근", "오늘은 피곤하고 힘들었다")
+
+    hits = _search(client, auth_headers, "행복")
+    assert [hit["entry"]["id"] for hit in hits] == [twice, once]
+    assert hits[0]["score"] >= hits[1]["score"]
+    assert "<mark>행복</mark>" in hits[1]["highlight"]
+
+    # Single-syllable and partial latin queries match through prefix terms
+    dream = _create(client, auth_headers, "메모", "어젯밤 이상한 꿈을 꿨다 dreaming")
+    assert [hit["entry"]["id"] for hit in _search(client, auth_headers, "꿈")] == [dream]
+    assert [hit["entry"]["id"] for hit in _search(client, auth_headers, "DREAM")] == [dream]
+
+def test_search_index_follows_update_and_delete(client, auth_headers):
+    entry_id = _create(client, auth_headers, "여행", "바다를 보러 부산에 갔다")
+    assert [hit["entry"]["id"] for hit in _search(client, auth_headers, "부산")] == [entry_id]
+
+    client.put(f"/api/entries/{entry_id}", json={"content": "산을 보러 강릉에 갔다"}, headers=auth_headers)
+    assert _search(client, auth_headers, "부산") == []
+    assert [hit["entry"]["id"] for hit in _search(client, auth_headers, "강릉")] == [entry_id]
+
+    client.delete(f"/api/entries/{entry_id}", headers=auth_headers)
+    assert _search(client, auth_headers, "강릉") == []
+
+def test_search_is_scoped_to_current_user(client, auth_headers):
+    marker = uuid.uuid4().hex[:8]
+    _create(client, auth_headers, "비밀", f"나만 아는 이야기 {marker}")
+
+    username = f"other_{uuid.uuid4().hex[:8]}"
+    client.post("/api/auth/register", json={"email": f"{username}@example.com", "username": username, "password": "pw"})
+    token = client.post("/api/auth/token", data={"username": username, "password": "pw"}).json()["access_token"]
+    other_headers = {"Authorization": f"Bearer {token}"}
+
+    assert _search(client, other_headers, marker) == []
+    assert len(_search(client, auth_headers, marker)) == 1
+    assert client.get("/api/entries/search", headers=auth_headers).status_code == 422
+
+def test_rebuild_index_restores_search(client, auth_headers):
+    from app.search import rebuild_index
+    from tests.conftest import engine
+
+    marker = uuid.uuid4().hex[:8]
+    entry_id = _create(client, auth_headers, "재색인", f"다시 만든 색인 {marker}")
+
+    with engine.begin() as conn:
+        rebuild_index(conn)
+
+    assert [hit["entry"]["id"] for hit in _search(client, auth_headers, marker)] == [entry_id]
+    assert len(_search(client, auth_headers, "색인")) == 1
@@ -0,0 +1,63 @@
+import asyncio
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from app.services import kobert_emotion_service
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+@pytest.fixture
+def warmup_state(monkeypatch):
+    monkeypatch.setattr(
+        kobert_emotion_service, "_warmup", {"mode": None, "state": "pending", "seconds": None, "error": None}
+    )
+    return kobert_emotion_service._warmup
+
+def test_service_import_defers_ml_frameworks():
+    code = (
+        "import sys; import app.services.kobert_emotion_service; "
+        "print('torch' in sys.modules, 'transformers' in sys.modules)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    ).stdout.split()
+    assert output == ["False", "False"]
+
+def test_readiness_endpoint_reports_warmup(client):
+    for _ in range(100):
+        response = client.get("/api/health/ready")
+        if response.status_code == 200:
+            break
+        assert response.json()["state"] in ("pending", "running")
+        time.sleep(0.05)
+    assert response.status_code == 200
+    assert response.json()["ready"] is True
+    assert client.get("/api/health").status_code == 200
+
+def test_lazy_mode_is_ready_immediately(warmup_state):
+    asyncio.run(kobert_emotion_service.start_warmup("lazy"))
+    assert kobert_emotion_service.readiness()["ready"] is True
+    assert warmup_state["seconds"] is None
+
+def test_eager_mode_waits_for_model(warmup_state):
+    asyncio.run(kobert_emotion_service.start_warmup("eager"))
+    state = kobert_emotion_service.readiness()
+    assert state["ready"] is True and state["mode"] == "eager"
+    assert state["seconds"] is not None
+
+def test_background_mode_not_ready_until_warm(warmup_state, monkeypatch):
+    monkeypatch.setattr(kobert_emotion_service, "warm_up_model", lambda: time.sleep(0.2))
+
+    async def run():
+        await kobert_emotion_service.start_warmup("background")
+        return kobert_emotion_service.readiness()["ready"]
+
+    assert asyncio.run(run()) is False
+
+def test_unknown_mode_rejected(warmup_state):
+    with pytest.raises(ValueError):
+        asyncio.run(kobert_emotion_service.start_warmup("sometimes"))
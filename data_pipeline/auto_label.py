@@ -2,10 +2,20 @@
 자동 라벨링 스크립트
 """
 
+import argparse
+import os
 import pandas as pd
 import re
+import sys
+from collections import Counter
 from pathlib import Path
 
+# src 모듈은 서로를 이름으로 import하므로 (from dedup import ...) src를 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
+from dataset import iter_batches, latest_crawled  # noqa: E402
+from lexicon import KeywordLexicon  # noqa: E402
+
 class SimpleEmotionLabeler:
     """간단한 규칙 기반 감정 라벨러"""
     
@@ -18,18 +28,14 @@ class SimpleEmotionLabeler:
         "혐오": ["더러", "역겨", "싫", "혐오", "구역", "토", "못참", "지겨", "답답", "짜증", "역겨워"],
         "중립": ["그냥", "평범", "보통", "일반", "무난", "평소", "항상", "매일", "소식", "안내"]
     }
+    LEXICON = KeywordLexicon(EMOTION_KEYWORDS)
     
     def predict_emotion_rule_based(self, text: str) -> str:
         """규칙 기반 감정 예측"""
         if not text:
             return "중립"
         
-        text = text.lower()
-        emotion_scores = {}
-        
-        for emotion, keywords in self.EMOTION_KEYWORDS.items():
-            score = sum(text.count(keyword) for keyword in keywords)
-            emotion_scores[emotion] = score
+        emotion_scores = self.LEXICON.count(text.lower())
         
         # 가장 높은 점수의 감정 반환
         if max(emotion_scores.values()) == 0:
@@ -38,32 +44,39 @@ class SimpleEmotionLabeler:
         return max(emotion_scores, key=emotion_scores.get)
 
 def main():
+    parser = argparse.ArgumentParser(description="규칙 기반 자동 라벨링")
+    parser.add_argument("--input", help="크롤링 데이터셋 디렉토리나 CSV 파일 (기본값: data/raw/crawled, 없으면 최근 CSV)")
+    parser.add_argument("--output", default="data/labeled/auto_labeled_data.csv")
+    parser.add_argument("--batch-size", type=int, default=10000)
+    args = parser.parse_args()
+    
     # 라벨러 인스턴스 생성
     labeler = SimpleEmotionLabeler()
     
-    # 수집된 데이터 로드
-    df = pd.read_csv('data/raw/crawled_data_20251015_165830.csv')
-    print(f'로드된 데이터: {len(df)}개')
+    # 수집된 데이터를 배치 단위로 읽어 라벨링하고 바로 저장 (필요한 컬럼만 로드)
+    input_path = args.input or latest_crawled()
+    print(f'입력 데이터: {input_path}')
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
     
-    # 자동 라벨링 실행
-    labeled_data = []
-    for idx, row in df.iterrows():
-        emotion = labeler.predict_emotion_rule_based(row['text'])
-        labeled_data.append({
-            'text': row['text'][:500],  # 텍스트 길이 제한
-            'emotion': emotion,
-            'source': row['source'],
+    total = 0
+    emotion_counts = Counter()
+    for batch in iter_batches(input_path, columns=['text', 'source'], batch_size=args.batch_size):
+        batch = batch.dropna(subset=['text'])
+        labeled_df = pd.DataFrame({
+            'text': batch['text'].str[:500],  # 텍스트 길이 제한
+            'emotion': [labeler.predict_emotion_rule_based(text) for text in batch['text']],
+            'source': batch['source'],
             'confidence': 0.6  # 규칙 기반이므로 낮은 신뢰도
         })
-        if idx % 50 == 0:
-            print(f'진행: {idx+1}/{len(df)}')
+        labeled_df.to_csv(args.output, mode='w' if total == 0 else 'a', header=total == 0,
+                          index=False, encoding='utf-8-sig')
+        total += len(labeled_df)
+        emotion_counts.update(labeled_df['emotion'])
+        print(f'진행: {total}개')
     
-    # 라벨링된 데이터 저장
-    labeled_df = pd.DataFrame(labeled_data)
-    labeled_df.to_csv('data/labeled/auto_labeled_data.csv', index=False, encoding='utf-8-sig')
-    print(f'자동 라벨링 완료: {len(labeled_df)}개 데이터 저장')
+    print(f'자동 라벨링 완료: {total}개 데이터 저장 ({args.output})')
     print(f'감정 분포:')
-    print(labeled_df['emotion'].value_counts())
+    print(pd.Series(emotion_counts).sort_values(ascending=False))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
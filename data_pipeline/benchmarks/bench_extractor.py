@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+"""
+HTML 추출 성능 측정 (파서 백엔드별, 프로세스 풀)
+- 저장된 HTML 픽스처({source}_list_*.html, {source}_article_*.html)로 크롤러의 RULES 추출 시간을 측정
+  픽스처 디렉토리가 비어 있으면 실제 페이지 크기와 비슷한 합성 페이지를 만들어 저장
+- 백엔드별: 현재 프로세스에서 순차 처리한 초당 페이지 수, html.parser 결과와 다른 페이지 수
+- HtmlParser(workers=N): 모든 페이지를 동시에 요청했을 때 처리량과 이벤트 루프 최대 지연
+  (지연이 작을수록 파싱 중에도 수집 코루틴이 계속 실행됨)
+
+사용법:
+    python benchmarks/bench_extractor.py
+    python benchmarks/bench_extractor.py --fixtures data/html_fixtures --workers 0 2 4
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PIPELINE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PIPELINE_DIR, "src"))
+
+from crawler import BlogCrawler, DCInsideCrawler, NaverCafeCrawler  # noqa: E402
+from extractor import BACKENDS, HtmlParser, extract_content, extract_links, get_extractor  # noqa: E402
+
+RULES = {
+    "naver_cafe": NaverCafeCrawler.RULES,
+    "dcinside": DCInsideCrawler.RULES,
+    "blog": BlogCrawler.RULES,
+}
+WORDS = "오늘 정말 회사 친구 기분 하루 너무 좋다 힘들다 우울 행복 스트레스 주말 여행 가족 그냥 진짜 대박".split()
+
+
+def sentence(rng, words=12):
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def page(body, rng):
+    """본문 외에 스크립트, 메뉴, 광고 등 실제 페이지에 있는 요소를 함께 넣은 HTML"""
+    scripts = "".join(f"<script>var ad{i} = {{slot: {i}, data: '{'x' * 400}'}};</script>" for i in range(15))
+    menu = "".join(f'<li class="menu-item"><a href="/menu/{i}">{sentence(rng, 2)}</a></li>' for i in range(80))
+    sidebar = "".join(f'<div class="widget"><span class="w-title">{sentence(rng, 3)}</span>'
+                      f'<p>{sentence(rng, 20)}</p></div>' for i in range(30))
+    return (f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>{sentence(rng, 3)}</title>{scripts}</head>'
+            f'<body><div id="wrap"><ul class="gnb">{menu}</ul><div id="container">{body}</div>'
+            f'<aside>{sidebar}</aside></div></body></html>')
+
+
+def list_page(source, rng, rows=50):
+    if source == "naver_cafe":
+        items = "".join(
+            f'<tr class="board-list"><td class="td_article"><a class="article" href="/ArticleRead.nhn?articleid={i}">'
+            f'{sentence(rng, 5)}</a><span class="cmt">[{i % 9}]</span></td><td class="td_name">user{i}</td></tr>'
+            for i in range(rows)
+        )
+        return page(f"<table>{items}</table>", rng)
+    if source == "dcinside":
+        items = "".join(
+            f'<tr class="ub-content us-post"><td class="gall_tit"><a href="/board/view/?id=humor&no={i}">'
+            f'<em class="icon_img"></em>{sentence(rng, 5)}</a><a class="reply_numbox" href="#">[{i % 9}]</a></td>'
+            f'<td class="gall_writer">익명</td></tr>'
+            for i in range(rows)
+        )
+        return page(f"<table>{items}</table>", rng)
+    items = "".join(
+        f'<li class="bx"><a class="api_txt_lines total_tit" href="https://blog.naver.com/u{i}/{i}">{sentence(rng, 6)}</a>'
+        f'<div class="dsc_txt">{sentence(rng, 25)}</div></li>'
+        for i in range(rows)
+    )
+    return page(f"<ul class='lst_total'>{items}</ul>", rng)
+
+
+def article_page(source, rng, paragraphs=40):
+    text = "".join(f"<p>{sentence(rng)} <span>😀</span> <b>{sentence(rng, 4)}</b></p>" for _ in range(paragraphs))
+    comments = "".join(f'<li class="comment">{sentence(rng, 8)}</li>' for _ in range(30))
+    container = {
+        "naver_cafe": "div.se-main-container",
+        "dcinside": "div.writing_view_box",
+        # 블로그는 우선순위가 낮은 선택자에서 일치하는 경우 (다른 선택자를 모두 먼저 시도)
+        "blog": "article",
+    }[source]
+    tag, cls = container.split(".") if "." in container else (container, "")
+    return page(f'<{tag} class="{cls}">{text}</{tag}><ul class="comments">{comments}</ul>', rng)
+
+
+def build_fixtures(directory, lists, articles, seed=0):
+    rng = random.Random(seed)
+    for source in RULES:
+        for i in range(lists):
+            Path(directory, f"{source}_list_{i}.html").write_text(list_page(source, rng), encoding="utf-8")
+        for i in range(articles):
+            Path(directory, f"{source}_article_{i}.html").write_text(article_page(source, rng), encoding="utf-8")
+
+
+def load_fixtures(directory):
+    """[(source, kind, body)]"""
+    fixtures = []
+    for path in sorted(Path(directory).glob("*.html")):
+        source, kind = path.stem.rsplit("_", 2)[:2]
+        if source in RULES and kind in ("list", "article"):
+            fixtures.append((source, kind, path.read_bytes()))
+    return fixtures
+
+
+def extract(backend, source, kind, body):
+    if kind == "list":
+        return extract_links(backend, RULES[source], body)
+    return extract_content(backend, RULES[source], body)
+
+
+def bench_backend(backend, fixtures, repeat):
+    for source in RULES:
+        get_extractor(backend, RULES[source])  # 규칙 컴파일은 측정에서 제외
+    start = time.perf_counter()
+    for _ in range(repeat):
+        results = [extract(backend, *fixture) for fixture in fixtures]
+    return len(fixtures) * repeat / (time.perf_counter() - start), results
+
+
+async def bench_pool(backend, workers, fixtures, repeat):
+    parser = HtmlParser(backend, workers)
+    await parser.content(RULES["blog"], fixtures[0][2])  # 프로세스 시작은 측정에서 제외
+
+    max_lag = 0.0
+    running = True
+
+    async def ticker():
+        nonlocal max_lag
+        while running:
+            before = time.perf_counter()
+            await asyncio.sleep(0.001)
+            max_lag = max(max_lag, time.perf_counter() - before - 0.001)
+
+    tick = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await asyncio.gather(*(
+            parser.links(RULES[source], body) if kind == "list" else parser.content(RULES[source], body)
+            for source, kind, body in fixtures
+        ))
+    elapsed = time.perf_counter() - start
+    running = False
+    await tick
+    parser.close()
+    return len(fixtures) * repeat / elapsed, max_lag * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 추출 성능 측정")
+    parser.add_argument("--fixtures", default=None, help="HTML 픽스처 디렉토리 (비어 있으면 합성 페이지 생성)")
+    parser.add_argument("--lists", type=int, default=10, help="합성 목록 페이지 수 (소스별)")
+    parser.add_argument("--articles", type=int, default=50, help="합성 글 페이지 수 (소스별)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=list(BACKENDS))
+    parser.add_argument("--workers", nargs="+", type=int, default=[0, 2, 4], help="HtmlParser 프로세스 수 (0: 이벤트 루프)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = args.fixtures or tmp
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        if not load_fixtures(directory):
+            print(f"합성 픽스처 생성: {directory}")
+            build_fixtures(directory, args.lists, args.articles)
+        fixtures = load_fixtures(directory)
+        size_mb = sum(len(body) for _, _, body in fixtures) / 1024 / 1024
+        print(f"페이지 {len(fixtures)}개, {size_mb:.1f} MB (CPU {os.cpu_count()}개)\n")
+
+        print(f"{'backend':<14}{'pages/s':>10}{'MB/s':>8}{'speedup':>9}{'mismatch':>10}")
+        baseline_rate, baseline = bench_backend("html.parser", fixtures, 1)
+        for backend in args.backends:
+            rate, results = bench_backend(backend, fixtures, args.repeat)
+            mismatch = sum(result != expected for result, expected in zip(results, baseline))
+            print(f"{backend:<14}{rate:>10.0f}{rate * size_mb / len(fixtures):>8.1f}"
+                  f"{rate / baseline_rate:>8.1f}x{mismatch:>10}")
+
+        best = args.backends[0]
+        print(f"\nHtmlParser ({best})")
+        print(f"{'workers':<14}{'pages/s':>10}{'max loop lag (ms)':>20}")
+        for workers in args.workers:
+            rate, lag = asyncio.run(bench_pool(best, workers, fixtures, args.repeat))
+            print(f"{workers:<14}{rate:>10.0f}{lag:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
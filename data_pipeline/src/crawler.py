@@ -6,18 +6,21 @@
 - 블로그 포스트
 """
 
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+import argparse
+import asyncio
 import json
-import time
-import random
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from urllib.parse import quote, urljoin
 from loguru import logger
-import re
 from dataclasses import dataclass
 
+from fetcher import AsyncFetcher, CrawlSettings
+from frontier import CrawlFrontier
+from dataset import CRAWLED_DATASET, DatasetWriter
+from dedup import NearDuplicateIndex
+from extractor import HtmlParser, SiteRules, clean_text
+
 @dataclass
 class CrawlResult:
     text: str
@@ -27,66 +30,153 @@ class CrawlResult:
     metadata: Dict
 
 class BaseCrawler:
-    def __init__(self, delay_range=(1, 3)):
-        self.delay_range = delay_range
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+    """크롤러 공통 기능
+
+    목록 페이지는 순서대로, 각 페이지의 글 본문은 AsyncFetcher로 동시에 가져옴
+    HTML 파싱/정제는 RULES(사이트별 선택자)로 HtmlParser가 처리 (설정에 따라 프로세스 풀에서)
+    base_url을 바꾸면 로컬 테스트 서버 등 다른 주소를 크롤링할 수 있음
+    frontier가 있으면 이미 본 글은 건너뛰고, 새 글이 없는 페이지에서 목록 탐색을 멈춤
+    sink가 있으면 결과를 반환 목록에 모으지 않고 도착하는 대로 sink로 보냄
+    """
+    BASE_URL = ""
+    SOURCE = ""
+    RULES = SiteRules()
     
-    def random_delay(self):
-        """랜덤 지연으로 차단 방지"""
-        delay = random.uniform(*self.delay_range)
-        time.sleep(delay)
+    def __init__(self, settings: Optional[CrawlSettings] = None, base_url: Optional[str] = None,
+                 frontier: Optional[CrawlFrontier] = None, sink: Optional[Callable[[CrawlResult], None]] = None,
+                 parser: Optional[HtmlParser] = None):
+        self.settings = settings or CrawlSettings()
+        self.base_url = (base_url or self.BASE_URL).rstrip('/')
+        self.frontier = frontier
+        self.sink = sink
+        self.parser = parser or HtmlParser(self.settings.parser, self.settings.parse_workers)
     
-    def clean_text(self, text: str) -> str:
-        """텍스트 정제"""
-        if not text:
+    def url(self, path: str) -> str:
+        """base_url 기준 절대 URL (이미 절대 URL이면 그대로)"""
+        return urljoin(self.base_url + '/', path)
+    
+    def run(self, crawl: Callable[..., Awaitable[List[CrawlResult]]], *args: Any) -> List[CrawlResult]:
+        """동기 호출용: 새 이벤트 루프와 fetcher로 크롤링 코루틴 실행"""
+        async def main():
+            async with AsyncFetcher(self.settings) as fetcher:
+                return await crawl(fetcher, *args)
+        return asyncio.run(main())
+    
+    async def fetch_links(self, fetcher: AsyncFetcher, url: str) -> Optional[List[tuple]]:
+        """목록 페이지의 (절대 URL, 제목) 목록, 가져오지 못하면 None"""
+        body = await fetcher.get(url)
+        if body is None:
+            return None
+        return [(self.url(href), title) for href, title in await self.parser.links(self.RULES, body)]
+    
+    async def fetch_text(self, fetcher: AsyncFetcher, url: str) -> Optional[str]:
+        """글 본문 (선택자 중 처음 일치하는 요소의 정제된 텍스트), 가져오지 못하면 None"""
+        try:
+            body = await fetcher.get(url)
+            if body is None:
+                return None
+            return await self.parser.content(self.RULES, body)
+        except Exception as e:
+            logger.debug(f"본문 파싱 실패: {url} ({e})")
             return ""
+    
+    def emit(self, results: List[CrawlResult], result: CrawlResult):
+        """결과를 sink로 보내거나 (sink가 없으면) 반환 목록에 추가"""
+        if self.sink is not None:
+            self.sink(result)
+        else:
+            results.append(result)
+    
+    def accept(self, content: str) -> bool:
+        """수집할 본문인지"""
+        return bool(content)
+    
+    async def collect_articles(self, fetcher: AsyncFetcher, links: List[tuple], metadata: Dict) -> List[CrawlResult]:
+        """(url, 제목) 목록의 본문을 동시에 가져와 결과로 변환 (frontier에 처리 결과 기록)"""
+        contents = await asyncio.gather(*(self.fetch_text(fetcher, url) for url, _ in links))
         
-        # HTML 태그 제거
-        text = re.sub(r'<[^>]+>', '', text)
-        # 특수문자 정규화
-        text = re.sub(r'\s+', ' ', text)
-        # 이모지 제거 (선택적)
-        text = re.sub(r'[^\w\s가-힣ㄱ-ㅎㅏ-ㅣ]', ' ', text)
-        
-        return text.strip()
+        results = []
+        for (url, title), content in zip(links, contents):
+            if content is None:
+                if self.frontier is not None:
+                    self.frontier.retry_later(url, self.SOURCE)
+                continue
+            
+            result = None
+            if self.accept(content):
+                result = CrawlResult(
+                    text=f"{title} {content}",
+                    source=self.SOURCE,
+                    url=url,
+                    timestamp=datetime.now(),
+                    metadata=metadata
+                )
+            # sink가 파일로 내보낸 뒤 내보내기 표시를 할 수 있도록 프런티어에 먼저 기록
+            if self.frontier is not None:
+                self.frontier.complete(url, self.SOURCE, result.text if result else None, metadata)
+            if result is not None:
+                self.emit(results, result)
+        return results
+    
+    async def collect_page(self, fetcher: AsyncFetcher, links: List[tuple], metadata: Dict) -> Optional[List[CrawlResult]]:
+        """목록 한 페이지의 글 수집, 모두 이미 본 글이면 None (목록 탐색 중단 신호)"""
+        if self.frontier is not None:
+            new_links = self.frontier.enqueue(self.SOURCE, links, metadata)
+            if links and not new_links and self.frontier.stop_on_seen:
+                return None
+            links = new_links
+        return await self.collect_articles(fetcher, links, metadata)
+    
+    async def resume(self, fetcher: AsyncFetcher) -> List[CrawlResult]:
+        """이전 실행에서 본문을 가져오지 못하고 남은 글 수집"""
+        if self.frontier is None:
+            return []
+        pending = self.frontier.pending(self.SOURCE)
+        # 메타데이터(게시판)별로 묶어 한 번에 요청, 속도는 fetcher의 호스트별 제한이 조절
+        groups: Dict[str, tuple] = {}
+        for url, title, metadata in pending:
+            key = json.dumps(metadata, sort_keys=True, ensure_ascii=False)
+            groups.setdefault(key, (metadata, []))[1].append((url, title))
+        collected = await asyncio.gather(
+            *(self.collect_articles(fetcher, links, metadata) for metadata, links in groups.values())
+        )
+        results = [result for group in collected for result in group]
+        if pending:
+            logger.info(f"{self.SOURCE}: 이전 실행의 대기 글 {len(pending)}개 처리")
+        return results
+    
+    def clean_text(self, text: str) -> str:
+        """텍스트 정제"""
+        return clean_text(text)
 
 class NaverCafeCrawler(BaseCrawler):
     """네이버 카페 글 크롤링"""
+    BASE_URL = "https://cafe.naver.com"
+    SOURCE = "naver_cafe"
+    RULES = SiteRules(rows='tr.board-list', link='a.article', content=('div.se-main-container',))
     
     def crawl_cafe_posts(self, cafe_id: str, board_id: str, max_pages: int = 10) -> List[CrawlResult]:
+        return self.run(self.crawl_cafe_posts_async, cafe_id, board_id, max_pages)
+    
+    async def crawl_cafe_posts_async(self, fetcher: AsyncFetcher, cafe_id: str, board_id: str,
+                                     max_pages: int = 10) -> List[CrawlResult]:
         results = []
         
         for page in range(1, max_pages + 1):
             try:
-                url = f"https://cafe.naver.com/ArticleList.nhn?search.clubid={cafe_id}&search.boardtype=L&search.menuid={board_id}&search.page={page}"
+                url = self.url(f"/ArticleList.nhn?search.clubid={cafe_id}&search.boardtype=L&search.menuid={board_id}&search.page={page}")
                 
-                response = self.session.get(url)
-                soup = BeautifulSoup(response.content, 'html.parser')
+                links = await self.fetch_links(fetcher, url)
+                if links is None:
+                    continue
                 
-                articles = soup.find_all('tr', class_='board-list')
+                # 개별 글 내용 동시에 가져오기
+                page_results = await self.collect_page(fetcher, links, {"cafe_id": cafe_id, "board_id": board_id})
+                if page_results is None:
+                    logger.info(f"네이버 카페 {page}페이지: 새 글 없음, 목록 탐색 종료")
+                    break
+                results.extend(page_results)
                 
-                for article in articles:
-                    title_elem = article.find('a', class_='article')
-                    if title_elem:
-                        article_url = "https://cafe.naver.com" + title_elem.get('href')
-                        title = title_elem.text.strip()
-                        
-                        # 개별 글 내용 가져오기
-                        content = self._get_article_content(article_url)
-                        
-                        if content:
-                            results.append(CrawlResult(
-                                text=f"{title} {content}",
-                                source="naver_cafe",
-                                url=article_url,
-                                timestamp=datetime.now(),
-                                metadata={"cafe_id": cafe_id, "board_id": board_id}
-                            ))
-                
-                self.random_delay()
                 logger.info(f"네이버 카페 {page}페이지 크롤링 완료")
                 
             except Exception as e:
@@ -94,53 +184,33 @@ class NaverCafeCrawler(BaseCrawler):
                 continue
         
         return results
-    
-    def _get_article_content(self, url: str) -> str:
-        try:
-            response = self.session.get(url)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            content_elem = soup.find('div', class_='se-main-container')
-            if content_elem:
-                return self.clean_text(content_elem.get_text())
-            
-            return ""
-        except:
-            return ""
 
 class DCInsideCrawler(BaseCrawler):
     """디시인사이드 갤러리 크롤링"""
+    BASE_URL = "https://gall.dcinside.com"
+    SOURCE = "dcinside"
+    RULES = SiteRules(rows='tr.ub-content', link='a', content=('div.writing_view_box',))
     
     def crawl_gallery(self, gallery_id: str, max_pages: int = 10) -> List[CrawlResult]:
+        return self.run(self.crawl_gallery_async, gallery_id, max_pages)
+    
+    async def crawl_gallery_async(self, fetcher: AsyncFetcher, gallery_id: str, max_pages: int = 10) -> List[CrawlResult]:
         results = []
         
         for page in range(1, max_pages + 1):
             try:
-                url = f"https://gall.dcinside.com/board/lists/?id={gallery_id}&page={page}"
+                url = self.url(f"/board/lists/?id={gallery_id}&page={page}")
                 
-                response = self.session.get(url)
-                soup = BeautifulSoup(response.content, 'html.parser')
+                links = await self.fetch_links(fetcher, url)
+                if links is None:
+                    continue
                 
-                posts = soup.find_all('tr', class_='ub-content')
+                page_results = await self.collect_page(fetcher, links, {"gallery_id": gallery_id})
+                if page_results is None:
+                    logger.info(f"디시인사이드 {gallery_id} {page}페이지: 새 글 없음, 목록 탐색 종료")
+                    break
+                results.extend(page_results)
                 
-                for post in posts:
-                    title_elem = post.find('a')
-                    if title_elem:
-                        post_url = "https://gall.dcinside.com" + title_elem.get('href')
-                        title = title_elem.text.strip()
-                        
-                        content = self._get_post_content(post_url)
-                        
-                        if content:
-                            results.append(CrawlResult(
-                                text=f"{title} {content}",
-                                source="dcinside",
-                                url=post_url,
-                                timestamp=datetime.now(),
-                                metadata={"gallery_id": gallery_id}
-                            ))
-                
-                self.random_delay()
                 logger.info(f"디시인사이드 {gallery_id} {page}페이지 크롤링 완료")
                 
             except Exception as e:
@@ -148,33 +218,24 @@ class DCInsideCrawler(BaseCrawler):
                 continue
         
         return results
-    
-    def _get_post_content(self, url: str) -> str:
-        try:
-            response = self.session.get(url)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            content_elem = soup.find('div', class_='writing_view_box')
-            if content_elem:
-                return self.clean_text(content_elem.get_text())
-            
-            return ""
-        except:
-            return ""
 
 class NewsCrawler(BaseCrawler):
     """뉴스 기사 및 댓글 크롤링"""
+    SOURCE = "news_comment"
     
     def crawl_news_comments(self, news_urls: List[str]) -> List[CrawlResult]:
+        return self.run(self.crawl_news_comments_async, news_urls)
+    
+    async def crawl_news_comments_async(self, fetcher: AsyncFetcher, news_urls: List[str]) -> List[CrawlResult]:
         results = []
         
         for url in news_urls:
             try:
                 # 네이버 뉴스 댓글 API 호출 (실제로는 더 복잡함)
-                comments = self._get_news_comments(url)
+                comments = await self._get_news_comments(fetcher, url)
                 
                 for comment in comments:
-                    results.append(CrawlResult(
+                    self.emit(results, CrawlResult(
                         text=comment['content'],
                         source="news_comment",
                         url=url,
@@ -182,7 +243,6 @@ class NewsCrawler(BaseCrawler):
                         metadata={"news_url": url}
                     ))
                 
-                self.random_delay()
                 logger.info(f"뉴스 댓글 크롤링 완료: {url}")
                 
             except Exception as e:
@@ -191,154 +251,214 @@ class NewsCrawler(BaseCrawler):
         
         return results
     
-    def _get_news_comments(self, url: str) -> List[Dict]:
+    async def _get_news_comments(self, fetcher: AsyncFetcher, url: str) -> List[Dict]:
         # 실제 구현에서는 네이버 뉴스 API나 Selenium을 사용
         return []
 
 class BlogCrawler(BaseCrawler):
     """블로그 포스트 크롤링"""
+    BASE_URL = "https://search.naver.com"
+    SOURCE = "blog"
+    # 블로그 플랫폼별로 다른 선택자 사용
+    RULES = SiteRules(
+        link='a.api_txt_lines',
+        content=(
+            'div.se-main-container',  # 네이버 블로그
+            'div.entry-content',      # 티스토리
+            'div.post-content',       # 일반적인 블로그
+            'div.content',
+            'article'
+        )
+    )
+    
+    def accept(self, content: str) -> bool:
+        return bool(content) and len(content) > 50  # 충분한 길이의 내용만
     
     def crawl_blog_posts(self, keywords: List[str], max_posts: int = 100) -> List[CrawlResult]:
-        results = []
-        
-        for keyword in keywords:
-            try:
-                # 네이버 블로그 검색 결과 크롤링
-                search_url = f"https://search.naver.com/search.naver?where=post&query={keyword}"
-                
-                response = self.session.get(search_url)
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                blog_links = soup.find_all('a', class_='api_txt_lines')[:max_posts//len(keywords)]
-                
-                for link in blog_links:
-                    blog_url = link.get('href')
-                    title = link.text.strip()
-                    
-                    content = self._get_blog_content(blog_url)
-                    
-                    if content and len(content) > 50:  # 충분한 길이의 내용만
-                        results.append(CrawlResult(
-                            text=f"{title} {content}",
-                            source="blog",
-                            url=blog_url,
-                            timestamp=datetime.now(),
-                            metadata={"keyword": keyword}
-                        ))
-                
-                self.random_delay()
-                logger.info(f"블로그 크롤링 완료: {keyword}")
-                
-            except Exception as e:
-                logger.error(f"블로그 크롤링 오류: {e}")
-                continue
-        
-        return results
+        return self.run(self.crawl_blog_posts_async, keywords, max_posts)
     
-    def _get_blog_content(self, url: str) -> str:
+    async def crawl_blog_posts_async(self, fetcher: AsyncFetcher, keywords: List[str],
+                                     max_posts: int = 100) -> List[CrawlResult]:
+        # 키워드별 검색은 서로 독립적이므로 동시에 진행
+        per_keyword = await asyncio.gather(*(
+            self._crawl_keyword(fetcher, keyword, max_posts // len(keywords)) for keyword in keywords
+        ))
+        return [result for results in per_keyword for result in results]
+    
+    async def _crawl_keyword(self, fetcher: AsyncFetcher, keyword: str, limit: int) -> List[CrawlResult]:
+        results = []
         try:
-            response = self.session.get(url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # 네이버 블로그 검색 결과 크롤링
+            links = await self.fetch_links(fetcher, self.url(f"/search.naver?where=post&query={quote(keyword)}"))
+            if links is None:
+                return results
+            links = links[:limit]
             
-            # 블로그 플랫폼별로 다른 선택자 사용
-            content_selectors = [
-                'div.se-main-container',  # 네이버 블로그
-                'div.entry-content',      # 티스토리
-                'div.post-content',       # 일반적인 블로그
-                'div.content',
-                'article'
-            ]
+            # 검색 결과는 한 페이지뿐이므로 이미 본 글만 건너뜀
+            results = await self.collect_page(fetcher, links, {"keyword": keyword}) or []
             
-            for selector in content_selectors:
-                content_elem = soup.select_one(selector)
-                if content_elem:
-                    return self.clean_text(content_elem.get_text())
+            logger.info(f"블로그 크롤링 완료: {keyword}")
             
-            return ""
-        except:
-            return ""
+        except Exception as e:
+            logger.error(f"블로그 크롤링 오류: {e}")
+        
+        return results
 
 class DataCollector:
-    """데이터 수집 관리자"""
+    """데이터 수집 관리자
+    
+    모든 소스를 하나의 AsyncFetcher로 동시에 크롤링 (호스트별 제한은 fetcher가 적용)
+    base_urls로 소스별 주소를 바꿀 수 있음 (예: {"dcinside": "http://127.0.0.1:8080"})
+    frontier가 있으면 증분 크롤링: 이전 실행의 대기 글부터 처리하고, 이미 본 글은 다시 받지 않으며,
+    아직 내보내지 않은 수집분(중단된 실행 포함)도 함께 내보냄
+    collect_all은 결과를 메모리에 모으지 않고 DatasetWriter로 파티션별 파일에 바로 저장
+    near_duplicate_threshold가 있으면 MinHash 추정 Jaccard 유사도가 그 이상인 글은 먼저 수집한 글만 남김
+    """
     
-    def __init__(self, output_dir: str = "data/raw"):
+    def __init__(self, output_dir: str = CRAWLED_DATASET, settings: Optional[CrawlSettings] = None,
+                 base_urls: Optional[Dict[str, str]] = None, frontier: Optional[CrawlFrontier] = None,
+                 output_format: str = "parquet", row_group_size: int = 1000,
+                 near_duplicate_threshold: Optional[float] = 0.8):
         self.output_dir = output_dir
+        self.settings = settings or CrawlSettings()
+        self.frontier = frontier
+        self.output_format = output_format
+        self.row_group_size = row_group_size
+        self.near_duplicate_threshold = near_duplicate_threshold
+        self.writer: Optional[DatasetWriter] = None
+        base_urls = base_urls or {}
+        # 모든 크롤러가 파서 프로세스 풀 하나를 공유
+        self.parser = HtmlParser(self.settings.parser, self.settings.parse_workers)
         self.crawlers = {
-            'naver_cafe': NaverCafeCrawler(),
-            'dcinside': DCInsideCrawler(),
-            'news': NewsCrawler(),
-            'blog': BlogCrawler()
+            'naver_cafe': NaverCafeCrawler(self.settings, base_urls.get('naver_cafe'), frontier, parser=self.parser),
+            'dcinside': DCInsideCrawler(self.settings, base_urls.get('dcinside'), frontier, parser=self.parser),
+            'news': NewsCrawler(self.settings, base_urls.get('news'), frontier, parser=self.parser),
+            'blog': BlogCrawler(self.settings, base_urls.get('blog'), frontier, parser=self.parser)
         }
     
-    def collect_all(self, config: Dict) -> pd.DataFrame:
-        """모든 소스에서 데이터 수집"""
-        all_results = []
-        
-        # 네이버 카페
-        if 'naver_cafe' in config:
-            for cafe_config in config['naver_cafe']:
-                results = self.crawlers['naver_cafe'].crawl_cafe_posts(
-                    cafe_config['cafe_id'],
-                    cafe_config['board_id'],
-                    cafe_config.get('max_pages', 10)
-                )
-                all_results.extend(results)
-        
-        # 디시인사이드
-        if 'dcinside' in config:
-            for gallery_id in config['dcinside']['galleries']:
-                results = self.crawlers['dcinside'].crawl_gallery(
-                    gallery_id,
-                    config['dcinside'].get('max_pages', 10)
-                )
-                all_results.extend(results)
-        
-        # 블로그
-        if 'blog' in config:
-            results = self.crawlers['blog'].crawl_blog_posts(
-                config['blog']['keywords'],
-                config['blog'].get('max_posts', 100)
-            )
-            all_results.extend(results)
-        
-        # DataFrame으로 변환
-        df = pd.DataFrame([
-            {
-                'text': result.text,
-                'source': result.source,
-                'url': result.url,
-                'timestamp': result.timestamp,
-                'metadata': json.dumps(result.metadata, ensure_ascii=False)
-            }
-            for result in all_results
-        ])
-        
-        # 중복 제거
-        df = df.drop_duplicates(subset=['text'])
-        
-        # 저장
-        output_file = f"{self.output_dir}/crawled_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        df.to_csv(output_file, index=False, encoding='utf-8-sig')
+    async def collect_all_async(self, config: Dict) -> List[CrawlResult]:
+        """설정된 모든 소스를 동시에 크롤링"""
+        async with AsyncFetcher(self.settings) as fetcher:
+            # 중단된 이전 실행에서 남은 글 먼저 처리
+            tasks = [crawler.resume(fetcher) for crawler in self.crawlers.values()]
+            
+            # 네이버 카페
+            if 'naver_cafe' in config:
+                for cafe_config in config['naver_cafe']:
+                    tasks.append(self.crawlers['naver_cafe'].crawl_cafe_posts_async(
+                        fetcher,
+                        cafe_config['cafe_id'],
+                        cafe_config['board_id'],
+                        cafe_config.get('max_pages', 10)
+                    ))
+            
+            # 디시인사이드
+            if 'dcinside' in config:
+                for gallery_id in config['dcinside']['galleries']:
+                    tasks.append(self.crawlers['dcinside'].crawl_gallery_async(
+                        fetcher,
+                        gallery_id,
+                        config['dcinside'].get('max_pages', 10)
+                    ))
+            
+            # 블로그
+            if 'blog' in config:
+                tasks.append(self.crawlers['blog'].crawl_blog_posts_async(
+                    fetcher,
+                    config['blog']['keywords'],
+                    config['blog'].get('max_posts', 100)
+                ))
+            
+            all_results = [result for results in await asyncio.gather(*tasks) for result in results]
+            logger.info(f"요청 통계: {fetcher.stats()}")
+            if self.frontier is not None:
+                logger.info(f"프런티어 상태: {self.frontier.stats()}")
+            return all_results
+    
+    def write(self, result: CrawlResult):
+        """크롤러 sink: 결과를 데이터셋에 추가"""
+        self.write_row({'text': result.text, 'source': result.source, 'url': result.url,
+                        'timestamp': result.timestamp, 'metadata': result.metadata})
+    
+    def write_row(self, row: Dict):
+        if not self.writer.write(row) and self.frontier is not None:
+            # 중복이라 저장하지 않은 글도 다음 실행에서 다시 내보내지 않도록 표시
+            self.frontier.mark_exported([row['url']])
+    
+    def collect_all(self, config: Dict) -> Dict:
+        """모든 소스에서 데이터 수집, 저장 통계 반환"""
+        on_flush = self.frontier.mark_exported if self.frontier is not None else None
+        near_duplicates = NearDuplicateIndex(self.near_duplicate_threshold) if self.near_duplicate_threshold else None
+        self.writer = DatasetWriter(self.output_dir, self.output_format, self.row_group_size, on_flush, near_duplicates)
+        for crawler in self.crawlers.values():
+            crawler.sink = self.write
         
-        logger.info(f"총 {len(df)}개 데이터 수집 완료: {output_file}")
+        try:
+            if self.frontier is not None:
+                # 이전에 내보내지 못한 수집분 (중단된 실행)
+                for row in self.frontier.unexported_results():
+                    self.write_row(row)
+            asyncio.run(self.collect_all_async(config))
+        finally:
+            # 중단되더라도 버퍼에 남은 결과는 저장
+            self.writer.close()
+            self.parser.close()
+            for crawler in self.crawlers.values():
+                crawler.sink = None
         
-        return df
+        stats = self.writer.stats()
+        logger.info(f"총 {stats['rows']}개 데이터 수집 완료 (중복 {stats['duplicates']}개, "
+                    f"유사 중복 {stats['near_duplicates']}개 제외): {stats['path']}")
+        return stats
 
-if __name__ == "__main__":
-    # 사용 예시
-    config = {
-        "naver_cafe": [
-            {"cafe_id": "29842958", "board_id": "1", "max_pages": 5}  # 예시 카페
-        ],
-        "dcinside": {
-            "galleries": ["humor", "hit"],
-            "max_pages": 5
-        },
-        "blog": {
-            "keywords": ["우울", "기쁨", "화남", "슬픔", "행복", "스트레스"],
-            "max_posts": 50
-        }
+# 설정 파일이 없을 때 사용하는 예시 설정
+EXAMPLE_CONFIG = {
+    "naver_cafe": [
+        {"cafe_id": "29842958", "board_id": "1", "max_pages": 5}  # 예시 카페
+    ],
+    "dcinside": {
+        "galleries": ["humor", "hit"],
+        "max_pages": 5
+    },
+    "blog": {
+        "keywords": ["우울", "기쁨", "화남", "슬픔", "행복", "스트레스"],
+        "max_posts": 50
     }
+}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="감정 분석 데이터 수집")
+    parser.add_argument("--config", help="크롤링 설정 파일 (config.yaml)")
+    parser.add_argument("--output-dir", help=f"데이터셋 디렉토리 (기본값: config의 output.path 또는 {CRAWLED_DATASET})")
+    parser.add_argument("--format", choices=["parquet", "jsonl"], help="저장 형식 (기본값: config의 output.format)")
+    parser.add_argument("--base-url", action="append", default=[], metavar="SOURCE=URL",
+                        help="소스별 주소 변경 (예: dcinside=http://127.0.0.1:8080), 여러 번 지정 가능")
+    parser.add_argument("--no-frontier", action="store_true", help="방문 기록 없이 처음부터 전체 크롤링")
+    args = parser.parse_args()
+    
+    if args.config:
+        import yaml
+        with open(args.config, encoding="utf-8") as f:
+            config = yaml.safe_load(f)
+    else:
+        config = EXAMPLE_CONFIG
+    
+    frontier = None
+    frontier_config = config.get("frontier", {}) or {}
+    if not args.no_frontier and frontier_config.get("enabled", True):
+        frontier = CrawlFrontier(
+            frontier_config.get("path", "data/crawl_frontier.db"),
+            stop_on_seen=frontier_config.get("stop_on_seen", True)
+        )
     
-    collector = DataCollector()
-    df = collector.collect_all(config)
\ No newline at end of file
+    base_urls = dict(item.split("=", 1) for item in args.base_url)
+    output_config = config.get("output", {}) or {}
+    filtering_config = config.get("filtering", {}) or {}
+    collector = DataCollector(
+        args.output_dir or output_config.get("path", CRAWLED_DATASET),
+        CrawlSettings.from_config(config), base_urls, frontier,
+        output_format=args.format or output_config.get("format", "parquet"),
+        row_group_size=output_config.get("row_group_size", 1000),
+        near_duplicate_threshold=filtering_config.get("near_duplicate_threshold", 0.8)
+    )
+    collector.collect_all(config)
@@ -0,0 +1,163 @@
+"""
+크롤링 결과 데이터셋 (스트리밍 저장과 지연 로딩)
+- DatasetWriter: 수집 결과를 도착하는 대로 날짜/소스별 파티션에 row group 단위로 저장
+  (data/raw/crawled/date=2025-10-15/source=dcinside/part-*.parquet)
+  파티션마다 row_group_size개까지만 메모리에 두므로 크롤링 규모와 무관하게 메모리 사용이 일정하고,
+  중단되어도 이미 저장한 row group은 남음
+- iter_batches / read_dataset: 데이터셋 디렉토리(Parquet, JSONL)나 이전 CSV 파일을
+  필요한 컬럼만 배치 단위로 읽음
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+CRAWLED_DATASET = "data/raw/crawled"
+FORMATS = ("parquet", "jsonl")
+COLUMNS = ["text", "source", "url", "timestamp", "metadata"]
+
+
+class DatasetWriter:
+    """파티션별 버퍼를 row group 크기마다 파일로 내보내는 스트리밍 저장소
+
+    parquet: flush마다 파일 하나 (임시 파일에 쓰고 이름 변경 → 읽는 쪽에 완성된 파일만 보임)
+    jsonl: 실행마다 파티션별 파일 하나에 줄 단위로 추가
+    on_flush(urls)는 파일에 기록된 행의 url로 호출됨 (프런티어 내보내기 표시용)
+    near_duplicates(dedup.NearDuplicateIndex)가 있으면 먼저 쓴 글과 유사한 글도 저장하지 않음
+    """
+
+    def __init__(self, root: str = CRAWLED_DATASET, format: str = "parquet", row_group_size: int = 1000,
+                 on_flush: Optional[Callable[[List[str]], None]] = None, near_duplicates=None):
+        if format not in FORMATS:
+            raise ValueError(f"지원하지 않는 형식: {format} ({', '.join(FORMATS)})")
+        self.root = Path(root)
+        self.format = format
+        self.row_group_size = max(row_group_size, 1)
+        self.on_flush = on_flush
+        self.near_duplicates = near_duplicates
+        self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        self._buffers: Dict[Tuple[str, str], List[Dict]] = {}
+        self._seen_texts = set()  # 실행 내 중복 제거용 본문 해시
+        self._files = 0
+        self.rows = 0
+        self.duplicates = 0
+        self.near_duplicate_count = 0
+
+    def __enter__(self) -> "DatasetWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, row: Dict) -> bool:
+        """행 추가 (text, source, url, timestamp, metadata), 이번 실행에서 이미 쓴 (또는 유사한) 본문이면 False"""
+        key = hashlib.blake2b(row["text"].encode("utf-8"), digest_size=8).digest()
+        if key in self._seen_texts:
+            self.duplicates += 1
+            return False
+        self._seen_texts.add(key)
+        if self.near_duplicates is not None and not self.near_duplicates.add(row["text"]):
+            self.near_duplicate_count += 1
+            return False
+
+        partition = (row["timestamp"].strftime("%Y-%m-%d"), row["source"])
+        buffer = self._buffers.setdefault(partition, [])
+        buffer.append(row)
+        if len(buffer) >= self.row_group_size:
+            self._flush(partition)
+        return True
+
+    def flush(self):
+        for partition in list(self._buffers):
+            self._flush(partition)
+
+    def close(self):
+        self.flush()
+
+    def _flush(self, partition: Tuple[str, str]):
+        rows = self._buffers.pop(partition, [])
+        if not rows:
+            return
+        date, source = partition
+        directory = self.root / f"date={date}" / f"source={source}"
+        directory.mkdir(parents=True, exist_ok=True)
+
+        records = [
+            dict(row, metadata=json.dumps(row.get("metadata") or {}, ensure_ascii=False))
+            for row in rows
+        ]
+        if self.format == "parquet":
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            path = directory / f"part-{self.run_id}-{self._files:05d}.parquet"
+            table = pa.Table.from_pylist([{column: record[column] for column in COLUMNS} for record in records])
+            tmp_path = path.with_suffix(".parquet.tmp")
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, path)
+        else:
+            path = directory / f"part-{self.run_id}.jsonl"
+            with open(path, "a", encoding="utf-8") as f:
+                for record in records:
+                    record = {column: record[column] for column in COLUMNS}
+                    record["timestamp"] = record["timestamp"].isoformat()
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+        self._files += 1
+        self.rows += len(rows)
+        if self.on_flush is not None:
+            self.on_flush([row["url"] for row in rows])
+
+    def stats(self) -> Dict:
+        return {"path": str(self.root), "rows": self.rows, "files": self._files, "duplicates": self.duplicates,
+                "near_duplicates": self.near_duplicate_count}
+
+
+def latest_crawled(raw_dir: str = "data/raw") -> str:
+    """기본 입력: 크롤링 데이터셋 디렉토리, 없으면 가장 최근의 이전 형식 CSV (crawled_data_*.csv)"""
+    if Path(CRAWLED_DATASET).is_dir():
+        return CRAWLED_DATASET
+    csv_files = sorted(Path(raw_dir).glob("crawled_data_*.csv"))
+    if not csv_files:
+        raise FileNotFoundError(f"크롤링 데이터가 없음: {CRAWLED_DATASET}, {raw_dir}/crawled_data_*.csv")
+    return str(csv_files[-1])
+
+
+def dataset_files(path: str) -> List[Path]:
+    """데이터셋 경로의 데이터 파일 목록 (디렉토리면 하위 파티션의 parquet/jsonl, 파일이면 그 파일)"""
+    path = Path(path)
+    if path.is_file():
+        return [path]
+    if not path.is_dir():
+        raise FileNotFoundError(f"데이터셋을 찾을 수 없음: {path}")
+    return sorted(file for pattern in ("*.parquet", "*.jsonl") for file in path.rglob(pattern))
+
+
+def iter_batches(path: str = CRAWLED_DATASET, columns: Optional[List[str]] = None,
+                 batch_size: int = 10000) -> Iterator[pd.DataFrame]:
+    """데이터셋을 batch_size 행씩 DataFrame으로 읽음 (columns만 로드)"""
+    for file in dataset_files(path):
+        if file.suffix == ".parquet":
+            import pyarrow.parquet as pq
+
+            for batch in pq.ParquetFile(file).iter_batches(batch_size=batch_size, columns=columns):
+                yield batch.to_pandas()
+        elif file.suffix == ".jsonl":
+            for chunk in pd.read_json(file, lines=True, chunksize=batch_size, dtype=False):
+                yield chunk[columns] if columns else chunk
+        else:
+            yield from pd.read_csv(file, usecols=columns, chunksize=batch_size)
+
+
+def read_dataset(path: str = CRAWLED_DATASET, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """데이터셋 전체를 DataFrame으로 읽음 (columns만 로드)"""
+    batches = list(iter_batches(path, columns))
+    if not batches:
+        return pd.DataFrame(columns=columns or COLUMNS)
+    return pd.concat(batches, ignore_index=True)
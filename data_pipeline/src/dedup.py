@@ -0,0 +1,136 @@
+"""
+MinHash/LSH 유사 중복 제거
+- 텍스트를 글자 n-gram 집합으로 보고 MinHash 서명으로 Jaccard 유사도를 근사
+- 서명을 band로 나눠 버킷에 넣고 같은 버킷에 걸린 글만 비교 (LSH)
+  → 전체 쌍 비교 없이 글 수에 거의 선형으로 처리
+- 퍼가기, 인용 답글, 앞뒤에 공통 문구가 붙은 블로그 글처럼 완전히 같지는 않은 중복을 제거
+- 크롤러(DatasetWriter)와 학습 전처리(DataPreprocessor)에서 함께 사용
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+_GOLDEN_MIX = np.uint64(0x9E3779B97F4A7C15)
+_NGRAM_BASE = np.uint64(0x100000001B3)
+_SHIFT = np.uint64(32)
+MIN_CANDIDATE_RECALL = 0.99
+
+
+def candidate_probability(similarity: float, bands: int, rows: int) -> float:
+    """Jaccard 유사도가 similarity인 두 글이 한 band 이상에서 같은 버킷에 들어갈 확률"""
+    return 1 - (1 - similarity ** rows) ** bands
+
+
+def optimal_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """(band 수, band당 행 수): threshold에서 후보 확률이 MIN_CANDIDATE_RECALL 이상인 조합 중 가장 엄격한 것
+
+    후보 확률 곡선의 변곡점 (1/b)^(1/r)은 threshold보다 충분히 아래에 오게 됨
+    (변곡점이 threshold 근처면 threshold에 걸친 쌍의 절반 가까이를 후보에서 놓침)
+    예: threshold 0.8, num_perm 128 → 32 × 4 (변곡점 0.42, 0.8에서 후보 확률 0.9999)
+    """
+    candidates = [(bands, num_perm // bands) for bands in range(1, num_perm + 1) if num_perm % bands == 0]
+    recalled = [br for br in candidates if candidate_probability(threshold, *br) >= MIN_CANDIDATE_RECALL]
+    # band당 행이 많을수록 유사하지 않은 후보가 적음
+    return max(recalled, key=lambda br: br[1]) if recalled else (num_perm, 1)
+
+
+class MinHasher:
+    """글자 n-gram MinHash 서명 생성기 (같은 seed면 항상 같은 서명)"""
+
+    def __init__(self, num_perm: int = 128, ngram: int = 4, seed: int = 1):
+        self.num_perm = num_perm
+        self.ngram = ngram
+        rng = np.random.default_rng(seed)
+        # multiply-shift 해시 (a는 홀수): h(x) = (a * x + b) >> 32, uint64 곱셈의 자연스러운 wrap-around 사용
+        self._a = rng.integers(0, np.iinfo(np.uint64).max, num_perm, dtype=np.uint64, endpoint=True) | np.uint64(1)
+        self._b = rng.integers(0, np.iinfo(np.uint64).max, num_perm, dtype=np.uint64, endpoint=True)
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return re.sub(r"\s+", " ", str(text)).strip().lower()
+
+    def shingles(self, text: str) -> np.ndarray:
+        """n-gram 해시 (32비트, 중복 제거), 문자 코드 배열에서 벡터 연산으로 계산"""
+        codes = np.frombuffer(self.normalize(text).encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+        if len(codes) == 0:
+            return codes
+        n = min(self.ngram, len(codes))
+        hashes = np.zeros(len(codes) - n + 1, dtype=np.uint64)
+        for offset in range(n):
+            hashes = hashes * _NGRAM_BASE + codes[offset:len(codes) - n + 1 + offset]
+        return np.unique((hashes * _GOLDEN_MIX) >> _SHIFT)
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """MinHash 서명 (num_perm개의 uint32), 빈 텍스트는 None"""
+        shingles = self.shingles(text)
+        if len(shingles) == 0:
+            return None
+        hashed = (self._a[:, None] * shingles[None, :] + self._b[:, None]) >> _SHIFT
+        return hashed.min(axis=1).astype(np.uint32)
+
+
+class NearDuplicateIndex:
+    """먼저 들어온 글을 남기는 유사 중복 판정 인덱스
+
+    사용법:
+        index = NearDuplicateIndex(threshold=0.8)
+        if index.add(text):   # 처음 보는 글이면 True, 기존 글과 유사하면 False
+            ...
+    버킷에는 그 band 값을 가진 글을 모두 보관하고, 후보는 서명 일치 비율(추정 Jaccard)로 다시 확인
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 128, ngram: int = 4, seed: int = 1):
+        if not 0 < threshold <= 1:
+            raise ValueError(f"threshold는 0보다 크고 1 이하여야 함: {threshold}")
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm, ngram, seed)
+        self.bands, self.rows = optimal_bands(threshold, num_perm)
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(self.bands)]
+        self._signatures: List[np.ndarray] = []
+        self.duplicates = 0
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def candidates(self, signature: np.ndarray) -> List[int]:
+        """서명과 한 band 이상 같은 기존 글 번호 (중복 없이, 추가 순서)"""
+        found = set()
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            found.update(bucket.get(key, ()))
+        return sorted(found)
+
+    def find(self, text: str, signature: Optional[np.ndarray] = None) -> Optional[int]:
+        """text와 유사한 기존 글 중 가장 먼저 추가된 글의 번호, 없으면 None"""
+        signature = self.hasher.signature(text) if signature is None else signature
+        if signature is None:
+            return None
+        for candidate in self.candidates(signature):
+            if np.mean(self._signatures[candidate] == signature) >= self.threshold:
+                return candidate
+        return None
+
+    def add(self, text: str, signature: Optional[np.ndarray] = None) -> bool:
+        """유사한 글이 없으면 인덱스에 추가하고 True, 있으면 False (빈 텍스트는 항상 True)"""
+        signature = self.hasher.signature(text) if signature is None else signature
+        if signature is None:
+            return True
+        if self.find(text, signature) is not None:
+            self.duplicates += 1
+            return False
+        doc_id = len(self._signatures)
+        self._signatures.append(signature)
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            bucket.setdefault(key, []).append(doc_id)
+        return True
+
+
+def near_duplicate_mask(texts: Iterable[str], threshold: float = 0.8, num_perm: int = 128,
+                        ngram: int = 4) -> List[bool]:
+    """남길 글이면 True인 목록 (앞의 글과 유사한 글은 False)"""
+    index = NearDuplicateIndex(threshold, num_perm, ngram)
+    return [index.add(text) for text in texts]
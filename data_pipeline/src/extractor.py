@@ -0,0 +1,214 @@
+"""
+HTML 추출 계층
+- 사이트별 추출 규칙(SiteRules)을 백엔드별로 한 번만 컴파일해 재사용 (프로세스마다 캐시)
+- 백엔드: selectolax (C, 기본값) → lxml (C) → BeautifulSoup html.parser (순수 Python, 설치된 것 중 앞 순서)
+- HtmlParser: 파싱과 clean_text를 프로세스 풀에서 실행해 이벤트 루프(수집)를 막지 않음
+  workers=0이면 호출한 곳에서 바로 실행
+"""
+
+import asyncio
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple
+
+BACKENDS = ("selectolax", "lxml", "html.parser")
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_SPACE_RE = re.compile(r'\s+')
+_SYMBOL_RE = re.compile(r'[^\w\s가-힣ㄱ-ㅎㅏ-ㅣ]')
+
+
+@dataclass(frozen=True)
+class SiteRules:
+    """사이트별 추출 규칙 (CSS 선택자)
+
+    rows가 있으면 각 행에서 link와 처음 일치하는 요소를, 없으면 link와 일치하는 모든 요소를 글 링크로 사용
+    content는 우선순위 순서이며 처음 일치하는 선택자의 요소가 본문
+    """
+    link: str = ""
+    rows: str = ""
+    content: Tuple[str, ...] = ()
+
+
+def clean_text(text: str) -> str:
+    """텍스트 정제"""
+    if not text:
+        return ""
+
+    # HTML 태그 제거
+    text = _TAG_RE.sub('', text)
+    # 특수문자 정규화
+    text = _SPACE_RE.sub(' ', text)
+    # 이모지 제거 (선택적)
+    text = _SYMBOL_RE.sub(' ', text)
+
+    return text.strip()
+
+
+class SelectolaxExtractor:
+    name = "selectolax"
+
+    def __init__(self, rules: SiteRules):
+        from selectolax.parser import HTMLParser
+
+        self._parse = HTMLParser
+        self.rules = rules
+
+    def links(self, html: bytes) -> List[Tuple[str, str]]:
+        tree = self._parse(html)
+        if self.rules.rows:
+            nodes = [row.css_first(self.rules.link) for row in tree.css(self.rules.rows)]
+        else:
+            nodes = tree.css(self.rules.link)
+        return [
+            (node.attributes["href"], node.text(deep=True).strip())
+            for node in nodes if node is not None and node.attributes.get("href")
+        ]
+
+    def content(self, html: bytes) -> Optional[str]:
+        tree = self._parse(html)
+        for selector in self.rules.content:
+            node = tree.css_first(selector)
+            if node is not None:
+                return node.text(deep=True)
+        return None
+
+
+class LxmlExtractor:
+    name = "lxml"
+
+    def __init__(self, rules: SiteRules):
+        import lxml.html
+        from lxml.cssselect import CSSSelector
+
+        self._fromstring = lxml.html.fromstring
+        self.rules = rules
+        # CSS → XPath 변환은 여기서 한 번만
+        self._rows = CSSSelector(rules.rows) if rules.rows else None
+        self._link = CSSSelector(rules.link) if rules.link else None
+        self._content = [CSSSelector(selector) for selector in rules.content]
+
+    def _parse(self, html: bytes):
+        # charset 선언이 없으면 lxml은 bytes를 latin-1로 읽으므로 UTF-8을 먼저 시도
+        # (UTF-8이 아니면 bytes 그대로 넘겨 meta charset(EUC-KR 등)을 따르게 함)
+        try:
+            html = html.decode("utf-8")
+        except UnicodeDecodeError:
+            pass
+        return self._fromstring(html)
+
+    def links(self, html: bytes) -> List[Tuple[str, str]]:
+        root = self._parse(html)
+        if self._rows is not None:
+            nodes = [next(iter(self._link(row)), None) for row in self._rows(root)]
+        else:
+            nodes = self._link(root)
+        return [
+            (node.get("href"), node.text_content().strip())
+            for node in nodes if node is not None and node.get("href")
+        ]
+
+    def content(self, html: bytes) -> Optional[str]:
+        root = self._parse(html)
+        for selector in self._content:
+            matches = selector(root)
+            if matches:
+                return matches[0].text_content()
+        return None
+
+
+class SoupExtractor:
+    name = "html.parser"
+
+    def __init__(self, rules: SiteRules):
+        from bs4 import BeautifulSoup
+
+        self._soup = BeautifulSoup
+        self.rules = rules
+
+    def links(self, html: bytes) -> List[Tuple[str, str]]:
+        soup = self._soup(html, 'html.parser')
+        if self.rules.rows:
+            nodes = [row.select_one(self.rules.link) for row in soup.select(self.rules.rows)]
+        else:
+            nodes = soup.select(self.rules.link)
+        return [(node.get('href'), node.get_text().strip()) for node in nodes if node is not None and node.get('href')]
+
+    def content(self, html: bytes) -> Optional[str]:
+        soup = self._soup(html, 'html.parser')
+        for selector in self.rules.content:
+            node = soup.select_one(selector)
+            if node is not None:
+                return node.get_text()
+        return None
+
+
+EXTRACTORS = {"selectolax": SelectolaxExtractor, "lxml": LxmlExtractor, "html.parser": SoupExtractor}
+
+
+@lru_cache(maxsize=None)
+def resolve_backend(backend: str = "auto") -> str:
+    """auto면 설치된 백엔드 중 가장 빠른 것"""
+    if backend != "auto":
+        if backend not in EXTRACTORS:
+            raise ValueError(f"지원하지 않는 파서: {backend} ({', '.join(BACKENDS)})")
+        return backend
+    for name in BACKENDS:
+        try:
+            EXTRACTORS[name](SiteRules())
+            return name
+        except ImportError:
+            continue
+    raise ImportError("사용 가능한 HTML 파서가 없음")
+
+
+@lru_cache(maxsize=None)
+def get_extractor(backend: str, rules: SiteRules):
+    """(백엔드, 규칙)별로 컴파일된 추출기 (프로세스마다 한 번 생성)"""
+    return EXTRACTORS[resolve_backend(backend)](rules)
+
+
+def extract_links(backend: str, rules: SiteRules, html: bytes) -> List[Tuple[str, str]]:
+    """목록 페이지의 (href, 제목) 목록"""
+    return get_extractor(backend, rules).links(html)
+
+
+def extract_content(backend: str, rules: SiteRules, html: bytes) -> str:
+    """글 본문의 정제된 텍스트 (일치하는 선택자가 없으면 빈 문자열)"""
+    return clean_text(get_extractor(backend, rules).content(html) or "")
+
+
+class HtmlParser:
+    """추출 함수를 프로세스 풀(또는 현재 프로세스)에서 실행하는 비동기 래퍼
+
+    사용법:
+        parser = HtmlParser("auto", workers=2)
+        links = await parser.links(rules, body)
+        text = await parser.content(rules, body)
+        parser.close()
+    """
+
+    def __init__(self, backend: str = "auto", workers: int = 0):
+        self.backend = resolve_backend(backend)
+        self.workers = workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    async def _run(self, func: Callable, *args):
+        if self.workers <= 0:
+            return func(*args)
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return await asyncio.get_running_loop().run_in_executor(self._pool, func, *args)
+
+    async def links(self, rules: SiteRules, html: bytes) -> List[Tuple[str, str]]:
+        return await self._run(extract_links, self.backend, rules, html)
+
+    async def content(self, rules: SiteRules, html: bytes) -> str:
+        return await self._run(extract_content, self.backend, rules, html)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
@@ -0,0 +1,161 @@
+"""
+비동기 HTTP 수집 엔진
+- aiohttp 세션 하나로 여러 호스트의 페이지를 동시에 가져옴
+- 호스트별 동시 요청 수 제한(semaphore)과 토큰 버킷 속도 제한으로 사이트 부담 조절
+  (기존 요청마다 time.sleep 하던 delay_range를 대체)
+- config.yaml의 crawling.max_retries / timeout에 따라 재시도와 타임아웃 적용
+  (연결 오류, 타임아웃, 429/5xx는 지수 백오프 후 재시도, 429의 Retry-After 준수)
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+from loguru import logger
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+@dataclass
+class CrawlSettings:
+    max_retries: int = 3
+    timeout: float = 30.0
+    per_host_concurrency: int = 2     # 호스트별 동시 요청 수
+    requests_per_second: float = 0.5  # 호스트별 평균 요청 속도 (이전 delay_range [1, 3]과 같은 평균 2초 간격)
+    burst: int = 1                    # 토큰 버킷 크기 (순간 허용 요청 수)
+    backoff: float = 1.0              # 재시도 대기 기본값 (초), 시도마다 2배
+    parser: str = "auto"              # HTML 파서 (auto, selectolax, lxml, html.parser)
+    parse_workers: int = 0            # 파싱 프로세스 수 (0이면 이벤트 루프에서 직접 파싱)
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "CrawlSettings":
+        """config.yaml의 crawling 섹션으로 설정 생성"""
+        crawling = (config or {}).get('crawling', {}) or {}
+        settings = cls(
+            max_retries=int(crawling.get('max_retries', cls.max_retries)),
+            timeout=float(crawling.get('timeout', cls.timeout)),
+            per_host_concurrency=int(crawling.get('per_host_concurrency', cls.per_host_concurrency)),
+            burst=int(crawling.get('burst', cls.burst)),
+            backoff=float(crawling.get('backoff', cls.backoff)),
+            parser=str(crawling.get('parser', cls.parser)),
+            parse_workers=int(crawling.get('parse_workers', cls.parse_workers)),
+        )
+        if 'requests_per_second' in crawling:
+            settings.requests_per_second = float(crawling['requests_per_second'])
+        elif 'delay_range' in crawling:
+            # 이전 설정 호환: 평균 지연의 역수를 요청 속도로 사용
+            low, high = crawling['delay_range']
+            settings.requests_per_second = 2.0 / (low + high)
+        return settings
+
+
+class TokenBucket:
+    """비동기 토큰 버킷 (rate개/초로 채워지고 최대 capacity개 보관)"""
+
+    def __init__(self, rate: float, capacity: int = 1, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self._clock = clock
+        self._tokens = float(self.capacity)
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        """토큰 하나를 얻을 때까지 대기 (대기 순서대로 처리)"""
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class AsyncFetcher:
+    """호스트별 동시성/속도 제한과 재시도를 적용하는 HTTP 클라이언트
+
+    사용법:
+        async with AsyncFetcher(settings) as fetcher:
+            body = await fetcher.get(url)
+    """
+
+    def __init__(self, settings: Optional[CrawlSettings] = None, headers: Optional[Dict[str, str]] = None):
+        self.settings = settings or CrawlSettings()
+        self.headers = headers or DEFAULT_HEADERS
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._hosts: Dict[str, Tuple[asyncio.Semaphore, TokenBucket]] = {}
+
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+
+    async def __aenter__(self) -> "AsyncFetcher":
+        self.session = aiohttp.ClientSession(
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=self.settings.timeout)
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.session.close()
+        self.session = None
+
+    def _host_limits(self, host: str) -> Tuple[asyncio.Semaphore, TokenBucket]:
+        if host not in self._hosts:
+            self._hosts[host] = (
+                asyncio.Semaphore(self.settings.per_host_concurrency),
+                TokenBucket(self.settings.requests_per_second, self.settings.burst)
+            )
+        return self._hosts[host]
+
+    async def get(self, url: str) -> Optional[bytes]:
+        """응답 본문 반환, 재시도 후에도 실패하거나 4xx(429 제외)면 None"""
+        semaphore, bucket = self._host_limits(urlsplit(url).netloc)
+
+        for attempt in range(self.settings.max_retries + 1):
+            retry_after = None
+            try:
+                async with semaphore:
+                    await bucket.acquire()
+                    self.requests += 1
+                    async with self.session.get(url) as response:
+                        if response.status in RETRY_STATUSES:
+                            retry_after = response.headers.get('Retry-After')
+                            error = f"HTTP {response.status}"
+                        elif response.status >= 400:
+                            logger.warning(f"요청 실패 ({response.status}): {url}")
+                            self.failures += 1
+                            return None
+                        else:
+                            return await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = repr(e)
+
+            if attempt == self.settings.max_retries:
+                break
+            self.retries += 1
+            delay = self.settings.backoff * (2 ** attempt)
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            logger.debug(f"재시도 {attempt + 1}/{self.settings.max_retries} ({error}, {delay:.1f}s 후): {url}")
+            # 대기 중에는 호스트 동시성 자리를 차지하지 않음
+            await asyncio.sleep(delay)
+
+        logger.warning(f"요청 실패 ({error}): {url}")
+        self.failures += 1
+        return None
+
+    def stats(self) -> Dict[str, int]:
+        return {"requests": self.requests, "retries": self.retries, "failures": self.failures}
@@ -0,0 +1,143 @@
+"""
+증분 크롤링용 URL 프런티어 (SQLite)
+- seen_urls: 처리한 글 URL의 64비트 해시만 저장하는 압축된 방문 집합
+- pending: 목록에서 발견했지만 아직 본문을 가져오지 않은 글 (크래시 후 재개용 체크포인트)
+  canonical URL 해시로 키를 잡아 목록 위치에 따라 URL이 달라도 한 번만 대기
+- results: 수집한 글, 데이터셋으로 내보내기 전까지만 보관 (중단되어도 수집분이 남고, 내보내면 삭제)
+- 목록 페이지의 글이 모두 이미 본 글이면 그 게시판의 이후 페이지는 크롤링하지 않음 (최신순 목록 가정)
+"""
+
+import hashlib
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 같은 글이 목록 위치에 따라 다른 URL로 보이지 않도록 제거하는 쿼리 파라미터
+VOLATILE_PARAMS = {"page", "search.page", "exception_mode", "list_num", "sort_type"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen_urls (
+    url_hash INTEGER PRIMARY KEY,
+    seen_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pending (
+    url_hash INTEGER PRIMARY KEY,
+    url TEXT NOT NULL,
+    source TEXT NOT NULL,
+    title TEXT,
+    metadata TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    added_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    url TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    text TEXT NOT NULL,
+    metadata TEXT,
+    collected_at TEXT NOT NULL
+);
+"""
+
+
+def canonical_url(url: str) -> str:
+    """방문 판정용 URL (fragment와 페이지 위치 파라미터 제거, 쿼리 정렬)"""
+    parts = urlsplit(url)
+    query = sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if key not in VOLATILE_PARAMS)
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, urlencode(query), ""))
+
+
+def url_hash(url: str) -> int:
+    """canonical URL의 64비트 해시 (SQLite INTEGER에 맞게 부호 있는 정수)"""
+    digest = hashlib.blake2b(canonical_url(url).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+class CrawlFrontier:
+    """디스크 기반 크롤링 대기열과 방문 집합"""
+
+    def __init__(self, path: str = "data/crawl_frontier.db", stop_on_seen: bool = True, max_attempts: int = 3):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.stop_on_seen = stop_on_seen
+        self.max_attempts = max_attempts
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def is_seen(self, url: str) -> bool:
+        return self.conn.execute("SELECT 1 FROM seen_urls WHERE url_hash = ?", (url_hash(url),)).fetchone() is not None
+
+    def enqueue(self, source: str, links: Iterable[Tuple[str, str]], metadata: Dict) -> List[Tuple[str, str]]:
+        """처음 보는 (url, 제목)만 pending에 추가하고 반환 (이미 본 글/대기 중인 글 제외)"""
+        now = datetime.now().isoformat()
+        added = []
+        with self.conn:
+            for url, title in links:
+                if self.is_seen(url):
+                    continue
+                cursor = self.conn.execute(
+                    "INSERT OR IGNORE INTO pending (url_hash, url, source, title, metadata, added_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (url_hash(url), url, source, title, json.dumps(metadata, ensure_ascii=False), now)
+                )
+                if cursor.rowcount:
+                    added.append((url, title))
+        return added
+
+    def pending(self, source: str) -> List[Tuple[str, str, Dict]]:
+        """이전 실행에서 남은 대기 글 (url, 제목, 메타데이터)"""
+        rows = self.conn.execute(
+            "SELECT url, title, metadata FROM pending WHERE source = ? ORDER BY added_at", (source,)
+        ).fetchall()
+        return [(url, title, json.loads(metadata or "{}")) for url, title, metadata in rows]
+
+    def complete(self, url: str, source: str, text: Optional[str] = None, metadata: Optional[Dict] = None):
+        """글 처리 완료: 방문 집합에 추가하고 대기열에서 제거 (text가 있으면 결과 저장)"""
+        now = datetime.now().isoformat()
+        with self.conn:
+            self.conn.execute("INSERT OR IGNORE INTO seen_urls (url_hash, seen_at) VALUES (?, ?)", (url_hash(url), now))
+            self.conn.execute("DELETE FROM pending WHERE url_hash = ?", (url_hash(url),))
+            if text:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO results (url, source, text, metadata, collected_at) VALUES (?, ?, ?, ?, ?)",
+                    (url, source, text, json.dumps(metadata or {}, ensure_ascii=False), now)
+                )
+
+    def retry_later(self, url: str, source: str):
+        """본문을 가져오지 못한 글은 다음 실행에서 재시도 (max_attempts 초과 시 포기)"""
+        key = url_hash(url)
+        with self.conn:
+            self.conn.execute("UPDATE pending SET attempts = attempts + 1 WHERE url_hash = ?", (key,))
+            attempts = self.conn.execute("SELECT attempts FROM pending WHERE url_hash = ?", (key,)).fetchone()
+        if attempts and attempts[0] >= self.max_attempts:
+            self.complete(url, source)
+
+    def unexported_results(self) -> List[Dict]:
+        rows = self.conn.execute(
+            "SELECT url, source, text, metadata, collected_at FROM results ORDER BY collected_at"
+        ).fetchall()
+        return [
+            {"url": url, "source": source, "text": text, "metadata": json.loads(metadata or "{}"),
+             "timestamp": datetime.fromisoformat(collected_at)}
+            for url, source, text, metadata, collected_at in rows
+        ]
+
+    def mark_exported(self, urls: Iterable[str]):
+        """데이터셋에 기록한 (또는 중복이라 버린) 결과 삭제"""
+        with self.conn:
+            self.conn.executemany("DELETE FROM results WHERE url = ?", ((url,) for url in urls))
+
+    def stats(self) -> Dict[str, int]:
+        count = lambda sql: self.conn.execute(sql).fetchone()[0]
+        return {
+            "seen": count("SELECT COUNT(*) FROM seen_urls"),
+            "pending": count("SELECT COUNT(*) FROM pending"),
+            "unexported": count("SELECT COUNT(*) FROM results"),
+        }
@@ -18,6 +18,9 @@ import torch
 import re
 from loguru import logger
 
+from dataset import iter_batches, latest_crawled
+from lexicon import KeywordLexicon
+
 class EmotionLabeler:
     """감정 라벨링 클래스"""
     
@@ -41,8 +44,11 @@ class EmotionLabeler:
         "중립": ["그냥", "평범", "보통", "일반", "무난", "평소", "항상", "매일"]
     }
     
+    EMOTION_IDS = {emotion: emotion_id for emotion_id, emotion in EMOTIONS.items()}
+    
     def __init__(self):
         self.db_path = "data/labels.db"
+        self.lexicon = KeywordLexicon(self.EMOTION_KEYWORDS)
         self.init_database()
     
     def init_database(self):
@@ -74,16 +80,11 @@ class EmotionLabeler:
         
         for text in texts:
             emotion_scores = {}
-            text_lower = text.lower()
+            keyword_counts = self.lexicon.count(text.lower())
             
-            for emotion, keywords in self.EMOTION_KEYWORDS.items():
-                score = 0
-                for keyword in keywords:
-                    score += text_lower.count(keyword)
-                
-                if emotion in self.EMOTIONS.values():
-                    emotion_id = list(self.EMOTIONS.keys())[list(self.EMOTIONS.values()).index(emotion)]
-                    emotion_scores[emotion_id] = score
+            for emotion, score in keyword_counts.items():
+                if emotion in self.EMOTION_IDS:
+                    emotion_scores[self.EMOTION_IDS[emotion]] = score
             
             if not emotion_scores or max(emotion_scores.values()) == 0:
                 # 모든 점수가 0이면 중립
@@ -151,6 +152,19 @@ class EmotionLabeler:
         conn.commit()
         conn.close()
 
+    def import_dataset(self, path: str, batch_size: int = 5000) -> int:
+        """크롤링 데이터셋을 배치 단위로 읽어 자동 라벨링 후 저장 (전체를 메모리에 올리지 않음)"""
+        total = 0
+        for batch in iter_batches(path, columns=['text', 'source'], batch_size=batch_size):
+            batch = batch.dropna(subset=['text'])
+            labels = self.auto_label_batch(batch['text'].tolist())
+            self.save_labels([
+                {'text': text, 'source': source, 'auto_label': label, 'auto_confidence': confidence}
+                for text, source, (label, confidence) in zip(batch['text'], batch['source'], labels)
+            ])
+            total += len(batch)
+        return total
+
 def create_labeling_interface():
     """Streamlit 라벨링 인터페이스"""
     st.set_page_config(page_title="감정 라벨링 도구", layout="wide")
@@ -264,6 +278,17 @@ def create_labeling_interface():
     with tab3:
         st.header("데이터 관리")
         
+        # 크롤링 데이터셋 불러오기
+        try:
+            default_path = latest_crawled()
+        except FileNotFoundError:
+            default_path = ""
+        dataset_path = st.text_input("크롤링 데이터셋 경로 (디렉토리 또는 CSV)", value=default_path)
+        if dataset_path and st.button("데이터셋 자동 라벨링 후 가져오기"):
+            with st.spinner("자동 라벨링 중..."):
+                count = labeler.import_dataset(dataset_path)
+            st.success(f"{count}개 데이터에 자동 라벨링 완료!")
+        
         # 파일 업로드
         uploaded_file = st.file_uploader("CSV 파일 업로드", type=['csv'])
         
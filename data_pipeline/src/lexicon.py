@@ -0,0 +1,93 @@
+"""
+감정 키워드 사전 매처 (라벨링 도구/자동 라벨링 스크립트 공용)
+- backend_python/app/services/lexicon.py와 같은 구현
+- 감정별 키워드 목록을 한 번 컴파일해 텍스트를 한 번만 훑어 감정별 출현 횟수 계산
+- 결과는 감정마다 sum(text.count(keyword) for keyword in keywords)와 동일
+- pyahocorasick(C 확장)이 있으면 Aho-Corasick 오토마톤, 없으면 순수 파이썬 스캔 사용
+"""
+
+import re
+from collections import defaultdict
+from typing import Dict, List
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - 선택적 의존성
+    ahocorasick = None
+
+
+def _has_border(keyword: str) -> bool:
+    """키워드가 자기 자신과 겹쳐 나타날 수 있는지 (예: "ㅋㅋ" in "ㅋㅋㅋ")"""
+    return any(keyword[:i] == keyword[-i:] for i in range(1, len(keyword)))
+
+
+class KeywordLexicon:
+    """감정별 키워드 사전을 단일 패스 멀티 패턴 매처로 컴파일"""
+
+    def __init__(self, emotion_keywords: Dict[str, List[str]], use_native: bool = True):
+        self.emotions = list(emotion_keywords)
+
+        # 키워드 -> 기여하는 감정 목록 (같은 키워드가 여러 번 나오면 그만큼 중복)
+        contributions = defaultdict(list)
+        for emotion, keywords in emotion_keywords.items():
+            for keyword in keywords:
+                if keyword:
+                    contributions[keyword].append(emotion)
+        self._contributions = {keyword: tuple(emotions) for keyword, emotions in contributions.items()}
+
+        # str.count는 겹치지 않는 출현만 세므로 자기 중첩 가능한 키워드는 따로 처리
+        self._overlapping = {keyword for keyword in self._contributions if _has_border(keyword)}
+
+        self._automaton = None
+        if use_native and ahocorasick is not None and self._contributions:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self._contributions:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+        else:
+            # 키워드 첫 글자로 후보 위치만 찾고 해당 위치에서 startswith 확인
+            self._by_first_char = defaultdict(list)
+            for keyword in self._contributions:
+                self._by_first_char[keyword[0]].append(keyword)
+            first_chars = "".join(re.escape(char) for char in self._by_first_char)
+            self._candidates = re.compile(f"[{first_chars}]") if first_chars else None
+
+    @property
+    def native(self) -> bool:
+        return self._automaton is not None
+
+    def _matches(self, text: str):
+        """(시작 위치, 키워드)를 모든 출현(중첩 포함)에 대해 생성"""
+        if self._automaton is not None:
+            for end, keyword in self._automaton.iter(text):
+                yield end - len(keyword) + 1, keyword
+            return
+
+        if self._candidates is None:
+            return
+        startswith = text.startswith
+        for match in self._candidates.finditer(text):
+            start = match.start()
+            for keyword in self._by_first_char[match.group()]:
+                if startswith(keyword, start):
+                    yield start, keyword
+
+    def count(self, text: str) -> Dict[str, int]:
+        """감정별 키워드 출현 횟수 (사전의 감정 순서 유지)"""
+        scores = dict.fromkeys(self.emotions, 0)
+        if not text:
+            return scores
+
+        contributions = self._contributions
+        overlapping = self._overlapping
+        last_end = {}
+
+        for start, keyword in self._matches(text):
+            if keyword in overlapping:
+                if start < last_end.get(keyword, 0):
+                    continue
+                last_end[keyword] = start + len(keyword)
+            for emotion in contributions[keyword]:
+                scores[emotion] += 1
+
+        return scores
@@ -19,12 +19,14 @@ import sqlite3
 from pathlib import Path
 import json
 import re
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from loguru import logger
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime
 
+from dedup import near_duplicate_mask
+
 class EmotionDataset(Dataset):
     """감정 분석용 데이터셋"""
     
@@ -57,9 +59,13 @@ class EmotionDataset(Dataset):
         }
 
 class DataPreprocessor:
-    """데이터 전처리 클래스"""
+    """데이터 전처리 클래스
+    
+    near_duplicate_threshold: 이 값 이상으로 유사한 글(MinHash 추정 Jaccard)은 처음 나온 글만 남김 (None이면 끔)
+    """
     
-    def __init__(self):
+    def __init__(self, near_duplicate_threshold: Optional[float] = 0.8):
+        self.near_duplicate_threshold = near_duplicate_threshold
         self.emotion_mapping = {
             0: "중립", 1: "기쁨", 2: "슬픔", 3: "분노", 
             4: "두려움", 5: "놀라움", 6: "혐오"
@@ -129,10 +135,24 @@ class DataPreprocessor:
         # 중복 제거 (텍스트 기준)
         df = df.drop_duplicates(subset=['cleaned_text']).copy()
         
+        # 유사 중복 제거 (퍼온 글, 인용 답글 등)
+        df = self.remove_near_duplicates(df, 'cleaned_text')
+        
         logger.info(f"전처리 완료: {len(df)}개 데이터")
         
         return df
     
+    def remove_near_duplicates(self, df: pd.DataFrame, column: str = 'text') -> pd.DataFrame:
+        """column 기준 유사 중복 제거 (MinHash/LSH)"""
+        if not self.near_duplicate_threshold or df.empty:
+            return df
+        
+        keep = near_duplicate_mask(df[column].fillna(''), self.near_duplicate_threshold)
+        removed = len(df) - sum(keep)
+        if removed:
+            logger.info(f"유사 중복 {removed}개 제거 (기준 {self.near_duplicate_threshold})")
+        return df[keep].copy()
+    
     def analyze_dataset(self, df: pd.DataFrame) -> Dict:
         """데이터셋 분석"""
         analysis = {
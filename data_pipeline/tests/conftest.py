@@ -0,0 +1,5 @@
+import os
+import sys
+
+# src 모듈은 서로를 스크립트 방식으로 import하므로 (from fetcher import ...) src를 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
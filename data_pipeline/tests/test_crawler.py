@@ -0,0 +1,93 @@
+import asyncio
+import threading
+from pathlib import Path
+
+from aiohttp import web
+
+from crawler import DataCollector
+from dataset import read_dataset
+from fetcher import CrawlSettings
+from frontier import CrawlFrontier
+
+FIXTURES = Path(__file__).parent / "fixtures" / "html"
+SECOND_POST = '<html><body><div class="writing_view_box"><p>시험이 끝나서 친구들과 놀러 갔다</p></div></body></html>'
+
+
+class FixtureSite:
+    """디시인사이드 목록/본문 fixture를 제공하는 로컬 사이트 (crawler의 asyncio.run과 별도 스레드에서 실행)"""
+
+    def __init__(self):
+        self.requests = []
+        self.second_post_available = False
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    async def list_page(self, request):
+        self.requests.append(request.path_qs)
+        return web.Response(body=(FIXTURES / "dcinside_list_euckr.html").read_bytes(),
+                            content_type="text/html", charset="euc-kr")
+
+    async def article(self, request):
+        self.requests.append(request.path_qs)
+        if request.query["no"] == "1":
+            return web.Response(body=(FIXTURES / "dcinside_article_euckr.html").read_bytes(),
+                                content_type="text/html", charset="euc-kr")
+        if not self.second_post_available:
+            return web.Response(status=503)
+        return web.Response(text=SECOND_POST, content_type="text/html")
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_get("/board/lists/", self.list_page)
+        app.router.add_get("/board/view/", self.article)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = site._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self._thread.start()
+        self.url = asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+        return self
+
+    def __exit__(self, *exc_info):
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+
+def collect(site, frontier, output_dir):
+    settings = CrawlSettings(max_retries=0, timeout=5, per_host_concurrency=4, requests_per_second=0)
+    collector = DataCollector(str(output_dir), settings, {"dcinside": site.url}, frontier, output_format="jsonl")
+    return collector.collect_all({"dcinside": {"galleries": ["humor"], "max_pages": 3}})
+
+
+def test_incremental_crawl_against_fixture_site(tmp_path):
+    frontier = CrawlFrontier(str(tmp_path / "frontier.db"))
+    with FixtureSite() as site:
+        stats = collect(site, frontier, tmp_path / "first")
+
+        # 첫 글은 저장되고, 받지 못한 둘째 글은 다음 실행으로 미뤄짐
+        assert stats["rows"] == 1
+        dataset = read_dataset(str(tmp_path / "first"))
+        assert dataset["text"].tolist() == ["퇴근길에 비 맞았다 오늘 면접 봤는데 너무 떨렸다   결과가 좋았으면 좋겠다"]
+        assert dataset["url"].tolist() == [f"{site.url}/board/view/?id=humor&no=1&page=1"]
+        assert frontier.stats() == {"seen": 1, "pending": 1, "unexported": 0}
+        # 2페이지에는 새 글이 없으므로 3페이지는 요청하지 않음
+        assert [path for path in site.requests if path.startswith("/board/lists/")] == [
+            "/board/lists/?id=humor&page=1", "/board/lists/?id=humor&page=2"
+        ]
+
+        site.requests.clear()
+        site.second_post_available = True
+        stats = collect(site, frontier, tmp_path / "second")
+
+    # 재시작하면 대기 글부터 처리하고 이미 본 목록에서 바로 멈춤
+    assert stats["rows"] == 1
+    assert read_dataset(str(tmp_path / "second"))["text"].tolist() == ["시험 끝나서 너무 신난다 시험이 끝나서 친구들과 놀러 갔다"]
+    assert site.requests.count("/board/view/?id=humor&no=1&page=1") == 0
+    assert [path for path in site.requests if path.startswith("/board/lists/")] == ["/board/lists/?id=humor&page=1"]
+    assert frontier.stats() == {"seen": 2, "pending": 0, "unexported": 0}
+    frontier.close()
@@ -0,0 +1,102 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from dataset import DatasetWriter, iter_batches, read_dataset
+from dedup import NearDuplicateIndex
+
+
+def row(n, source="dcinside", day=15, text=None):
+    return {
+        "text": text or f"오늘 있었던 일 {n}번째 이야기",
+        "source": source,
+        "url": f"https://example.com/{source}/{n}",
+        "timestamp": datetime(2025, 10, day, 12, 0, n % 60),
+        "metadata": {"n": n},
+    }
+
+
+def files(root, pattern):
+    return sorted(path.relative_to(root).as_posix() for path in root.rglob(pattern))
+
+
+def test_flushes_each_full_row_group(tmp_path):
+    flushed = []
+    writer = DatasetWriter(str(tmp_path), row_group_size=2, on_flush=flushed.append)
+
+    writer.write(row(1))
+    assert files(tmp_path, "*.parquet") == []
+    writer.write(row(2))
+    assert len(files(tmp_path, "*.parquet")) == 1
+    assert flushed == [["https://example.com/dcinside/1", "https://example.com/dcinside/2"]]
+
+    writer.write(row(3))
+    writer.close()
+    assert len(files(tmp_path, "*.parquet")) == 2
+    assert flushed[-1] == ["https://example.com/dcinside/3"]
+    assert files(tmp_path, "*.tmp") == []
+    assert writer.stats()["rows"] == 3
+
+
+def test_partitions_by_date_and_source(tmp_path):
+    with DatasetWriter(str(tmp_path), row_group_size=10) as writer:
+        writer.write(row(1, "dcinside", day=15))
+        writer.write(row(2, "blog", day=15))
+        writer.write(row(3, "blog", day=16))
+
+    directories = sorted({path.rsplit("/", 1)[0] for path in files(tmp_path, "*.parquet")})
+    assert directories == ["date=2025-10-15/source=blog", "date=2025-10-15/source=dcinside",
+                           "date=2025-10-16/source=blog"]
+
+
+def test_skips_exact_and_near_duplicates(tmp_path):
+    text = "회사에서 하루 종일 회의만 하다가 끝나서 너무 지치고 힘든 하루였다 내일은 좀 나아지길"
+    writer = DatasetWriter(str(tmp_path), near_duplicates=NearDuplicateIndex(threshold=0.8))
+
+    assert writer.write(row(1, text=text)) is True
+    assert writer.write(row(2, text=text)) is False
+    assert writer.write(row(3, text=text + "!")) is False
+    assert writer.write(row(4, text="주말에 가족이랑 바다에 다녀와서 정말 행복했다")) is True
+    writer.close()
+
+    assert writer.stats() == {"path": str(tmp_path), "rows": 2, "files": 1, "duplicates": 1, "near_duplicates": 1}
+
+
+def test_rejects_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        DatasetWriter(str(tmp_path), format="csv")
+
+
+@pytest.mark.parametrize("format", ["parquet", "jsonl"])
+def test_iter_batches_reads_written_dataset(tmp_path, format):
+    with DatasetWriter(str(tmp_path), format=format, row_group_size=3) as writer:
+        for n in range(7):
+            writer.write(row(n))
+
+    batches = list(iter_batches(str(tmp_path), columns=["text", "url"], batch_size=2))
+
+    assert all(list(batch.columns) == ["text", "url"] for batch in batches)
+    assert max(len(batch) for batch in batches) <= 3
+    frame = pd.concat(batches, ignore_index=True)
+    assert sorted(frame["url"]) == sorted(f"https://example.com/dcinside/{n}" for n in range(7))
+
+    full = read_dataset(str(tmp_path))
+    assert len(full) == 7
+    assert set(full.columns) == {"text", "source", "url", "timestamp", "metadata"}
+
+
+def test_iter_batches_reads_legacy_csv(tmp_path):
+    path = tmp_path / "crawled_data_20250101_000000.csv"
+    pd.DataFrame([{k: v for k, v in row(n).items() if k != "metadata"} for n in range(5)]).to_csv(path, index=False)
+
+    batches = list(iter_batches(str(path), columns=["text", "source"], batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert list(batches[0].columns) == ["text", "source"]
+
+
+def test_read_dataset_of_empty_directory(tmp_path):
+    frame = read_dataset(str(tmp_path), columns=["text"])
+    assert frame.empty
+    assert list(frame.columns) == ["text"]
@@ -0,0 +1,117 @@
+import random
+
+import numpy as np
+import pytest
+
+from dedup import MinHasher, NearDuplicateIndex, candidate_probability, near_duplicate_mask, optimal_bands
+
+SYLLABLES = [chr(0xAC00 + i) for i in range(0, 11172, 7)]
+
+
+def random_text(rng, length=300):
+    return "".join(rng.choice(SYLLABLES) for _ in range(length))
+
+
+def mutate(rng, text, changes):
+    chars = list(text)
+    for position in rng.sample(range(len(chars)), changes):
+        chars[position] = rng.choice(SYLLABLES)
+    return "".join(chars)
+
+
+def jaccard(hasher, a, b):
+    sa, sb = set(hasher.shingles(a).tolist()), set(hasher.shingles(b).tolist())
+    return len(sa & sb) / len(sa | sb)
+
+
+def pairs_near(similarity, count, tolerance=0.02, seed=0):
+    """실제 Jaccard가 similarity ± tolerance인 (원문, 변형) 쌍"""
+    rng = random.Random(seed)
+    hasher = MinHasher()
+    pairs = []
+    while len(pairs) < count:
+        base = random_text(rng)
+        for changes in range(1, 80):
+            variant = mutate(rng, base, changes)
+            value = jaccard(hasher, base, variant)
+            if abs(value - similarity) <= tolerance:
+                pairs.append((base, variant))
+                break
+            if value < similarity - tolerance:
+                break
+    return pairs
+
+
+def test_optimal_bands_put_the_knee_below_threshold():
+    for threshold in (0.5, 0.7, 0.8, 0.9):
+        bands, rows = optimal_bands(threshold, 128)
+        assert bands * rows == 128
+        assert (1 / bands) ** (1 / rows) < threshold
+        assert candidate_probability(threshold, bands, rows) >= 0.99
+    assert optimal_bands(0.8, 128) == (32, 4)
+
+
+def test_signatures_are_stable_for_a_seed():
+    text = "오늘은  회사에서\n정말 힘든 하루였다 Hello"
+
+    signature = MinHasher(seed=1).signature(text)
+    assert signature.dtype == np.uint32
+    assert np.array_equal(signature, MinHasher(seed=1).signature(text))
+    # Whitespace and case are normalized before shingling
+    assert np.array_equal(signature, MinHasher(seed=1).signature("오늘은 회사에서 정말 힘든 하루였다 hello "))
+    assert not np.array_equal(signature, MinHasher(seed=2).signature(text))
+    assert MinHasher().signature("   ") is None
+
+
+def test_signature_agreement_estimates_jaccard():
+    hasher = MinHasher(num_perm=256)
+    for base, variant in pairs_near(0.6, 5, seed=1):
+        estimate = np.mean(hasher.signature(base) == hasher.signature(variant))
+        assert estimate == pytest.approx(jaccard(hasher, base, variant), abs=0.1)
+
+
+def test_pairs_at_threshold_become_candidates():
+    found = 0
+    for base, variant in pairs_near(0.8, 100, seed=2):
+        index = NearDuplicateIndex(threshold=0.8)
+        index.add(base)
+        found += index.candidates(index.hasher.signature(variant)) == [0]
+    assert found >= 97
+
+
+def test_near_duplicates_above_threshold_are_dropped():
+    texts = [text for pair in pairs_near(0.9, 50, seed=3) for text in pair]
+    assert near_duplicate_mask(texts, threshold=0.8) == [True, False] * 50
+
+
+def test_texts_below_threshold_are_never_dropped():
+    rng = random.Random(4)
+    unrelated = [random_text(rng) for _ in range(200)]
+    related = [text for pair in pairs_near(0.6, 50, seed=5) for text in pair]
+
+    assert all(near_duplicate_mask(unrelated + related, threshold=0.8))
+
+
+def test_buckets_keep_every_member():
+    index = NearDuplicateIndex(threshold=0.8, num_perm=128)
+    assert (index.bands, index.rows) == (32, 4)
+    a = np.arange(128, dtype=np.uint32)
+    # b shares the first 20 bands with a (62.5% agreement: kept)
+    b = a.copy()
+    b[80:] += 1000
+    # c agrees with b on 116 of 128 rows but matches a whole band of b only where b equals a
+    c = b.copy()
+    c[80::4] += 5000
+
+    assert index.add("a", a)
+    assert index.add("b", b)
+    assert index.candidates(c) == [0, 1]
+    assert index.find("c", c) == 1
+    assert not index.add("c", c)
+    assert len(index) == 2 and index.duplicates == 1
+
+
+def test_empty_texts_are_always_kept():
+    assert near_duplicate_mask(["", "  ", "같은 글입니다 같은 글입니다", "같은 글입니다 같은 글입니다"]) == [
+        True, True, True, False
+    ]
@@ -0,0 +1,90 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from crawler import BlogCrawler, DCInsideCrawler, NaverCafeCrawler
+from extractor import BACKENDS, HtmlParser, clean_text, extract_content, extract_links
+
+FIXTURES = Path(__file__).parent / "fixtures" / "html"
+RULES = {
+    "naver_cafe": NaverCafeCrawler.RULES,
+    "dcinside": DCInsideCrawler.RULES,
+    "blog": BlogCrawler.RULES,
+}
+
+# 파일 이름: {소스}_{list|article}[_설명].html
+EXPECTED = {
+    "naver_cafe_list.html": [
+        ("/ArticleRead.nhn?clubid=29842958&articleid=101&page=1", "오늘 정말 행복한 하루"),
+        ("/ArticleRead.nhn?clubid=29842958&articleid=102&page=1", "회사 때문에 스트레스\xa0받아요"),
+    ],
+    "naver_cafe_article.html": "오늘은 기쁜 날이었다  친구들과 맛있는 저녁을 먹었다   이야기했다 내일도 좋겠지    최고",
+    "dcinside_list_euckr.html": [
+        ("/board/view/?id=humor&no=1&page=1", "퇴근길에 비 맞았다"),
+        ("/board/view/?id=humor&no=2&page=1", "시험 끝나서 너무 신난다"),
+    ],
+    "dcinside_article_euckr.html": "오늘 면접 봤는데 너무 떨렸다   결과가 좋았으면 좋겠다",
+    "blog_list.html": [
+        ("https://blog.naver.com/user1/223", "우울한 하루 기록"),
+        ("https://user2.tistory.com/45", "여행에서 만난 행복"),
+    ],
+    "blog_article_fallback.html": "가족 여행가족과 함께 바다에 다녀왔다 정말 즐거웠다",
+    "blog_article_undeclared_utf8.html": "인코딩 선언이 없는 티스토리 글이다 한글이 깨지면 안 된다   정말로",
+}
+
+
+def extract(backend, name):
+    source = next(source for source in RULES if name.startswith(source + "_"))
+    body = (FIXTURES / name).read_bytes()
+    if "_list" in name:
+        return extract_links(backend, RULES[source], body)
+    return extract_content(backend, RULES[source], body)
+
+
+def test_every_fixture_has_expected_output():
+    assert sorted(path.name for path in FIXTURES.glob("*.html")) == sorted(EXPECTED)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("name", sorted(EXPECTED))
+def test_backends_extract_the_same_output(backend, name):
+    assert extract(backend, name) == EXPECTED[name]
+
+
+def test_fixtures_cover_non_utf8_and_undeclared_encodings():
+    euc_kr = (FIXTURES / "dcinside_article_euckr.html").read_bytes()
+    with pytest.raises(UnicodeDecodeError):
+        euc_kr.decode("utf-8")
+    undeclared = (FIXTURES / "blog_article_undeclared_utf8.html").read_bytes()
+    assert b"charset" not in undeclared.lower()
+
+
+def test_missing_content_is_empty():
+    body = b"<html><body><div class='other'>no match</div></body></html>"
+    for backend in BACKENDS:
+        assert extract_content(backend, RULES["dcinside"], body) == ""
+        assert extract_links(backend, RULES["dcinside"], body) == []
+
+
+def test_clean_text():
+    assert clean_text("<b>기쁜</b>\n\n하루!! 😀") == "기쁜 하루"
+    assert clean_text("") == ""
+
+
+def test_parser_pool_matches_inline_parsing():
+    body = (FIXTURES / "dcinside_article_euckr.html").read_bytes()
+
+    async def parse():
+        parser = HtmlParser("auto", workers=1)
+        try:
+            return await asyncio.gather(
+                parser.content(RULES["dcinside"], body),
+                parser.links(RULES["dcinside"], (FIXTURES / "dcinside_list_euckr.html").read_bytes()),
+            )
+        finally:
+            parser.close()
+
+    content, links = asyncio.run(parse())
+    assert content == EXPECTED["dcinside_article_euckr.html"]
+    assert links == EXPECTED["dcinside_list_euckr.html"]
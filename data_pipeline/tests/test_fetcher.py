@@ -0,0 +1,169 @@
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import fetcher
+from fetcher import AsyncFetcher, CrawlSettings, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def fixture_app():
+    """재시도, Retry-After, 동시 요청 수를 확인하는 로컬 사이트"""
+    state = {"flaky": 0, "limited": 0, "in_flight": 0, "max_in_flight": 0}
+
+    async def flaky(request):
+        state["flaky"] += 1
+        if state["flaky"] <= 2:
+            return web.Response(status=503)
+        return web.Response(body="ok".encode())
+
+    async def limited(request):
+        state["limited"] += 1
+        if state["limited"] == 1:
+            return web.Response(status=429, headers={"Retry-After": "1"})
+        return web.Response(body="limited ok".encode())
+
+    async def missing(request):
+        return web.Response(status=404)
+
+    async def slow(request):
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(0.05)
+        state["in_flight"] -= 1
+        return web.Response(body=request.path.encode())
+
+    app = web.Application()
+    app.router.add_get("/flaky", flaky)
+    app.router.add_get("/limited", limited)
+    app.router.add_get("/missing", missing)
+    app.router.add_get("/slow/{n}", slow)
+    return app, state
+
+
+def run_with_server(scenario, settings):
+    async def main():
+        app, state = fixture_app()
+        async with TestServer(app) as server:
+            async with AsyncFetcher(settings) as client:
+                result = await scenario(client, lambda path: str(server.make_url(path)))
+        return result, state, client.stats()
+
+    return asyncio.run(main())
+
+
+def fast_settings(**overrides):
+    values = dict(max_retries=3, timeout=5, per_host_concurrency=4, requests_per_second=0, backoff=0.01)
+    values.update(overrides)
+    return CrawlSettings(**values)
+
+
+def test_retries_server_errors_with_backoff():
+    async def scenario(client, url):
+        return await client.get(url("/flaky"))
+
+    body, state, stats = run_with_server(scenario, fast_settings())
+
+    assert body == b"ok"
+    assert state["flaky"] == 3
+    assert stats == {"requests": 3, "retries": 2, "failures": 0}
+
+
+def test_gives_up_after_max_retries():
+    async def scenario(client, url):
+        return await client.get(url("/flaky"))
+
+    body, state, stats = run_with_server(scenario, fast_settings(max_retries=1))
+
+    assert body is None
+    assert stats == {"requests": 2, "retries": 1, "failures": 1}
+
+
+def test_honors_retry_after():
+    async def scenario(client, url):
+        start = time.monotonic()
+        body = await client.get(url("/limited"))
+        return body, time.monotonic() - start
+
+    (body, elapsed), _, stats = run_with_server(scenario, fast_settings())
+
+    assert body == b"limited ok"
+    assert elapsed >= 1.0
+    assert stats["retries"] == 1
+
+
+def test_client_errors_are_not_retried():
+    async def scenario(client, url):
+        return await client.get(url("/missing"))
+
+    body, _, stats = run_with_server(scenario, fast_settings())
+
+    assert body is None
+    assert stats == {"requests": 1, "retries": 0, "failures": 1}
+
+
+def test_per_host_concurrency_cap():
+    async def scenario(client, url):
+        return await asyncio.gather(*(client.get(url(f"/slow/{n}")) for n in range(8)))
+
+    bodies, state, _ = run_with_server(scenario, fast_settings(per_host_concurrency=2))
+
+    assert bodies == [f"/slow/{n}".encode() for n in range(8)]
+    assert state["max_in_flight"] == 2
+
+
+def test_token_bucket_allows_burst_then_paces(monkeypatch):
+    clock = FakeClock()
+    sleeps = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(delay):
+        # 실제로 기다리지 않고 가짜 시계만 진행
+        sleeps.append(delay)
+        clock.now += delay
+        await real_sleep(0)
+
+    monkeypatch.setattr(fetcher.asyncio, "sleep", fake_sleep)
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+
+    async def take(n):
+        for _ in range(n):
+            await bucket.acquire()
+
+    asyncio.run(take(2))
+    assert sleeps == []
+
+    asyncio.run(take(3))
+    assert sleeps == pytest.approx([0.5, 0.5, 0.5])
+    assert clock.now == pytest.approx(1.5)
+
+
+def test_token_bucket_refills_up_to_capacity():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1, capacity=3, clock=clock)
+
+    asyncio.run(bucket.acquire())
+    clock.now = 100.0
+    bucket._refill()
+
+    assert bucket._tokens == 3
+
+
+def test_settings_from_legacy_delay_range():
+    settings = CrawlSettings.from_config({"crawling": {"delay_range": [1, 3]}})
+    assert settings.requests_per_second == pytest.approx(0.5)
+
+    settings = CrawlSettings.from_config({"crawling": {"requests_per_second": 3, "burst": 2}})
+    assert (settings.requests_per_second, settings.burst) == (3, 2)
+
+    assert CrawlSettings.from_config({}).requests_per_second == pytest.approx(0.5)
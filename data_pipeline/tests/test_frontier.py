@@ -0,0 +1,58 @@
+
+from frontier import CrawlFrontier, canonical_url, url_hash
+
+LIST_URL = "https://gall.dcinside.com/board/view/?id=humor&no=1&page=2"
+SAME_POST = "https://GALL.dcinside.com/board/view/?page=5&no=1&id=humor#comments"
+OTHER_POST = "https://gall.dcinside.com/board/view/?id=humor&no=2&page=2"
+
+
+def test_canonical_url_drops_position_parameters():
+    assert canonical_url(LIST_URL) == canonical_url(SAME_POST) == "https://gall.dcinside.com/board/view/?id=humor&no=1"
+    assert url_hash(LIST_URL) == url_hash(SAME_POST) != url_hash(OTHER_POST)
+
+
+def test_pending_is_keyed_by_canonical_url(tmp_path):
+    frontier = CrawlFrontier(str(tmp_path / "frontier.db"))
+
+    added = frontier.enqueue("dcinside", [(LIST_URL, "첫 글"), (OTHER_POST, "둘째 글")], {"gallery": "humor"})
+    assert added == [(LIST_URL, "첫 글"), (OTHER_POST, "둘째 글")]
+    # The same post found on another list page is already pending
+    assert frontier.enqueue("dcinside", [(SAME_POST, "첫 글")], {"gallery": "humor"}) == []
+    assert [url for url, _, _ in frontier.pending("dcinside")] == [LIST_URL, OTHER_POST]
+
+    # Completing any form of the URL clears the pending row and marks the post seen
+    frontier.complete(SAME_POST, "dcinside", "본문", {"gallery": "humor"})
+    assert [url for url, _, _ in frontier.pending("dcinside")] == [OTHER_POST]
+    assert frontier.is_seen(LIST_URL)
+    assert frontier.enqueue("dcinside", [(LIST_URL, "첫 글")], {}) == []
+    frontier.close()
+
+
+def test_retry_later_gives_up_after_max_attempts(tmp_path):
+    frontier = CrawlFrontier(str(tmp_path / "frontier.db"), max_attempts=2)
+    frontier.enqueue("dcinside", [(LIST_URL, "첫 글")], {})
+
+    frontier.retry_later(SAME_POST, "dcinside")
+    assert len(frontier.pending("dcinside")) == 1
+    frontier.retry_later(LIST_URL, "dcinside")
+    assert frontier.pending("dcinside") == []
+    assert frontier.is_seen(LIST_URL)
+    frontier.close()
+
+
+def test_exported_results_are_deleted(tmp_path):
+    frontier = CrawlFrontier(str(tmp_path / "frontier.db"))
+    frontier.complete(LIST_URL, "dcinside", "첫 본문", {"gallery": "humor"})
+    frontier.complete(OTHER_POST, "dcinside", "둘째 본문")
+
+    rows = frontier.unexported_results()
+    assert [(row["url"], row["text"], row["metadata"]) for row in rows] == [
+        (LIST_URL, "첫 본문", {"gallery": "humor"}), (OTHER_POST, "둘째 본문", {})
+    ]
+
+    frontier.mark_exported([LIST_URL])
+    assert [row["url"] for row in frontier.unexported_results()] == [OTHER_POST]
+    assert frontier.conn.execute("SELECT COUNT(*) FROM results").fetchone()[0] == 1
+    assert frontier.stats() == {"seen": 2, "pending": 0, "unexported": 1}
+    frontier.close()
+
@@ -2,20 +2,34 @@
 KoBERT 모델 학습 스크립트
 """
 
-from src.model_training import KoBERTTrainer, DataPreprocessor
+import argparse
 import pandas as pd
 import os
+import sys
 from pathlib import Path
 
+# src 모듈은 서로를 이름으로 import하므로 (from dedup import ...) src를 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
+from dataset import read_dataset  # noqa: E402
+from model_training import KoBERTTrainer, DataPreprocessor  # noqa: E402
+
 def main():
-    # 라벨링된 데이터 로드
-    df = pd.read_csv('data/labeled/auto_labeled_data.csv')
+    parser = argparse.ArgumentParser(description="KoBERT 감정 분류 모델 학습")
+    parser.add_argument("--input", default="data/labeled/auto_labeled_data.csv",
+                        help="라벨링된 데이터 (CSV 파일, Parquet/JSONL 데이터셋 디렉토리)")
+    args = parser.parse_args()
+    
+    # 라벨링된 데이터 로드 (학습에 쓰는 컬럼만)
+    df = read_dataset(args.input, columns=['text', 'emotion'])
     print(f'학습 데이터: {len(df)}개')
     print(f'감정 분포:')
     print(df['emotion'].value_counts())
     
-    # 데이터 전처리
+    # 데이터 전처리 (유사 중복 제거)
     preprocessor = DataPreprocessor()
+    df = preprocessor.remove_near_duplicates(df, 'text')
+    print(f'유사 중복 제거 후: {len(df)}개')
     
     # 감정 라벨을 숫자로 변환
     emotion_to_label = {
@@ -7,8 +7,8 @@ CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 -- Create indexes for better performance
 -- These will be created automatically by SQLAlchemy, but we can add additional ones here
 
--- Example: Add an index on entry content for text search
--- CREATE INDEX IF NOT EXISTS idx_entries_content_search ON entries USING gin(to_tsvector('english', content));
+-- Full-text search over entries uses the GIN index ix_entry_search_documents_tsv
+-- on entry_search_documents, created by the application (see app/search.py)
 
 -- Example: Add an index on emotions for faster emotion queries
 -- CREATE INDEX IF NOT EXISTS idx_emotions_type_confidence ON emotions(emotion_type, confidence_score);